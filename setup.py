@@ -18,6 +18,8 @@ setup(
         "python-dotenv>=1.0.0",
         "pydantic>=2.0.0",
         "requests>=2.25.0",
+        "jiter>=0.4.0",
+        "orjson>=3.9.0",
     ],
     entry_points={
         'console_scripts': [
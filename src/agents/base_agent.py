@@ -3,19 +3,89 @@ Base agent class for launch document review agents.
 Provides LLM-powered evaluation with structured prompts and scoring.
 """
 
+import asyncio
 import json
+import re
 import logging
+import statistics
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Pattern, Tuple, Union
+from dataclasses import dataclass, asdict
 
-from ..requirements_manager import AgentRequirement, RequirementCategory
-from ..utils.llm_client import LLMClient
+from ..requirements_models import AgentRequirement, RequirementCategory
+from ..utils.llm_client import LLMClient, dumps_json
+from ..utils.document_sections import DocumentContext
 
 
-@dataclass
+SCORING_GUIDELINES = """SCORING GUIDELINES:
+- 9-10: Exceptional - All criteria excellently addressed with comprehensive detail
+- 7-8: Good - Most criteria well addressed with good detail  
+- 5-6: Adequate - Some criteria addressed but lacks depth or completeness
+- 3-4: Weak - Few criteria addressed, significant gaps
+- 0-2: Poor - Major deficiencies, criteria largely unaddressed"""
+
+
+# Static prompt endings, following the document content
+CATEGORY_PROMPT_TAIL = """Provide your evaluation in the following JSON format:
+{
+    "score": <number between 0-10>,
+    "reasoning": "<detailed explanation of your scoring rationale>",
+    "strengths": ["<strength 1>", "<strength 2>", ...],
+    "weaknesses": ["<weakness 1>", "<weakness 2>", ...],
+    "missing_elements": ["<missing element 1>", "<missing element 2>", ...]
+}
+
+""" + SCORING_GUIDELINES + """
+
+Focus specifically on the criteria listed above. Be thorough but concise in your reasoning."""
+
+BATCH_PROMPT_TAIL = """Please evaluate how well the document above meets the requirements for each category above, independently of the others.
+
+Provide your evaluation in the following JSON format, with one entry per category keyed by its exact category name:
+{
+    "evaluations": {
+        "<category name>": {
+            "score": <number between 0-10>,
+            "reasoning": "<detailed explanation of your scoring rationale>",
+            "strengths": ["<strength 1>", "<strength 2>", ...],
+            "weaknesses": ["<weakness 1>", "<weakness 2>", ...],
+            "missing_elements": ["<missing element 1>", "<missing element 2>", ...]
+        },
+        ...
+    }
+}
+
+""" + SCORING_GUIDELINES + """
+
+Focus specifically on the criteria listed for each category. Be thorough but concise in your reasoning."""
+
+
+# Reasoning prefix of evaluations that could not be completed
+EVALUATION_FAILED_PREFIX = "Evaluation failed due to error: "
+
+
+@lru_cache(maxsize=None)
+def compile_routes(routes: Tuple[Tuple[Tuple[str, ...], str], ...]) -> Tuple[Tuple[Pattern, str], ...]:
+    """Compile each recommendation route's keywords into a single case-insensitive pattern."""
+    return tuple(
+        (re.compile("|".join(re.escape(keyword) for keyword in keywords), re.IGNORECASE), recommendation)
+        for keywords, recommendation in routes
+    )
+
+
+# Evaluations and reviews are allocated in bulk and never modified after creation.
+# __slots__ is declared by hand because dataclass(slots=True) needs Python 3.10, and so is
+# the pickle/copy state it would generate: the default restores slots through the frozen
+# __setattr__ and fails.
+@dataclass(frozen=True)
 class CategoryEvaluation:
     """Evaluation result for a single requirement category."""
+    __slots__ = (
+        "category", "score", "weight", "weighted_score",
+        "reasoning", "strengths", "weaknesses", "missing_elements"
+    )
+    
     category: str
     score: float
     weight: float
@@ -24,11 +94,28 @@ class CategoryEvaluation:
     strengths: List[str]
     weaknesses: List[str]
     missing_elements: List[str]
+    
+    @property
+    def failed(self) -> bool:
+        """Whether this is a fallback for a category that could not be evaluated."""
+        return self.reasoning.startswith(EVALUATION_FAILED_PREFIX)
+    
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state: Tuple[Any, ...]):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
 
-@dataclass
+@dataclass(frozen=True)
 class AgentReview:
     """Complete review result from an agent."""
+    __slots__ = (
+        "agent_name", "agent_type", "overall_score", "category_evaluations",
+        "summary", "key_issues", "recommendations", "confidence_level"
+    )
+    
     agent_name: str
     agent_type: str
     overall_score: float
@@ -37,11 +124,62 @@ class AgentReview:
     key_issues: List[str]
     recommendations: List[str]
     confidence_level: str
+    
+    def to_json(self) -> bytes:
+        """Serialize the review, including its category evaluations, to JSON bytes."""
+        return dumps_json(asdict(self))
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AgentReview":
+        """Rebuild a review from the output of asdict() or parsed to_json()."""
+        return cls(**{
+            **data,
+            "category_evaluations": [CategoryEvaluation(**e) for e in data["category_evaluations"]]
+        })
+    
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state: Tuple[Any, ...]):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
 
 class BaseAgent(ABC):
     """Base class for all launch document review agents."""
     
+    # Agents with up to this many categories evaluate them in batched LLM calls, as few as
+    # MAX_BATCH_EVALUATION_TOKENS allows
+    BATCH_CATEGORY_LIMIT = 6
+    
+    # Longer documents are trimmed to the sections most relevant to the evaluated categories
+    MAX_DOCUMENT_CHARS = 24000
+    
+    # Completion token budgets, scaled by how much output is expected
+    EVALUATION_BASE_TOKENS = 300
+    EVALUATION_TOKENS_PER_CRITERION = 120
+    MAX_EVALUATION_TOKENS = 2000
+    # Combined budget of a batched evaluation; the default models return at most 4096 tokens
+    MAX_BATCH_EVALUATION_TOKENS = 4096
+    RECOMMENDATION_BASE_TOKENS = 150
+    RECOMMENDATION_TOKENS_PER_AREA = 100
+    MAX_RECOMMENDATION_TOKENS = 1000
+    
+    # Ask the LLM for recommendations instead of using the rule-based ones (costs an extra call)
+    use_llm_recommendations = False
+    
+    # Trim oversized documents once per agent, against all of its categories, instead of per category.
+    # Every evaluation of the agent then sends the same document prefix, which the provider can cache.
+    share_document_selection = False
+    
+    # Returned when no category scores below the weak threshold
+    STRONG_DOCUMENT_RECOMMENDATIONS = [
+        "Document meets most requirements well. Consider minor refinements based on specific feedback."
+    ]
+    
+    # (category keywords, recommendation) pairs used by _route_recommendations
+    RECOMMENDATION_ROUTES: Tuple[Tuple[Tuple[str, ...], str], ...] = ()
+    
     def __init__(self, requirements: AgentRequirement, llm_client: LLMClient):
         self.requirements = requirements
         self.llm_client = llm_client
@@ -50,31 +188,55 @@ class BaseAgent(ABC):
         self.agent_name = requirements.name
         self.agent_type = requirements.type
         self.requirement_categories = requirements.requirements
+        
+        # Category weights are fixed per agent, so the score normalization is computed once
+        total_weight = sum(cat.weight for cat in self.requirement_categories)
+        self._weight_scale = 10.0 / total_weight if total_weight > 0 else 0.0
+        
+        # Static prompt boilerplate is built once; only the per-category parts vary
+        self._prompt_header = f"You are evaluating a launch document against specific {self.agent_type} requirements.\n\n"
+        
+        # The system message is static per agent, so it is resolved once and reused by every call
+        self.system_message = self._get_system_message()
+        
+        # Recommendation routes are compiled once per class, and the agent's categories are
+        # resolved up front into a lookup table so routing a weak category is a single dict hit
+        self._routes = compile_routes(self.RECOMMENDATION_ROUTES)
+        self._category_recommendations: Dict[str, Optional[str]] = {
+            category.category: self._match_route(category.category)
+            for category in self.requirement_categories
+        }
     
-    async def review_document(self, document_content: str) -> AgentReview:
+    async def review_document(self, document: Union[str, DocumentContext]) -> AgentReview:
         """
         Main method to review a document against agent requirements.
         
         Args:
-            document_content: The full text content of the launch document
+            document: The launch document, either as its full text or as a DocumentContext
+                shared with other agents
             
         Returns:
             AgentReview: Complete evaluation results
         """
         self.logger.info(f"Starting document review with {self.agent_name}")
         
-        # Evaluate each category
-        category_evaluations = []
-        total_weighted_score = 0.0
+        if isinstance(document, str):
+            document = DocumentContext.from_text(document)
         
-        for category in self.requirement_categories:
-            evaluation = await self._evaluate_category(category, document_content)
-            category_evaluations.append(evaluation)
-            total_weighted_score += evaluation.weighted_score
+        category_evaluations = await self._evaluate_categories(document)
+        return await self.finalize_review(category_evaluations, document)
+    
+    async def finalize_review(
+        self,
+        category_evaluations: List[CategoryEvaluation],
+        document: DocumentContext
+    ) -> AgentReview:
+        """Score and summarize completed category evaluations into an AgentReview."""
+        document_content = document.full_text
+        total_weighted_score = sum(e.weighted_score for e in category_evaluations)
         
         # Calculate overall score
-        total_weight = sum(cat.weight for cat in self.requirement_categories)
-        overall_score = min(10.0, (total_weighted_score / total_weight) * 10) if total_weight > 0 else 0.0
+        overall_score = min(10.0, total_weighted_score * self._weight_scale)
         
         # Generate summary and recommendations
         summary = await self._generate_summary(overall_score, category_evaluations, document_content)
@@ -93,99 +255,221 @@ class BaseAgent(ABC):
             confidence_level=confidence_level
         )
     
-    async def _evaluate_category(self, category: RequirementCategory, document_content: str) -> CategoryEvaluation:
+    async def _evaluate_categories(self, document: DocumentContext) -> List[CategoryEvaluation]:
+        """Evaluate every requirement category, batching them into as few LLM calls as possible."""
+        if 1 < len(self.requirement_categories) <= self.BATCH_CATEGORY_LIMIT:
+            batches = await asyncio.gather(*(
+                self._evaluate_category_batch(categories, document) for categories in self._category_batches()
+            ))
+            return [evaluation for batch in batches for evaluation in batch]
+        
+        # Evaluate all categories concurrently; gather preserves category order
+        return list(await asyncio.gather(*(
+            self._evaluate_category(category, document)
+            for category in self.requirement_categories
+        )))
+    
+    def _category_batches(self) -> List[List[RequirementCategory]]:
+        """Split the categories, in order, into batches whose completion budgets fit one response."""
+        batches = []
+        batch: List[RequirementCategory] = []
+        batch_tokens = 0
+        for category in self.requirement_categories:
+            tokens = self.evaluation_max_tokens(category)
+            if batch and batch_tokens + tokens > self.MAX_BATCH_EVALUATION_TOKENS:
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(category)
+            batch_tokens += tokens
+        
+        if batch:
+            batches.append(batch)
+        return batches
+    
+    async def _evaluate_category_batch(
+        self,
+        categories: List[RequirementCategory],
+        document: DocumentContext
+    ) -> List[CategoryEvaluation]:
+        """Evaluate several categories with a single LLM call, sending the document only once."""
+        if len(categories) == 1:
+            return [await self._evaluate_category(categories[0], document)]
+        
+        prompt = self._build_batch_evaluation_prompt(categories)
+        
+        try:
+            response = await self.llm_client.generate_response(
+                prompt=prompt,
+                system_message=self.system_message,
+                max_tokens=sum(self.evaluation_max_tokens(c) for c in categories),
+                temperature=0.2,
+                response_format="json",
+                shared_prefix=self._document_block(categories, document)
+            )
+        except Exception as e:
+            # The call already exhausted its retries; re-requesting each category would only
+            # multiply the failing calls, e.g. while rate limited
+            self.logger.error(f"Batched category evaluation failed: {e}")
+            return [self._failed_evaluation(category, e) for category in categories]
+        
+        try:
+            evaluations_data = self.llm_client.parse_json_response(response).get("evaluations", {})
+            if not isinstance(evaluations_data, dict):
+                raise ValueError("'evaluations' is not an object")
+        except (AttributeError, ValueError) as e:
+            self.logger.warning(f"Invalid batched evaluation response, evaluating individually: {e}")
+            evaluations_data = {}
+        
+        # Categories missing from the batched response are evaluated on their own
+        async def evaluate(category: RequirementCategory) -> CategoryEvaluation:
+            evaluation_data = evaluations_data.get(category.category)
+            if isinstance(evaluation_data, dict):
+                try:
+                    return self._create_category_evaluation(category, evaluation_data)
+                except (TypeError, ValueError) as e:
+                    self.logger.warning(f"Invalid batched evaluation for {category.category}: {e}")
+            return await self._evaluate_category(category, document)
+        
+        return list(await asyncio.gather(*(evaluate(c) for c in categories)))
+    
+    def _create_category_evaluation(self, category: RequirementCategory, evaluation_data: Dict[str, Any]) -> CategoryEvaluation:
+        """Build a CategoryEvaluation from the parsed LLM output for one category."""
+        # Calculate weighted score
+        score = float(evaluation_data.get("score", 0))
+        weight = category.weight
+        weighted_score = (score * weight) / 100  # Convert percentage weight to decimal
+        
+        return CategoryEvaluation(
+            category=category.category,
+            score=score,
+            weight=weight,
+            weighted_score=weighted_score,
+            reasoning=evaluation_data.get("reasoning", ""),
+            strengths=evaluation_data.get("strengths", []),
+            weaknesses=evaluation_data.get("weaknesses", []),
+            missing_elements=evaluation_data.get("missing_elements", [])
+        )
+    
+    async def _evaluate_category(self, category: RequirementCategory, document: DocumentContext) -> CategoryEvaluation:
         """Evaluate a specific requirement category using LLM."""
         
         # Build evaluation prompt
-        prompt = self._build_category_evaluation_prompt(category, document_content)
-        system_message = self._get_system_message()
+        prompt = self._build_category_evaluation_prompt(category)
         
         try:
             # Get LLM evaluation
             response = await self.llm_client.generate_response(
                 prompt=prompt,
-                system_message=system_message,
-                max_tokens=2000,
+                system_message=self.system_message,
+                max_tokens=self.evaluation_max_tokens(category),
                 temperature=0.2,
-                response_format="json"
+                response_format="json",
+                shared_prefix=self._document_block([category], document)
             )
             
             # Parse structured response
             evaluation_data = self.llm_client.parse_json_response(response)
-            
-            # Calculate weighted score
-            score = float(evaluation_data.get("score", 0))
-            weight = category.weight
-            weighted_score = (score * weight) / 100  # Convert percentage weight to decimal
-            
-            return CategoryEvaluation(
-                category=category.category,
-                score=score,
-                weight=weight,
-                weighted_score=weighted_score,
-                reasoning=evaluation_data.get("reasoning", ""),
-                strengths=evaluation_data.get("strengths", []),
-                weaknesses=evaluation_data.get("weaknesses", []),
-                missing_elements=evaluation_data.get("missing_elements", [])
-            )
+            return self._create_category_evaluation(category, evaluation_data)
             
         except Exception as e:
             self.logger.error(f"Failed to evaluate category {category.category}: {e}")
-            # Return fallback evaluation
-            return CategoryEvaluation(
-                category=category.category,
-                score=0.0,
-                weight=category.weight,
-                weighted_score=0.0,
-                reasoning=f"Evaluation failed due to error: {str(e)}",
-                strengths=[],
-                weaknesses=["Unable to complete evaluation"],
-                missing_elements=[]
-            )
+            return self._failed_evaluation(category, e)
     
-    def _build_category_evaluation_prompt(self, category: RequirementCategory, document_content: str) -> str:
-        """Build the evaluation prompt for a specific category."""
+    def evaluation_max_tokens(self, category: RequirementCategory) -> int:
+        """Completion token budget for evaluating a category, based on its number of criteria."""
+        return min(
+            self.MAX_EVALUATION_TOKENS,
+            self.EVALUATION_BASE_TOKENS + self.EVALUATION_TOKENS_PER_CRITERION * len(category.criteria)
+        )
+    
+    def _failed_evaluation(self, category: RequirementCategory, error: Exception) -> CategoryEvaluation:
+        """Fallback evaluation for a category that could not be evaluated."""
+        return CategoryEvaluation(
+            category=category.category,
+            score=0.0,
+            weight=category.weight,
+            weighted_score=0.0,
+            reasoning=f"{EVALUATION_FAILED_PREFIX}{str(error)}",
+            strengths=[],
+            weaknesses=["Unable to complete evaluation"],
+            missing_elements=[]
+        )
+    
+    def category_prompts(self, document: DocumentContext) -> List[Tuple[RequirementCategory, str, str]]:
+        """Build the (category, document block, prompt) of every single-category evaluation."""
+        return [
+            (category, self._document_block([category], document), self._build_category_evaluation_prompt(category))
+            for category in self.requirement_categories
+        ]
+    
+    def evaluation_from_response(self, category: RequirementCategory, response: Optional[str]) -> CategoryEvaluation:
+        """Create a category evaluation from a raw LLM response produced outside of this agent."""
+        if response is None:
+            return self._failed_evaluation(category, RuntimeError("no response returned"))
         
-        criteria_text = "\n".join([
-            f"- {criterion.name}: {criterion.description or 'No description provided'}"
-            for criterion in category.criteria
+        try:
+            evaluation_data = self.llm_client.parse_json_response(response)
+            return self._create_category_evaluation(category, evaluation_data)
+        except Exception as e:
+            self.logger.error(f"Failed to evaluate category {category.category}: {e}")
+            return self._failed_evaluation(category, e)
+    
+    def _relevant_sections(self, categories: List[RequirementCategory], document: DocumentContext) -> str:
+        """Trim an oversized document to the sections that best match the categories' criteria."""
+        if len(document.full_text) <= self.MAX_DOCUMENT_CHARS:
+            return document.full_text
+        
+        keywords = []
+        for category in categories:
+            keywords.append(category.category)
+            keywords.append(category.description or "")
+            keywords.extend(f"{c.name} {c.description or ''}" for c in category.criteria)
+        
+        return document.relevant_sections(keywords, self.MAX_DOCUMENT_CHARS)
+    
+    def _document_block(self, categories: List[RequirementCategory], document: DocumentContext) -> str:
+        """
+        Document content sent ahead of the evaluation prompt.
+        
+        It is passed to the LLM client as a shared prefix, so agents and categories
+        reviewing the same (untrimmed) document let the provider cache it.
+        """
+        if self.share_document_selection:
+            categories = self.requirement_categories
+        return "DOCUMENT CONTENT TO REVIEW:\n" + self._relevant_sections(categories, document)
+    
+    def _build_category_evaluation_prompt(self, category: RequirementCategory) -> str:
+        """Build the evaluation prompt for a specific category, to follow the document block."""
+        
+        return "".join([
+            self._prompt_header,
+            f"CATEGORY TO EVALUATE: {category.category}\n"
+            f"CATEGORY DESCRIPTION: {category.description or 'No description provided'}\n"
+            f"CATEGORY WEIGHT: {category.weight}%\n\n"
+            f"SPECIFIC CRITERIA TO ASSESS:\n{category.criteria_text}\n\n"
+            f'Please evaluate how well the document above meets the requirements for the "{category.category}" category.\n\n',
+            CATEGORY_PROMPT_TAIL
         ])
+    
+    def _build_batch_evaluation_prompt(self, categories: List[RequirementCategory]) -> str:
+        """Build a single evaluation prompt covering several categories, to follow the document block."""
         
-        prompt = f"""
-You are evaluating a launch document against specific {self.agent_type} requirements.
-
-CATEGORY TO EVALUATE: {category.category}
-CATEGORY DESCRIPTION: {category.description or 'No description provided'}
-CATEGORY WEIGHT: {category.weight}%
-
-SPECIFIC CRITERIA TO ASSESS:
-{criteria_text}
-
-DOCUMENT CONTENT TO REVIEW:
-{document_content}
-
-Please evaluate how well this document meets the requirements for the "{category.category}" category.
-
-Provide your evaluation in the following JSON format:
-{{
-    "score": <number between 0-10>,
-    "reasoning": "<detailed explanation of your scoring rationale>",
-    "strengths": ["<strength 1>", "<strength 2>", ...],
-    "weaknesses": ["<weakness 1>", "<weakness 2>", ...],
-    "missing_elements": ["<missing element 1>", "<missing element 2>", ...]
-}}
-
-SCORING GUIDELINES:
-- 9-10: Exceptional - All criteria excellently addressed with comprehensive detail
-- 7-8: Good - Most criteria well addressed with good detail  
-- 5-6: Adequate - Some criteria addressed but lacks depth or completeness
-- 3-4: Weak - Few criteria addressed, significant gaps
-- 0-2: Poor - Major deficiencies, criteria largely unaddressed
-
-Focus specifically on the criteria listed above. Be thorough but concise in your reasoning.
-"""
+        category_blocks = []
+        for category in categories:
+            category_blocks.append(
+                f"CATEGORY: {category.category}\n"
+                f"CATEGORY DESCRIPTION: {category.description or 'No description provided'}\n"
+                f"CATEGORY WEIGHT: {category.weight}%\n"
+                f"SPECIFIC CRITERIA TO ASSESS:\n{category.criteria_text}"
+            )
         
-        return prompt.strip()
+        return "".join([
+            self._prompt_header,
+            "CATEGORIES TO EVALUATE:\n\n",
+            "\n\n".join(category_blocks),
+            "\n\n",
+            BATCH_PROMPT_TAIL
+        ])
     
     @abstractmethod
     def _get_system_message(self) -> str:
@@ -221,23 +505,62 @@ Focus specifically on the criteria listed above. Be thorough but concise in your
     
     def _identify_key_issues(self, evaluations: List[CategoryEvaluation]) -> List[str]:
         """Identify the most critical issues from evaluations."""
+        # Deduplicate in order and stop at the top 5 issues
         issues = []
+        seen = set()
         
         for evaluation in evaluations:
-            if evaluation.score < 5.0:  # Poor performance
-                issues.extend(evaluation.missing_elements[:2])  # Top 2 missing elements
-                issues.extend(evaluation.weaknesses[:1])  # Top weakness
+            if evaluation.score >= 5.0:  # Only poor performance counts
+                continue
+            
+            # Top 2 missing elements, then top weakness
+            for issue in evaluation.missing_elements[:2] + evaluation.weaknesses[:1]:
+                if issue not in seen:
+                    seen.add(issue)
+                    issues.append(issue)
+                    if len(issues) == 5:
+                        return issues
         
-        # Deduplicate and limit to top 5 issues
-        unique_issues = list(dict.fromkeys(issues))  # Preserves order while removing duplicates
-        return unique_issues[:5]
+        return issues
     
     async def _generate_recommendations(self, evaluations: List[CategoryEvaluation], document_content: str) -> List[str]:
         """Generate actionable recommendations based on evaluation results."""
         
         weak_evaluations = [e for e in evaluations if e.score < 6.0]
         if not weak_evaluations:
-            return ["Document meets most requirements well. Consider minor refinements based on specific feedback."]
+            return list(self.STRONG_DOCUMENT_RECOMMENDATIONS)
+        
+        if self.use_llm_recommendations:
+            return await self._generate_llm_recommendations(weak_evaluations)
+        
+        return self._rule_based_recommendations(weak_evaluations)[:5]  # Limit to top 5 recommendations
+    
+    def _rule_based_recommendations(self, weak_evaluations: List[CategoryEvaluation]) -> List[str]:
+        """Build recommendations for weak categories without calling the LLM."""
+        return [f"Address gaps in {e.category}" for e in weak_evaluations[:3]]
+    
+    def _route_recommendations(self, weak_evaluations: List[CategoryEvaluation]) -> List[str]:
+        """Map each weak category to the recommendation of its first matching keyword route."""
+        recommendations = []
+        for evaluation in weak_evaluations:
+            category = evaluation.category
+            if category not in self._category_recommendations:
+                self._category_recommendations[category] = self._match_route(category)
+            
+            recommendation = self._category_recommendations[category]
+            if recommendation:
+                recommendations.append(recommendation)
+        return recommendations
+    
+    def _match_route(self, category: str) -> Optional[str]:
+        """Get the recommendation of the first route whose keywords appear in a category name."""
+        return next(
+            (recommendation for pattern, recommendation in self._routes if pattern.search(category)),
+            None
+        )
+    
+    async def _generate_llm_recommendations(self, weak_evaluations: List[CategoryEvaluation]) -> List[str]:
+        """Ask the LLM for recommendations targeting the weak categories."""
         
         # Build recommendation prompt
         weak_areas = "\n".join([
@@ -263,8 +586,11 @@ Format: {{"recommendations": ["recommendation 1", "recommendation 2", ...]}}
         try:
             response = await self.llm_client.generate_response(
                 prompt=prompt,
-                system_message=self._get_system_message(),
-                max_tokens=1000,
+                system_message=self.system_message,
+                max_tokens=min(
+                    self.MAX_RECOMMENDATION_TOKENS,
+                    self.RECOMMENDATION_BASE_TOKENS + self.RECOMMENDATION_TOKENS_PER_AREA * len(weak_evaluations)
+                ),
                 temperature=0.3,
                 response_format="json"
             )
@@ -275,15 +601,18 @@ Format: {{"recommendations": ["recommendation 1", "recommendation 2", ...]}}
         except Exception as e:
             self.logger.error(f"Failed to generate recommendations: {e}")
             # Fallback recommendations
-            return [f"Address gaps in {e.category}" for e in weak_evaluations[:3]]
+            return self._rule_based_recommendations(weak_evaluations)[:5]
     
     def _assess_confidence(self, evaluations: List[CategoryEvaluation]) -> str:
         """Assess confidence level of the overall evaluation."""
         
         # Simple heuristic based on score distribution
         scores = [e.score for e in evaluations]
-        avg_score = sum(scores) / len(scores) if scores else 0
-        score_variance = sum((s - avg_score) ** 2 for s in scores) / len(scores) if scores else 0
+        if not scores:
+            return "Low"
+        
+        avg_score = statistics.fmean(scores)
+        score_variance = statistics.pvariance(scores, mu=avg_score)
         
         # High confidence: consistent scores (low variance)
         # Medium confidence: moderate variance
@@ -294,4 +623,43 @@ Format: {{"recommendations": ["recommendation 1", "recommendation 2", ...]}}
         elif score_variance < 4.0 and avg_score > 2.0:
             return "Medium"
         else:
-            return "Low"
\ No newline at end of file
+            return "Low"
+
+
+async def review_with_agents(
+    agents: List[BaseAgent],
+    document: Union[str, DocumentContext],
+    return_exceptions: bool = False,
+    timeout: Optional[float] = None
+) -> List[Union[AgentReview, BaseException]]:
+    """
+    Run several agents' reviews of the same document concurrently.
+    
+    Args:
+        agents: Agents to run
+        document: The launch document text, or a DocumentContext already prepared for it
+        return_exceptions: Return agent failures in place of their reviews instead of raising
+        timeout: Seconds each agent may take before its review is cancelled with asyncio.TimeoutError
+        
+    Returns:
+        Reviews in the same order as `agents`
+    """
+    # Prepare the document once so every agent shares its sections
+    if isinstance(document, str):
+        document = DocumentContext.from_text(document)
+    
+    return list(await asyncio.gather(
+        *(review_with_timeout(agent, document, timeout) for agent in agents),
+        return_exceptions=return_exceptions
+    ))
+
+
+async def review_with_timeout(agent: BaseAgent, document: DocumentContext, timeout: Optional[float]) -> AgentReview:
+    """Run one agent's review, cancelling it if it exceeds `timeout` seconds."""
+    if timeout is None:
+        return await agent.review_document(document)
+    
+    try:
+        return await asyncio.wait_for(agent.review_document(document), timeout)
+    except asyncio.TimeoutError:
+        raise asyncio.TimeoutError(f"{agent.agent_name} did not finish within {timeout:g}s")
@@ -3,7 +3,7 @@ Data Scientist Agent for evaluating launch documents from a data and analytics p
 """
 
 from .base_agent import BaseAgent
-from ..requirements_manager import AgentRequirement
+from ..requirements_models import AgentRequirement
 from ..utils.llm_client import LLMClient
 
 
@@ -18,12 +18,8 @@ class DataScientistAgent(BaseAgent):
     - Reporting, insights, and data governance
     """
     
-    def __init__(self, requirements: AgentRequirement, llm_client: LLMClient):
-        super().__init__(requirements, llm_client)
-    
-    def _get_system_message(self) -> str:
-        """System message that defines the Data Scientist agent's role and expertise."""
-        return """You are a Senior Data Scientist with 8+ years of experience in analytics, machine learning, and data infrastructure. You have deep expertise in:
+    # Defines the agent's role and expertise; built once and shared by every LLM call
+    SYSTEM_MESSAGE = """You are a Senior Data Scientist with 8+ years of experience in analytics, machine learning, and data infrastructure. You have deep expertise in:
 
 - Data architecture and pipeline design
 - Statistical analysis and experimental design
@@ -52,47 +48,53 @@ When evaluating documents, you should:
 
 Be technically rigorous while considering business practicality. Focus on statistical validity, data quality, and sustainable analytics practices."""
     
-    async def _generate_recommendations(self, evaluations, document_content):
-        """Generate Data Science-specific recommendations with technical focus."""
-        
-        weak_evaluations = [e for e in evaluations if e.score < 6.0]
-        if not weak_evaluations:
-            return [
-                "Consider implementing automated data quality monitoring and alerting",
-                "Establish baseline measurements and statistical power analysis for key metrics",
-                "Develop data lineage documentation and impact analysis procedures"
-            ]
+    # Returned when no category scores below the weak threshold
+    STRONG_DOCUMENT_RECOMMENDATIONS = [
+        "Consider implementing automated data quality monitoring and alerting",
+        "Establish baseline measurements and statistical power analysis for key metrics",
+        "Develop data lineage documentation and impact analysis procedures"
+    ]
+    
+    # (category keywords, recommendation) pairs; the first route matching a weak category wins
+    RECOMMENDATION_ROUTES = (
+        (
+            ("data requirement", "data quality"),
+            "Define comprehensive data quality framework with validation rules, monitoring dashboards, and automated alerting for data anomalies"
+        ),
+        (
+            ("analytics", "measurement"),
+            "Establish rigorous measurement methodology with proper statistical testing, sample size calculations, and confidence intervals for all key metrics"
+        ),
+        (
+            ("technical", "implementation"),
+            "Design scalable data architecture with clear ETL/ELT processes, real-time streaming capabilities, and proper data versioning"
+        ),
+        (
+            ("reporting", "insight"),
+            "Implement self-service analytics platform with automated reporting, interactive dashboards, and role-based access controls"
+        ),
+        (
+            ("experiment", "test"),
+            "Develop comprehensive A/B testing framework with proper randomization, stratification, and statistical significance testing"
+        ),
+        (
+            ("privacy", "compliance"),
+            "Implement data privacy-by-design with anonymization, consent management, and compliance monitoring for GDPR/CCPA requirements"
+        )
+    )
+    
+    def __init__(self, requirements: AgentRequirement, llm_client: LLMClient):
+        super().__init__(requirements, llm_client)
+    
+    def _get_system_message(self) -> str:
+        """System message that defines the Data Scientist agent's role and expertise."""
+        return self.SYSTEM_MESSAGE
+    
+    def _rule_based_recommendations(self, weak_evaluations):
+        """Build Data Science-specific recommendations with technical focus."""
         
         # DS-specific recommendation logic
-        recommendations = []
-        
-        for evaluation in weak_evaluations:
-            category_lower = evaluation.category.lower()
-            
-            if "data requirement" in category_lower or "data quality" in category_lower:
-                recommendations.append(
-                    "Define comprehensive data quality framework with validation rules, monitoring dashboards, and automated alerting for data anomalies"
-                )
-            elif "analytics" in category_lower or "measurement" in category_lower:
-                recommendations.append(
-                    "Establish rigorous measurement methodology with proper statistical testing, sample size calculations, and confidence intervals for all key metrics"
-                )
-            elif "technical" in category_lower or "implementation" in category_lower:
-                recommendations.append(
-                    "Design scalable data architecture with clear ETL/ELT processes, real-time streaming capabilities, and proper data versioning"
-                )
-            elif "reporting" in category_lower or "insight" in category_lower:
-                recommendations.append(
-                    "Implement self-service analytics platform with automated reporting, interactive dashboards, and role-based access controls"
-                )
-            elif "experiment" in category_lower or "test" in category_lower:
-                recommendations.append(
-                    "Develop comprehensive A/B testing framework with proper randomization, stratification, and statistical significance testing"
-                )
-            elif "privacy" in category_lower or "compliance" in category_lower:
-                recommendations.append(
-                    "Implement data privacy-by-design with anonymization, consent management, and compliance monitoring for GDPR/CCPA requirements"
-                )
+        recommendations = self._route_recommendations(weak_evaluations)
         
         # Add generic technical recommendations if none matched
         if not recommendations:
@@ -113,4 +115,4 @@ Be technically rigorous while considering business practicality. Focus on statis
             ]
             recommendations.extend(additional_recs[:5-len(recommendations)])
         
-        return recommendations[:5]  # Limit to top 5 recommendations
\ No newline at end of file
+        return recommendations
\ No newline at end of file
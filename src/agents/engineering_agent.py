@@ -3,7 +3,7 @@ Engineering Agent for evaluating launch documents from a technical and operation
 """
 
 from .base_agent import BaseAgent
-from ..requirements_manager import AgentRequirement
+from ..requirements_models import AgentRequirement
 from ..utils.llm_client import LLMClient
 
 
@@ -18,12 +18,8 @@ class EngineeringAgent(BaseAgent):
     - Quality assurance and testing strategies
     """
     
-    def __init__(self, requirements: AgentRequirement, llm_client: LLMClient):
-        super().__init__(requirements, llm_client)
-    
-    def _get_system_message(self) -> str:
-        """System message that defines the Engineering agent's role and expertise."""
-        return """You are a Senior Engineering Manager/Architect with 12+ years of experience in software engineering, system architecture, and engineering operations. You have deep expertise in:
+    # Defines the agent's role and expertise; built once and shared by every LLM call
+    SYSTEM_MESSAGE = """You are a Senior Engineering Manager/Architect with 12+ years of experience in software engineering, system architecture, and engineering operations. You have deep expertise in:
 
 - Distributed systems architecture and microservices design
 - Cloud infrastructure and platform engineering (AWS, GCP, Azure)
@@ -54,51 +50,57 @@ When evaluating documents, you should:
 
 Be technically rigorous while considering practical constraints. Focus on system reliability, engineering velocity, and operational excellence."""
     
-    async def _generate_recommendations(self, evaluations, document_content):
-        """Generate Engineering-specific recommendations with technical focus."""
-        
-        weak_evaluations = [e for e in evaluations if e.score < 6.0]
-        if not weak_evaluations:
-            return [
-                "Consider implementing chaos engineering practices to validate system resilience",
-                "Establish comprehensive observability with distributed tracing and APM",
-                "Implement automated security scanning and vulnerability assessment in CI/CD pipeline"
-            ]
+    # Returned when no category scores below the weak threshold
+    STRONG_DOCUMENT_RECOMMENDATIONS = [
+        "Consider implementing chaos engineering practices to validate system resilience",
+        "Establish comprehensive observability with distributed tracing and APM",
+        "Implement automated security scanning and vulnerability assessment in CI/CD pipeline"
+    ]
+    
+    # (category keywords, recommendation) pairs; the first route matching a weak category wins
+    RECOMMENDATION_ROUTES = (
+        (
+            ("architecture", "technical"),
+            "Define comprehensive system architecture with clear service boundaries, API contracts, and scalability patterns including load balancing and auto-scaling strategies"
+        ),
+        (
+            ("implementation", "planning"),
+            "Create detailed implementation roadmap with realistic timeline, resource allocation, dependency mapping, and risk mitigation strategies for critical path items"
+        ),
+        (
+            ("operational", "reliability"),
+            "Establish comprehensive operational readiness including SLI/SLO definitions, monitoring dashboards, alerting runbooks, and incident response procedures"
+        ),
+        (
+            ("quality", "testing"),
+            "Implement multi-layered testing strategy with unit, integration, end-to-end, and performance tests integrated into CI/CD pipeline with quality gates"
+        ),
+        (
+            ("security",),
+            "Design security-first architecture with threat modeling, security controls, vulnerability scanning, and compliance validation integrated throughout SDLC"
+        ),
+        (
+            ("monitoring", "observability"),
+            "Implement comprehensive observability stack with metrics, logging, tracing, and APM tools with automated anomaly detection and alerting"
+        ),
+        (
+            ("deployment", "devops"),
+            "Establish robust deployment pipeline with automated testing, canary deployments, blue-green deployment strategy, and automated rollback capabilities"
+        )
+    )
+    
+    def __init__(self, requirements: AgentRequirement, llm_client: LLMClient):
+        super().__init__(requirements, llm_client)
+    
+    def _get_system_message(self) -> str:
+        """System message that defines the Engineering agent's role and expertise."""
+        return self.SYSTEM_MESSAGE
+    
+    def _rule_based_recommendations(self, weak_evaluations):
+        """Build Engineering-specific recommendations with technical focus."""
         
         # Engineering-specific recommendation logic
-        recommendations = []
-        
-        for evaluation in weak_evaluations:
-            category_lower = evaluation.category.lower()
-            
-            if "architecture" in category_lower or "technical" in category_lower:
-                recommendations.append(
-                    "Define comprehensive system architecture with clear service boundaries, API contracts, and scalability patterns including load balancing and auto-scaling strategies"
-                )
-            elif "implementation" in category_lower or "planning" in category_lower:
-                recommendations.append(
-                    "Create detailed implementation roadmap with realistic timeline, resource allocation, dependency mapping, and risk mitigation strategies for critical path items"
-                )
-            elif "operational" in category_lower or "reliability" in category_lower:
-                recommendations.append(
-                    "Establish comprehensive operational readiness including SLI/SLO definitions, monitoring dashboards, alerting runbooks, and incident response procedures"
-                )
-            elif "quality" in category_lower or "testing" in category_lower:
-                recommendations.append(
-                    "Implement multi-layered testing strategy with unit, integration, end-to-end, and performance tests integrated into CI/CD pipeline with quality gates"
-                )
-            elif "security" in category_lower:
-                recommendations.append(
-                    "Design security-first architecture with threat modeling, security controls, vulnerability scanning, and compliance validation integrated throughout SDLC"
-                )
-            elif "monitoring" in category_lower or "observability" in category_lower:
-                recommendations.append(
-                    "Implement comprehensive observability stack with metrics, logging, tracing, and APM tools with automated anomaly detection and alerting"
-                )
-            elif "deployment" in category_lower or "devops" in category_lower:
-                recommendations.append(
-                    "Establish robust deployment pipeline with automated testing, canary deployments, blue-green deployment strategy, and automated rollback capabilities"
-                )
+        recommendations = self._route_recommendations(weak_evaluations)
         
         # Add generic engineering recommendations if none matched
         if not recommendations:
@@ -121,4 +123,4 @@ Be technically rigorous while considering practical constraints. Focus on system
             ]
             recommendations.extend(additional_recs[:5-len(recommendations)])
         
-        return recommendations[:5]  # Limit to top 5 recommendations
\ No newline at end of file
+        return recommendations
\ No newline at end of file
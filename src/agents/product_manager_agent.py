@@ -3,7 +3,7 @@ Product Manager Agent for evaluating launch documents from a business and produc
 """
 
 from .base_agent import BaseAgent
-from ..requirements_manager import AgentRequirement
+from ..requirements_models import AgentRequirement
 from ..utils.llm_client import LLMClient
 
 
@@ -18,12 +18,8 @@ class ProductManagerAgent(BaseAgent):
     - Stakeholder alignment and execution planning
     """
     
-    def __init__(self, requirements: AgentRequirement, llm_client: LLMClient):
-        super().__init__(requirements, llm_client)
-    
-    def _get_system_message(self) -> str:
-        """System message that defines the Product Manager agent's role and expertise."""
-        return """You are an experienced Senior Product Manager with 10+ years of experience in product strategy, market analysis, and launch planning. You have a strong background in:
+    # Defines the agent's role and expertise; built once and shared by every LLM call
+    SYSTEM_MESSAGE = """You are an experienced Senior Product Manager with 10+ years of experience in product strategy, market analysis, and launch planning. You have a strong background in:
 
 - Market research and competitive analysis
 - Product strategy development and roadmapping
@@ -46,40 +42,48 @@ When evaluating documents, you should:
 
 Be thorough, analytical, and constructive in your feedback. Focus on practical business outcomes and strategic value."""
     
-    async def _generate_recommendations(self, evaluations, document_content):
-        """Generate PM-specific recommendations with business focus."""
-        
-        weak_evaluations = [e for e in evaluations if e.score < 6.0]
-        if not weak_evaluations:
-            return [
-                "Consider conducting additional market validation to strengthen competitive positioning",
-                "Ensure success metrics include both leading and lagging indicators",
-                "Develop contingency plans for key assumptions and risks"
-            ]
+    # Returned when no category scores below the weak threshold
+    STRONG_DOCUMENT_RECOMMENDATIONS = [
+        "Consider conducting additional market validation to strengthen competitive positioning",
+        "Ensure success metrics include both leading and lagging indicators",
+        "Develop contingency plans for key assumptions and risks"
+    ]
+    
+    # (category keywords, recommendation) pairs; the first route matching a weak category wins
+    RECOMMENDATION_ROUTES = (
+        (
+            ("market",),
+            "Conduct comprehensive market sizing (TAM/SAM/SOM) with bottoms-up validation and competitive landscape analysis"
+        ),
+        (
+            ("strategy", "product"),
+            "Clearly define product vision, value proposition, and strategic differentiation with measurable success criteria"
+        ),
+        (
+            ("business", "financial"),
+            "Develop detailed business case with revenue projections, cost structure analysis, and ROI calculations with sensitivity analysis"
+        ),
+        (
+            ("stakeholder",),
+            "Create stakeholder alignment framework with clear RACI matrix, communication plan, and decision-making process"
+        )
+    )
+    
+    def __init__(self, requirements: AgentRequirement, llm_client: LLMClient):
+        super().__init__(requirements, llm_client)
+    
+    def _get_system_message(self) -> str:
+        """System message that defines the Product Manager agent's role and expertise."""
+        return self.SYSTEM_MESSAGE
+    
+    def _rule_based_recommendations(self, weak_evaluations):
+        """Build PM-specific recommendations with business focus."""
         
         # PM-specific recommendation logic
-        recommendations = []
-        
-        for evaluation in weak_evaluations:
-            if evaluation.category.lower().find("market") != -1:
-                recommendations.append(
-                    "Conduct comprehensive market sizing (TAM/SAM/SOM) with bottoms-up validation and competitive landscape analysis"
-                )
-            elif evaluation.category.lower().find("strategy") != -1 or evaluation.category.lower().find("product") != -1:
-                recommendations.append(
-                    "Clearly define product vision, value proposition, and strategic differentiation with measurable success criteria"
-                )
-            elif evaluation.category.lower().find("business") != -1 or evaluation.category.lower().find("financial") != -1:
-                recommendations.append(
-                    "Develop detailed business case with revenue projections, cost structure analysis, and ROI calculations with sensitivity analysis"
-                )
-            elif evaluation.category.lower().find("stakeholder") != -1:
-                recommendations.append(
-                    "Create stakeholder alignment framework with clear RACI matrix, communication plan, and decision-making process"
-                )
+        recommendations = self._route_recommendations(weak_evaluations)
         
         # Fallback to generic recommendations if none matched
         if not recommendations:
             recommendations = [f"Strengthen {e.category} with more detailed analysis and supporting data" for e in weak_evaluations[:3]]
         
-        return recommendations[:5]  # Limit to top 5 recommendations
\ No newline at end of file
+        return recommendations
\ No newline at end of file
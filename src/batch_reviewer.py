@@ -0,0 +1,85 @@
+"""
+Offline batch reviews using the OpenAI Batch API.
+Evaluates many documents at once at lower cost when results are not needed immediately.
+"""
+
+import logging
+from typing import List, Dict, Optional
+
+from .utils.llm_client import LLMClient, BatchHandle
+from .utils.document_sections import DocumentContext
+from .agents.base_agent import BaseAgent, AgentReview
+
+
+class BatchReviewRunner:
+    """Reviews a set of documents with every agent through a single OpenAI batch."""
+    
+    # Matches the per-category temperature used for synchronous evaluation
+    TEMPERATURE = 0.2
+    
+    def __init__(self, agents: List[BaseAgent], llm_client: LLMClient):
+        """
+        Initialize the batch review runner.
+        
+        Args:
+            agents: Agents to review each document with
+            llm_client: OpenAI client used to submit the batch
+        """
+        self.agents = agents
+        self.llm_client = llm_client
+        self.logger = logging.getLogger(__name__)
+    
+    async def run(
+        self,
+        documents: Dict[str, str],
+        poll_interval: Optional[float] = None
+    ) -> Dict[str, List[AgentReview]]:
+        """
+        Review documents with all agents and wait for the results.
+        
+        Args:
+            documents: Document text keyed by a caller-chosen document ID
+            poll_interval: Seconds between batch status checks
+        
+        Returns:
+            Agent reviews for each document ID, in agent order
+        """
+        contexts = {doc_id: DocumentContext.from_text(text) for doc_id, text in documents.items()}
+        
+        # Every (document, agent, category) evaluation becomes one batch request
+        requests = []
+        pending = []
+        for doc_id, document in contexts.items():
+            for agent_index, agent in enumerate(self.agents):
+                for category_index, (category, document_block, prompt) in enumerate(agent.category_prompts(document)):
+                    custom_id = f"{doc_id}:{agent_index}:{category_index}"
+                    requests.append(self.llm_client.build_batch_request(
+                        custom_id=custom_id,
+                        prompt=prompt,
+                        system_message=agent.system_message,
+                        max_tokens=agent.evaluation_max_tokens(category),
+                        temperature=self.TEMPERATURE,
+                        response_format="json",
+                        shared_prefix=document_block
+                    ))
+                    pending.append((doc_id, agent_index, category, custom_id))
+        
+        handle: BatchHandle = await self.llm_client.submit_batch(requests)
+        responses = await handle.wait(poll_interval)
+        self.logger.info(f"Batch {handle.batch_id} returned {len(responses)}/{len(requests)} responses")
+        
+        evaluations = {doc_id: [[] for _ in self.agents] for doc_id in contexts}
+        for doc_id, agent_index, category, custom_id in pending:
+            agent = self.agents[agent_index]
+            evaluations[doc_id][agent_index].append(
+                agent.evaluation_from_response(category, responses.get(custom_id))
+            )
+        
+        results = {}
+        for doc_id, document in contexts.items():
+            results[doc_id] = [
+                await agent.finalize_review(evaluations[doc_id][agent_index], document)
+                for agent_index, agent in enumerate(self.agents)
+            ]
+        
+        return results
@@ -2,19 +2,40 @@
 Main launch document reviewer orchestrator that coordinates multiple agents.
 """
 
+import io
+import os
+import json
+import math
 import asyncio
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+import operator
+import statistics
+from typing import List, Dict, Any, Callable, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass, field
 from datetime import datetime
 
-from .requirements_manager import RequirementsManager, ScoringConfig
-from .utils.llm_client import LLMClientFactory
+from .requirements_manager import RequirementsManager
+from .requirements_models import RequirementsSpec, ScoringConfig
+from .utils.llm_client import LLMClientFactory, dumps_json
+from .utils.llm_cache import LLMCache
 from .utils.google_docs_client import GoogleDocsClient
 from .agents.product_manager_agent import ProductManagerAgent
 from .agents.data_scientist_agent import DataScientistAgent
 from .agents.engineering_agent import EngineeringAgent
-from .agents.base_agent import AgentReview
+from .agents.base_agent import AgentReview, review_with_timeout
+from .utils.document_sections import DocumentContext
+
+
+# Separator lines used by the plain-text report
+RULE = "=" * 80
+SECTION_RULE = "-" * 40
+SUBSECTION_RULE = "-" * 20
+
+
+def weighted_total(scores: Sequence[float], weights: Sequence[float]) -> float:
+    """Sum of scores multiplied by their weights, computed with a single accurate summation."""
+    return math.fsum(map(operator.mul, scores, weights))
 
 
 @dataclass
@@ -29,18 +50,67 @@ class ReviewResult:
     summary: str
     confidence_level: str
     key_recommendations: List[str]
+    formatted_timestamp: str = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        # Display form of the timestamp, shared by the text and rich reports
+        self.formatted_timestamp = self.review_timestamp.isoformat(sep=' ', timespec='seconds')
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the JSON report of the review, with a summary of each agent's category evaluations."""
+        return {
+            'document_url': self.document_url,
+            'document_title': self.document_title,
+            'review_timestamp': self.review_timestamp,  # Formatted by dumps_json
+            'overall_score': self.overall_score,
+            'summary': self.summary,
+            'confidence_level': self.confidence_level,
+            'agent_reviews': [
+                {
+                    'agent_name': review.agent_name,
+                    'agent_type': review.agent_type,
+                    'score': review.overall_score,
+                    'summary': review.summary,
+                    'key_issues': review.key_issues,
+                    'recommendations': review.recommendations,
+                    'confidence_level': review.confidence_level,
+                    'category_evaluations': [
+                        {
+                            'category': cat.category,
+                            'score': cat.score,
+                            'weight': cat.weight,
+                            'reasoning': cat.reasoning
+                        }
+                        for cat in review.category_evaluations
+                    ]
+                }
+                for review in self.agent_reviews
+            ],
+            'key_recommendations': self.key_recommendations
+        }
+    
+    def to_json(self, indent: bool = False) -> bytes:
+        """Serialize the JSON report of the review to bytes."""
+        return dumps_json(self.to_dict(), indent=indent)
 
 
 class LaunchDocReviewer:
     """Main orchestrator for launch document reviews."""
     
+    # Numeric values of agent confidence levels, for averaging
+    CONFIDENCE_SCORES = {"High": 3, "Medium": 2, "Low": 1}
+    
+    # Seconds an agent may spend on a review before it is replaced by a fallback review
+    DEFAULT_AGENT_TIMEOUT = 600.0
+    
     def __init__(
         self,
         llm_provider: Optional[str] = None,
         llm_model: Optional[str] = None,
         base_url: Optional[str] = None,
         google_credentials_path: Optional[str] = None,
-        oauth_port: int = 8080
+        oauth_port: int = 8080,
+        requirements_manager: Optional[RequirementsManager] = None
     ):
         """
         Initialize the launch document reviewer.
@@ -51,6 +121,8 @@ class LaunchDocReviewer:
             base_url: Base URL for local LLM services (ollama/local)
             google_credentials_path: Path to Google OAuth credentials JSON
             oauth_port: Port for Google OAuth redirect (default: 8080)
+            requirements_manager: Requirements manager to use, possibly with requirements
+                already loaded by the caller
         """
         self.logger = logging.getLogger(__name__)
         
@@ -64,46 +136,75 @@ class LaunchDocReviewer:
         
         # Initialize Google Docs client
         try:
-            self.docs_client = GoogleDocsClient(google_credentials_path, oauth_port)
+            self.docs_client = GoogleDocsClient.shared(google_credentials_path, oauth_port)
             self.logger.info("Initialized Google Docs client")
         except Exception as e:
             self.logger.error(f"Failed to initialize Google Docs client: {e}")
             raise
         
         # Initialize requirements manager
-        self.requirements_manager = RequirementsManager()
+        self.requirements_manager = requirements_manager or RequirementsManager()
         self.agents = {}
+        self._agent_weights: List[float] = []
+        self._agents_key: Optional[Tuple[str, int, int]] = None
+        
+        self.agent_timeout = float(os.getenv("AGENT_REVIEW_TIMEOUT", self.DEFAULT_AGENT_TIMEOUT))
+        
+        # Complete agent reviews are cached alongside LLM responses (configured by LLM_CACHE)
+        self.review_cache = self.llm_client.cache
+    
+    async def close(self):
+        """Release network resources held by the reviewer."""
+        await self.llm_client.close()
     
-    async def review_document(self, document_url: str, requirements_file: str) -> ReviewResult:
+    async def __aenter__(self) -> "LaunchDocReviewer":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def review_document(
+        self,
+        document_url: str,
+        requirements_file: str,
+        on_agent_review: Optional[Callable[[AgentReview], None]] = None
+    ) -> ReviewResult:
         """
         Perform complete review of a launch document.
         
         Args:
             document_url: Google Docs URL
             requirements_file: Path to requirements YAML file
+            on_agent_review: Called with each agent's review as soon as it is available,
+                before the overall result is assembled
             
         Returns:
             Complete review result
         """
         self.logger.info(f"Starting document review for: {document_url}")
         
-        # Load requirements
-        requirements = self.requirements_manager.load_requirements(requirements_file)
-        self.logger.info(f"Loaded requirements with {len(requirements.agents)} agents")
-        
-        # Initialize agents
-        await self._initialize_agents()
-        
-        # Fetch document content
+        # Fetch document content and metadata, and connect to the LLM provider, while
+        # requirements and agents are prepared
         self.logger.info("Fetching document content...")
-        document_content = await self.docs_client.fetch_document_content(document_url)
-        document_info = self.docs_client.get_document_info(document_url)
+        fetch_task = asyncio.create_task(self.docs_client.fetch_document(document_url))
+        prewarm_task = asyncio.create_task(self.llm_client.prewarm())
+        try:
+            # Yield once so the request is handed to its worker thread before setup runs
+            await asyncio.sleep(0)
+            requirements = await self._prepare_agents(requirements_file)
+            document_content, document_info = await fetch_task
+            await prewarm_task
+        except BaseException:
+            # Neither task may outlive a failed review, which closes the client under them
+            fetch_task.cancel()
+            prewarm_task.cancel()
+            raise
         
         self.logger.info(f"Fetched document: {len(document_content)} characters")
         
         # Run agent reviews in parallel
         self.logger.info("Running agent reviews...")
-        agent_reviews = await self._run_agent_reviews(document_content)
+        agent_reviews = await self._run_agent_reviews(DocumentContext.from_text(document_content), on_agent_review)
         
         # Calculate overall score
         overall_score = self._calculate_overall_score(agent_reviews, requirements.scoring)
@@ -129,6 +230,57 @@ class LaunchDocReviewer:
         self.logger.info(f"Review completed. Overall score: {overall_score:.2f}")
         return result
     
+    async def review_documents_batch(
+        self,
+        document_urls: List[str],
+        requirements_file: str,
+        max_concurrency: int = 8,
+        return_exceptions: bool = False
+    ) -> List[Union[ReviewResult, BaseException]]:
+        """
+        Review several documents concurrently against the same requirements.
+        
+        Args:
+            document_urls: Google Docs URLs
+            requirements_file: Path to requirements YAML file
+            max_concurrency: Maximum number of documents reviewed at once
+            return_exceptions: Return failed reviews' exceptions in place of their results instead of raising
+            
+        Returns:
+            Review results in the same order as `document_urls`
+        """
+        # Load requirements and build agents once, before the reviews start sharing them
+        await self._prepare_agents(requirements_file)
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def review(document_url: str) -> ReviewResult:
+            async with semaphore:
+                return await self.review_document(document_url, requirements_file)
+        
+        return list(await asyncio.gather(
+            *(review(url) for url in document_urls),
+            return_exceptions=return_exceptions
+        ))
+    
+    async def _prepare_agents(self, requirements_file: str) -> RequirementsSpec:
+        """Load requirements and build agents, reusing them while the file is unchanged."""
+        agents_key = RequirementsManager.file_version(requirements_file)
+        if agents_key is not None and agents_key == self._agents_key:
+            return self.requirements_manager.requirements
+        
+        self._agents_key = None
+        if agents_key is not None and agents_key == self.requirements_manager.loaded_version:
+            # Already loaded from this version of the file, e.g. validated by the caller
+            requirements = self.requirements_manager.requirements
+        else:
+            requirements = self.requirements_manager.load_requirements(requirements_file)
+        self.logger.info(f"Loaded requirements with {len(requirements.agents)} agents")
+        
+        await self._initialize_agents()
+        self._agents_key = agents_key
+        return requirements
+    
     async def _initialize_agents(self):
         """Initialize all agents based on loaded requirements."""
         self.agents = {}
@@ -146,34 +298,94 @@ class LaunchDocReviewer:
             
             self.agents[agent_req.type] = agent
             self.logger.info(f"Initialized {agent_req.name}")
+        
+        # Weights aligned to agent order, so scoring needs no per-review lookups
+        weights = self.requirements_manager.get_scoring_config().weights
+        self._agent_weights = [weights.get(agent_type, 0.0) for agent_type in self.agents]
     
-    async def _run_agent_reviews(self, document_content: str) -> List[AgentReview]:
-        """Run all agent reviews in parallel."""
-        tasks = []
-        
-        for agent_type, agent in self.agents.items():
-            task = asyncio.create_task(
-                agent.review_document(document_content),
-                name=f"review_{agent_type}"
-            )
-            tasks.append(task)
-        
-        # Wait for all reviews to complete
-        reviews = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Handle any exceptions
-        successful_reviews = []
-        for i, result in enumerate(reviews):
-            if isinstance(result, Exception):
-                agent_type = list(self.agents.keys())[i]
-                self.logger.error(f"Agent {agent_type} failed: {result}")
-                # Create a fallback review
-                fallback_review = self._create_fallback_review(agent_type, str(result))
-                successful_reviews.append(fallback_review)
-            else:
-                successful_reviews.append(result)
+    async def _run_agent_reviews(
+        self,
+        document: DocumentContext,
+        on_agent_review: Optional[Callable[[AgentReview], None]] = None
+    ) -> List[AgentReview]:
+        """Run all agent reviews in parallel, reusing cached reviews of the same document."""
+        agent_types = list(self.agents.keys())
+        agents = list(self.agents.values())
+        
+        reviews: List[Optional[AgentReview]] = [None] * len(agents)
+        cache_keys: List[Optional[str]] = [None] * len(agents)
+        if self.review_cache:
+            document_hash = hashlib.sha256(document.full_text.encode('utf-8')).hexdigest()
+            cache_keys = [self._review_cache_key(agent, document_hash) for agent in agents]
+            cached = await asyncio.gather(*(self.review_cache.get(key) for key in cache_keys))
+            for i, value in enumerate(cached):
+                if value is not None:
+                    reviews[i] = self._load_cached_review(value)
+        
+        pending = [i for i, review in enumerate(reviews) if review is None]
+        if len(pending) < len(agents):
+            self.logger.info(f"Reusing {len(agents) - len(pending)} cached agent review(s)")
+            if on_agent_review:
+                for review in reviews:
+                    if review is not None:
+                        on_agent_review(review)
+        
+        # Wait for the remaining reviews; failures come back as fallback reviews, not exceptions
+        results = await asyncio.gather(
+            *(self._safe_review(agent_types[i], agents[i], document, cache_keys[i], on_agent_review) for i in pending)
+        )
+        for i, review in zip(pending, results):
+            reviews[i] = review
         
-        return successful_reviews
+        return reviews
+    
+    async def _safe_review(
+        self,
+        agent_type: str,
+        agent,
+        document: DocumentContext,
+        cache_key: Optional[str],
+        on_agent_review: Optional[Callable[[AgentReview], None]] = None
+    ) -> AgentReview:
+        """Run one agent's review, caching it on success and replacing it with a fallback review on failure."""
+        try:
+            review = await review_with_timeout(agent, document, self.agent_timeout)
+        except Exception as e:
+            self.logger.error(f"Agent {agent_type} failed: {e}")
+            review = self._create_fallback_review(agent_type, str(e))
+        else:
+            if self.review_cache and self._is_cacheable_review(review):
+                await self.review_cache.set(cache_key, review.to_json().decode('utf-8'))
+        
+        if on_agent_review:
+            on_agent_review(review)
+        return review
+    
+    def _review_cache_key(self, agent, document_hash: str) -> str:
+        """Build the cache key for an agent's review of a document."""
+        return LLMCache.make_key({
+            "kind": "agent_review",
+            "agent_type": agent.agent_type,
+            "provider": self.llm_client.provider.value,
+            "model": self.llm_client.model,
+            "document": document_hash,
+            "requirements": agent.requirements.model_dump()
+        })
+    
+    def _load_cached_review(self, value: str) -> Optional[AgentReview]:
+        """Rebuild a cached review, treating unreadable entries as misses."""
+        try:
+            return AgentReview.from_dict(json.loads(value))
+        except (ValueError, TypeError, KeyError) as e:
+            self.logger.warning(f"Ignoring unreadable cached review: {e}")
+            return None
+    
+    @staticmethod
+    def _is_cacheable_review(result: Any) -> bool:
+        """Only reviews whose categories were all evaluated successfully are cached."""
+        return isinstance(result, AgentReview) and not any(
+            evaluation.failed for evaluation in result.category_evaluations
+        )
     
     def _create_fallback_review(self, agent_type: str, error_message: str) -> AgentReview:
         """Create a fallback review when an agent fails."""
@@ -193,19 +405,18 @@ class LaunchDocReviewer:
         if not agent_reviews:
             return 0.0
         
-        total_weighted_score = 0.0
-        total_weight = 0.0
+        scores = [review.overall_score for review in agent_reviews]
         
-        for review in agent_reviews:
-            weight = scoring_config.weights.get(review.agent_type, 0.0)
-            total_weighted_score += review.overall_score * weight
-            total_weight += weight
+        # Reviews from _run_agent_reviews come back in agent order
+        weights = self._agent_weights
+        if len(weights) != len(agent_reviews):
+            weights = [scoring_config.weights.get(review.agent_type, 0.0) for review in agent_reviews]
         
-        if total_weight == 0:
+        if not any(weights):
             # Fallback to equal weighting
-            return sum(review.overall_score for review in agent_reviews) / len(agent_reviews)
+            return round(statistics.fmean(scores), 2)
         
-        return round(total_weighted_score, 2)
+        return round(weighted_total(scores, weights), 2)
     
     async def _generate_overall_summary(self, agent_reviews: List[AgentReview], overall_score: float) -> str:
         """Generate an overall summary across all agent reviews."""
@@ -216,16 +427,14 @@ class LaunchDocReviewer:
             agent_summaries.append(f"{review.agent_name}: {review.summary}")
         
         # Determine overall assessment
-        thresholds = self.requirements_manager.get_scoring_config().thresholds
-        
-        if overall_score >= thresholds.get("excellent", 8.5):
-            assessment = "Excellent"
-        elif overall_score >= thresholds.get("good", 7.0):
-            assessment = "Good"
-        elif overall_score >= thresholds.get("acceptable", 5.5):
-            assessment = "Acceptable"
-        else:
-            assessment = "Needs Improvement"
+        assessment = next(
+            (
+                assessment
+                for minimum_score, assessment in self.requirements_manager.get_scoring_config().assessment_thresholds
+                if overall_score >= minimum_score
+            ),
+            "Needs Improvement"
+        )
         
         summary = f"{assessment} launch document readiness (Score: {overall_score}/10). "
         
@@ -244,25 +453,27 @@ class LaunchDocReviewer:
     def _consolidate_recommendations(self, agent_reviews: List[AgentReview]) -> List[str]:
         """Consolidate recommendations from all agents."""
         all_recommendations = []
+        seen = set()
         
         for review in agent_reviews:
             # Add top recommendations from each agent
             for rec in review.recommendations[:2]:  # Top 2 from each agent
-                if rec not in all_recommendations:  # Avoid duplicates
-                    all_recommendations.append(f"[{review.agent_type.upper()}] {rec}")
+                tagged = f"[{review.agent_type.upper()}] {rec}"
+                if tagged not in seen:  # Avoid duplicates
+                    seen.add(tagged)
+                    all_recommendations.append(tagged)
         
         return all_recommendations[:8]  # Limit to top 8 overall
     
     def _assess_overall_confidence(self, agent_reviews: List[AgentReview]) -> str:
         """Assess overall confidence level."""
-        confidence_scores = {"High": 3, "Medium": 2, "Low": 1}
-        
         if not agent_reviews:
             return "Low"
         
         # Calculate average confidence
-        total_confidence = sum(confidence_scores.get(review.confidence_level, 1) for review in agent_reviews)
-        avg_confidence = total_confidence / len(agent_reviews)
+        avg_confidence = statistics.fmean(
+            self.CONFIDENCE_SCORES.get(review.confidence_level, 1) for review in agent_reviews
+        )
         
         if avg_confidence >= 2.5:
             return "High"
@@ -273,41 +484,45 @@ class LaunchDocReviewer:
     
     def format_review_results(self, result: ReviewResult) -> str:
         """Format review results for display."""
-        lines = []
-        lines.append("="*80)
-        lines.append("LAUNCH DOCUMENT REVIEW RESULTS")
-        lines.append("="*80)
-        lines.append(f"Document: {result.document_title}")
-        lines.append(f"URL: {result.document_url}")
-        lines.append(f"Review Date: {result.review_timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"Overall Score: {result.overall_score}/10")
-        lines.append(f"Assessment: {result.summary}")
-        lines.append(f"Confidence: {result.confidence_level}")
-        lines.append("")
+        buffer = io.StringIO()
+        write = buffer.write
+        
+        write(RULE)
+        write("\nLAUNCH DOCUMENT REVIEW RESULTS\n")
+        write(RULE)
+        write(f"\nDocument: {result.document_title}\n")
+        write(f"URL: {result.document_url}\n")
+        write(f"Review Date: {result.formatted_timestamp}\n")
+        write(f"Overall Score: {result.overall_score}/10\n")
+        write(f"Assessment: {result.summary}\n")
+        write(f"Confidence: {result.confidence_level}\n\n")
         
         # Agent-specific results
-        lines.append("DETAILED AGENT REVIEWS:")
-        lines.append("-" * 40)
+        write("DETAILED AGENT REVIEWS:\n")
+        write(SECTION_RULE)
+        write("\n")
         
         for review in result.agent_reviews:
-            lines.append(f"\n{review.agent_name.upper()} (Score: {review.overall_score}/10)")
-            lines.append(f"Summary: {review.summary}")
+            write(f"\n{review.agent_name.upper()} (Score: {review.overall_score}/10)\n")
+            write(f"Summary: {review.summary}\n")
             
             if review.key_issues:
-                lines.append(f"Key Issues: {', '.join(review.key_issues)}")
+                write(f"Key Issues: {', '.join(review.key_issues)}\n")
             
             if review.category_evaluations:
-                lines.append("Category Scores:")
+                write("Category Scores:\n")
                 for cat_eval in review.category_evaluations:
-                    lines.append(f"  • {cat_eval.category}: {cat_eval.score}/10")
+                    write(f"  • {cat_eval.category}: {cat_eval.score}/10\n")
         
         # Recommendations
         if result.key_recommendations:
-            lines.append("\nKEY RECOMMENDATIONS:")
-            lines.append("-" * 20)
+            write("\nKEY RECOMMENDATIONS:\n")
+            write(SUBSECTION_RULE)
+            write("\n")
             for i, rec in enumerate(result.key_recommendations, 1):
-                lines.append(f"{i}. {rec}")
+                write(f"{i}. {rec}\n")
         
-        lines.append("\n" + "="*80)
+        write("\n")
+        write(RULE)
         
-        return "\n".join(lines)
\ No newline at end of file
+        return buffer.getvalue()
\ No newline at end of file
@@ -5,24 +5,21 @@ Multi-agent system for evaluating launch documents using LLMs.
 """
 
 import asyncio
-import json
 import logging
 import os
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Union
 
 import click
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
-from rich.table import Table
 from dotenv import load_dotenv
 
-from .launch_doc_reviewer import LaunchDocReviewer
-from .requirements_manager import RequirementsManager
-from .utils.llm_client import LLMClientFactory
-from .requirements_wizard import run_requirements_wizard
-from .template_manager import get_template_manager
+# Reviewer, LLM, requirements and template modules are imported inside the commands
+# that use them, so lightweight commands don't pay for loading the whole system
+if TYPE_CHECKING:
+    from .launch_doc_reviewer import ReviewResult
 
 # Load environment variables
 load_dotenv()
@@ -37,8 +34,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Display color for each whole score from 0 to 10: below 5 red, below 7 yellow, otherwise green
+SCORE_COLORS = ("red",) * 5 + ("yellow",) * 2 + ("green",) * 4
 
-@click.group()
+
+@click.group(context_settings={'auto_envvar_prefix': 'LDR'})
 @click.version_option(version="1.0.0")
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
 def cli(verbose):
@@ -49,7 +49,7 @@ def cli(verbose):
 
 @cli.command()
 @click.option('--doc', '-d', required=True, help='Google Docs URL to review')
-@click.option('--requirements', '-r', required=True, help='Path to requirements YAML file')
+@click.option('--requirements', '-r', required=True, help='Path to requirements YAML or JSON file')
 @click.option('--output', '-o', help='Output file for JSON results')
 @click.option('--llm-provider', help='LLM provider (openai, anthropic, ollama, local)')
 @click.option('--llm-model', help='Specific LLM model to use')
@@ -57,18 +57,38 @@ def cli(verbose):
 @click.option('--google-credentials', help='Path to Google API credentials')
 @click.option('--oauth-port', type=int, default=8080, help='Port for Google OAuth redirect (default: 8080)')
 @click.option('--format', 'output_format', type=click.Choice(['text', 'json']), default='text', help='Output format')
-def review(doc, requirements, output, llm_provider, llm_model, base_url, google_credentials, oauth_port, output_format):
+@click.option('--cache/--no-cache', default=None,
+              help='Reuse LLM responses and agent reviews from earlier runs (file cache), or disable caching. Defaults to LLM_CACHE')
+def review(doc, requirements, output, llm_provider, llm_model, base_url, google_credentials, oauth_port, output_format, cache):
     """Review a launch document from Google Docs."""
+    from rich.console import Group
+    from rich.live import Live
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from .launch_doc_reviewer import LaunchDocReviewer
+    from .requirements_manager import RequirementsManager
+    from .utils.llm_client import LLMClientFactory
+    
+    # The cache is configured from LLM_CACHE when the reviewer's LLM client is created
+    if cache is not None:
+        os.environ['LLM_CACHE'] = 'file' if cache else 'off'
     
     async def run_review():
         try:
-            # Validate inputs
-            if not Path(requirements).exists():
+            # Validate inputs; the requirements are parsed up front so mistakes surface before
+            # the slower reviewer setup, and the reviewer reuses them instead of parsing again
+            requirements_manager = RequirementsManager()
+            try:
+                requirements_manager.load_requirements(requirements)
+            except FileNotFoundError:
                 console.print(f"[red]Error: Requirements file not found: {requirements}[/red]")
                 sys.exit(1)
+            except ValueError as e:
+                console.print(f"[red]Error: Invalid requirements file: {e}[/red]")
+                sys.exit(1)
             
-            # Check for available providers
-            available_providers = LLMClientFactory.get_available_providers()
+            # Check for available providers, unless one was chosen explicitly; the reviewer's
+            # LLM client reports a provider that is not usable
+            available_providers = [llm_provider] if llm_provider else LLMClientFactory.get_available_providers()
             if not available_providers:
                 console.print("[red]Error: No LLM providers available. Please configure at least one.[/red]")
                 console.print("Configuration options:")
@@ -81,14 +101,22 @@ def review(doc, requirements, output, llm_provider, llm_model, base_url, google_
             console.print(Panel.fit("🚀 Launch Document Reviewer", style="blue bold"))
             console.print(f"Document: {doc}")
             console.print(f"Requirements: {requirements}")
-            console.print(f"Available LLM providers: {', '.join(available_providers)}")
+            if llm_provider:
+                console.print(f"LLM provider: {llm_provider}")
+            else:
+                console.print(f"Available LLM providers: {', '.join(available_providers)}")
             
-            # Initialize reviewer
-            with Progress(
+            # Initialize reviewer; in text format, agent rows are added to the table below the
+            # progress line as each agent finishes
+            progress = Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 console=console
-            ) as progress:
+            )
+            agent_table = create_agent_table() if output_format == 'text' else None
+            live_display = Group(progress, agent_table) if agent_table else progress
+            
+            with Live(live_display, console=console, refresh_per_second=4):
                 
                 task = progress.add_task("Initializing reviewer...", total=None)
                 
@@ -98,7 +126,8 @@ def review(doc, requirements, output, llm_provider, llm_model, base_url, google_
                         llm_model=llm_model,
                         base_url=base_url,
                         google_credentials_path=google_credentials,
-                        oauth_port=oauth_port
+                        oauth_port=oauth_port,
+                        requirements_manager=requirements_manager
                     )
                     progress.update(task, description="✅ Reviewer initialized")
                 except Exception as e:
@@ -108,8 +137,18 @@ def review(doc, requirements, output, llm_provider, llm_model, base_url, google_
                 
                 # Run review
                 progress.update(task, description="Running document review...")
+                completed_agents = []
+                
+                def agent_review_done(agent_review):
+                    completed_agents.append(agent_review.agent_name)
+                    progress.update(task, description=f"Running document review... ✅ {', '.join(completed_agents)}")
+                    if agent_table:
+                        add_agent_row(agent_table, agent_review)
+                
                 try:
-                    result = await reviewer.review_document(doc, requirements)
+                    # Closing the reviewer releases its LLM session; run_async closes the shared SDK clients
+                    async with reviewer:
+                        result = await reviewer.review_document(doc, requirements, on_agent_review=agent_review_done)
                     progress.update(task, description="✅ Review completed")
                 except Exception as e:
                     progress.update(task, description=f"❌ Review failed: {e}")
@@ -118,50 +157,21 @@ def review(doc, requirements, output, llm_provider, llm_model, base_url, google_
             
             # Display results
             if output_format == 'json':
-                result_dict = {
-                    'document_url': result.document_url,
-                    'document_title': result.document_title,
-                    'review_timestamp': result.review_timestamp.isoformat(),
-                    'overall_score': result.overall_score,
-                    'summary': result.summary,
-                    'confidence_level': result.confidence_level,
-                    'agent_reviews': [
-                        {
-                            'agent_name': review.agent_name,
-                            'agent_type': review.agent_type,
-                            'score': review.overall_score,
-                            'summary': review.summary,
-                            'key_issues': review.key_issues,
-                            'recommendations': review.recommendations,
-                            'confidence_level': review.confidence_level,
-                            'category_evaluations': [
-                                {
-                                    'category': cat.category,
-                                    'score': cat.score,
-                                    'weight': cat.weight,
-                                    'reasoning': cat.reasoning
-                                }
-                                for cat in review.category_evaluations
-                            ]
-                        }
-                        for review in result.agent_reviews
-                    ],
-                    'key_recommendations': result.key_recommendations
-                }
-                
+                result_json = result.to_json(indent=True)
                 if output:
-                    with open(output, 'w') as f:
-                        json.dump(result_dict, f, indent=2)
+                    await write_output_file(output, result_json)
                     console.print(f"[green]Results saved to {output}[/green]")
                 else:
-                    console.print(json.dumps(result_dict, indent=2))
+                    # Raw bytes, so rich neither wraps nor styles the JSON
+                    sys.stdout.flush()
+                    sys.stdout.buffer.write(result_json + b"\n")
+                    sys.stdout.buffer.flush()
             else:
-                # Text format
-                display_review_results(result)
+                # Text format; the agent table is already on screen
+                display_review_results(result, show_agent_table=False)
                 
                 if output:
-                    with open(output, 'w') as f:
-                        f.write(reviewer.format_review_results(result))
+                    await write_output_file(output, reviewer.format_review_results(result))
                     console.print(f"[green]Results saved to {output}[/green]")
         
         except KeyboardInterrupt:
@@ -173,13 +183,15 @@ def review(doc, requirements, output, llm_provider, llm_model, base_url, google_
             sys.exit(1)
     
     # Run async function
-    asyncio.run(run_review())
+    run_async(run_review())
 
 
 @cli.command()
-@click.option('--file', '-f', default='requirements.yaml', help='Requirements file path')
+@click.option('--file', '-f', default='requirements.yaml', help='Requirements file path (.json for JSON, otherwise YAML)')
 def init_requirements(file):
     """Initialize a sample requirements file."""
+    from .requirements_manager import RequirementsManager
+    
     try:
         req_manager = RequirementsManager()
         output_path = req_manager.create_sample_requirements(file)
@@ -200,6 +212,8 @@ def init_requirements(file):
 @cli.command()
 def setup_requirements():
     """Interactive wizard to create customized requirements."""
+    from .requirements_wizard import run_requirements_wizard
+    
     try:
         output_file = run_requirements_wizard()
         console.print(f"\n[green]🎉 Success! Your custom requirements have been saved.[/green]")
@@ -223,6 +237,8 @@ def setup_requirements():
 @click.option('--industry', help='Filter templates by industry (healthcare, financial_services, etc.)')
 def list_templates(doc_type, difficulty, industry):
     """List available requirements templates."""
+    from .template_manager import get_template_manager
+    
     try:
         template_manager = get_template_manager()
         
@@ -252,6 +268,9 @@ def list_templates(doc_type, difficulty, industry):
 @click.option('--preview', is_flag=True, help='Preview template without saving')
 def use_template(template_id, file, preview):
     """Use a predefined requirements template."""
+    import yaml
+    from .template_manager import get_template_manager
+    
     try:
         template_manager = get_template_manager()
         template = template_manager.get_template_by_id(template_id)
@@ -271,8 +290,11 @@ def use_template(template_id, file, preview):
         requirements['metadata']['last_updated'] = 'auto-generated'
         requirements['metadata']['created_from_template'] = template.name
         
-        with open(file, 'w', encoding='utf-8') as f:
-            yaml.dump(requirements, f, default_flow_style=False, sort_keys=False, indent=2)
+        # libyaml's emitter when PyYAML was built with it
+        dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+        # Serialized in memory and written in one call rather than streamed node by node
+        content = yaml.dump(requirements, Dumper=dumper, default_flow_style=False, sort_keys=False, indent=2)
+        Path(file).write_text(content, encoding='utf-8')
         
         console.print(Panel.fit(f"📋 Template Applied: {template.name}", style="green bold"))
         console.print(f"Requirements saved to: {file}")
@@ -292,6 +314,8 @@ def use_template(template_id, file, preview):
 @click.argument('requirements_file', type=click.Path(exists=True))
 def validate_requirements(requirements_file):
     """Validate a requirements YAML file for errors and best practices."""
+    from .template_manager import get_template_manager
+    
     try:
         template_manager = get_template_manager()
         issues = template_manager.validate_requirements_file(requirements_file)
@@ -309,6 +333,8 @@ def validate_requirements(requirements_file):
 @cli.command()
 def list_industries():
     """List available industry-specific templates."""
+    from .template_manager import get_template_manager
+    
     try:
         template_manager = get_template_manager()
         industries = template_manager.get_industries()
@@ -334,6 +360,8 @@ def list_industries():
 @cli.command()
 def check_setup():
     """Check system setup and configuration."""
+    from .utils.llm_client import LLMClientFactory
+    
     console.print(Panel.fit("🔍 System Setup Check", style="blue bold"))
     
     # Check Python version
@@ -356,12 +384,17 @@ def check_setup():
         console.print("  - ANTHROPIC_API_KEY (for Anthropic)")
         console.print("  - aiohttp installed (for local models)")
     else:
+        # Check if local services are reachable, probing them all at once
+        local_urls = {
+            provider: os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434') if provider == 'ollama' else os.getenv('LOCAL_BASE_URL', 'http://localhost:8000')
+            for provider in available_providers if provider in ['ollama', 'local']
+        }
+        service_status = LLMClientFactory.check_local_services(list(dict.fromkeys(local_urls.values())))
+        
         for provider in available_providers:
-            if provider in ['ollama', 'local']:
-                # Check if local services are reachable
-                base_url = os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434') if provider == 'ollama' else os.getenv('LOCAL_BASE_URL', 'http://localhost:8000')
-                service_available = LLMClientFactory.check_local_service_availability(base_url)
-                status = "✅" if service_available else "⚠️"
+            if provider in local_urls:
+                base_url = local_urls[provider]
+                status = "✅" if service_status[base_url] else "⚠️"
                 console.print(f"{status} {provider.capitalize()} service: {base_url}")
             else:
                 console.print(f"✅ {provider.capitalize()}: configured")
@@ -398,11 +431,68 @@ def check_setup():
         console.print(f"[red]⚠️ Missing dependency: {e}[/red]")
 
 
-def display_review_results(result):
-    """Display review results in rich format."""
+def run_async(coro):
+    """Run a coroutine to completion, on uvloop when it is installed, then close shared LLM connections."""
+    async def run_and_close():
+        from .utils.llm_client import LLMClient
+        try:
+            return await coro
+        finally:
+            await LLMClient.close_shared_clients()
     
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(run_and_close())
+    return uvloop.run(run_and_close())
+
+
+async def write_output_file(path: str, data: Union[str, bytes]) -> None:
+    """Write review output to a file in a worker thread, keeping the event loop responsive."""
+    def write():
+        with open(path, 'wb' if isinstance(data, bytes) else 'w') as f:
+            f.write(data)
+    
+    await asyncio.get_running_loop().run_in_executor(None, write)
+
+
+def score_color_for(score: float) -> str:
+    """Get the display color for a 0-10 score."""
+    return SCORE_COLORS[min(max(int(score), 0), 10)]
+
+
+def truncate(text: str, limit: int) -> str:
+    """Shorten text to `limit` characters, marking cut text with an ellipsis."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def create_agent_table():
+    """Create the empty agent evaluations table."""
+    from rich.table import Table
+    
+    table = Table(title="🤖 Agent Evaluations", show_header=True, header_style="bold magenta")
+    table.add_column("Agent", style="cyan", no_wrap=True)
+    table.add_column("Score", justify="center")
+    table.add_column("Confidence", justify="center")
+    table.add_column("Summary", style="dim")
+    return table
+
+
+def add_agent_row(table, review) -> None:
+    """Add an agent's review to the agent evaluations table."""
+    score_style = score_color_for(review.overall_score)
+    table.add_row(
+        review.agent_name,
+        f"[{score_style}]{review.overall_score}/10[/{score_style}]",
+        review.confidence_level,
+        truncate(review.summary, 80)
+    )
+
+
+def display_review_results(result: "ReviewResult", show_agent_table: bool = True) -> None:
+    """Display review results in rich format."""
     # Overall score panel
-    score_color = "green" if result.overall_score >= 7 else "yellow" if result.overall_score >= 5 else "red"
+    score_color = score_color_for(result.overall_score)
     score_panel = Panel.fit(
         f"Overall Score: {result.overall_score}/10\n{result.summary}",
         title="📊 Review Results",
@@ -411,22 +501,11 @@ def display_review_results(result):
     console.print(score_panel)
     
     # Agent scores table
-    table = Table(title="🤖 Agent Evaluations", show_header=True, header_style="bold magenta")
-    table.add_column("Agent", style="cyan", no_wrap=True)
-    table.add_column("Score", justify="center")
-    table.add_column("Confidence", justify="center")
-    table.add_column("Summary", style="dim")
-    
-    for review in result.agent_reviews:
-        score_style = "green" if review.overall_score >= 7 else "yellow" if review.overall_score >= 5 else "red"
-        table.add_row(
-            review.agent_name,
-            f"[{score_style}]{review.overall_score}/10[/{score_style}]",
-            review.confidence_level,
-            review.summary[:80] + "..." if len(review.summary) > 80 else review.summary
-        )
-    
-    console.print(table)
+    if show_agent_table:
+        table = create_agent_table()
+        for review in result.agent_reviews:
+            add_agent_row(table, review)
+        console.print(table)
     
     # Recommendations
     if result.key_recommendations:
@@ -437,7 +516,7 @@ def display_review_results(result):
     # Metadata
     console.print(f"\n📄 Document: {result.document_title}")
     console.print(f"🔗 URL: {result.document_url}")
-    console.print(f"⏰ Review Date: {result.review_timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+    console.print(f"⏰ Review Date: {result.formatted_timestamp}")
 
 
 if __name__ == '__main__':
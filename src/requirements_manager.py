@@ -1,503 +1,666 @@
 """
-Requirements management system for loading and validating agent requirements from YAML files.
+Requirements management system for loading and validating agent requirements from YAML or JSON files.
 """
 
+import os
+import sys
+import json
+import math
 import yaml
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from functools import lru_cache
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-class RequirementCriterion(BaseModel):
-    """Individual criterion within a requirement category."""
-    name: str
-    description: Optional[str] = None
-    weight: float = 1.0
+if TYPE_CHECKING:
+    from .requirements_models import (
+        RequirementCriterion, RequirementCategory, AgentRequirement, ScoringConfig, RequirementsSpec
+    )
+
+
+# libyaml's C parser and emitter when PyYAML was built with them
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Pydantic models live in requirements_models and are only imported once a spec is built,
+# so commands that never parse requirements skip building their validators
+MODEL_NAMES = frozenset({
+    "ASSESSMENT_LEVELS", "RequirementCriterion", "RequirementCategory",
+    "AgentRequirement", "ScoringConfig", "RequirementsSpec"
+})
+
+
+# Strings shorter than this (agent types, category and criterion names, threshold keys) are interned
+INTERN_MAX_LENGTH = 64
+
+
+def __getattr__(name: str) -> Any:
+    """Re-export the requirements models, importing them on first access."""
+    if name in MODEL_NAMES:
+        from . import requirements_models
+        return getattr(requirements_models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Contents of the sample requirements file written by create_sample_requirements
+SAMPLE_REQUIREMENTS = {
+    "metadata": {
+        "version": "1.0",
+        "description": "Launch document review requirements for multi-agent system",
+        "last_updated": None,  # Set to the creation date
+        "created_by": "Launch Doc Reviewer System"
+    },
+    "agents": [
+        {
+            "type": "product_manager",
+            "name": "Product Manager Agent",
+            "description": "Evaluates business strategy, market fit, and product requirements",
+            "requirements": [
+                {
+                    "category": "Market Analysis",
+                    "description": "Assessment of market opportunity and competitive landscape",
+                    "weight": 25,
+                    "criteria": [
+                        {
+                            "name": "Target Market Definition",
+                            "description": "Clear definition of target market segments and size",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Competitive Analysis",
+                            "description": "Analysis of competitive landscape and differentiation",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Market Opportunity",
+                            "description": "Quantification of market size and growth potential",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Customer Personas",
+                            "description": "Well-defined customer personas and use cases",
+                            "weight": 1.0
+                        }
+                    ]
+                },
+                {
+                    "category": "Product Strategy",
+                    "description": "Product vision, goals, and strategic direction",
+                    "weight": 25,
+                    "criteria": [
+                        {
+                            "name": "Product Vision",
+                            "description": "Clear product vision and value proposition",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Success Metrics",
+                            "description": "Well-defined KPIs and success criteria",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Feature Prioritization",
+                            "description": "Justified feature prioritization and roadmap",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Go-to-Market Strategy",
+                            "description": "Comprehensive go-to-market plan",
+                            "weight": 1.0
+                        }
+                    ]
+                },
+                {
+                    "category": "Business Case",
+                    "description": "Financial justification and business impact",
+                    "weight": 25,
+                    "criteria": [
+                        {
+                            "name": "Revenue Projections",
+                            "description": "Realistic revenue forecasts and assumptions",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Cost Analysis",
+                            "description": "Comprehensive cost structure and analysis",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Risk Assessment",
+                            "description": "Identification and mitigation of key risks",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "ROI Calculation",
+                            "description": "Return on investment calculations and timeline",
+                            "weight": 1.0
+                        }
+                    ]
+                },
+                {
+                    "category": "Stakeholder Alignment",
+                    "description": "Stakeholder management and alignment strategy",
+                    "weight": 25,
+                    "criteria": [
+                        {
+                            "name": "Stakeholder Identification",
+                            "description": "Complete identification of key stakeholders",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Approval Process",
+                            "description": "Clear sign-off and approval process",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Communication Plan",
+                            "description": "Comprehensive communication strategy",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Timeline and Milestones",
+                            "description": "Clear project timeline with key milestones",
+                            "weight": 1.0
+                        }
+                    ]
+                }
+            ]
+        },
+        {
+            "type": "data_scientist",
+            "name": "Data Scientist Agent",
+            "description": "Evaluates data requirements, analytics strategy, and measurement plans",
+            "requirements": [
+                {
+                    "category": "Data Requirements",
+                    "description": "Data sourcing, quality, and governance requirements",
+                    "weight": 30,
+                    "criteria": [
+                        {
+                            "name": "Data Sources",
+                            "description": "Clear identification of required data sources",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Data Quality Standards",
+                            "description": "Defined data quality requirements and validation",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Data Governance",
+                            "description": "Data governance framework and policies",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Privacy and Compliance",
+                            "description": "Privacy protection and regulatory compliance",
+                            "weight": 1.0
+                        }
+                    ]
+                },
+                {
+                    "category": "Analytics Strategy",
+                    "description": "Measurement methodology and statistical approach",
+                    "weight": 30,
+                    "criteria": [
+                        {
+                            "name": "Key Metrics Definition",
+                            "description": "Well-defined primary and secondary metrics",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Measurement Methodology",
+                            "description": "Clear measurement and analysis methodology",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Statistical Considerations",
+                            "description": "Statistical significance and power analysis",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Experimentation Strategy",
+                            "description": "A/B testing and experimentation framework",
+                            "weight": 1.0
+                        }
+                    ]
+                },
+                {
+                    "category": "Technical Implementation",
+                    "description": "Data infrastructure and technical architecture",
+                    "weight": 25,
+                    "criteria": [
+                        {
+                            "name": "Data Pipeline Architecture",
+                            "description": "Scalable data pipeline design and architecture",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Analytics Tools",
+                            "description": "Selection of appropriate analytics tools and platforms",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Processing Requirements",
+                            "description": "Real-time vs batch processing requirements",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Scalability Planning",
+                            "description": "Scalability considerations and capacity planning",
+                            "weight": 1.0
+                        }
+                    ]
+                },
+                {
+                    "category": "Reporting and Insights",
+                    "description": "Reporting strategy and stakeholder access",
+                    "weight": 15,
+                    "criteria": [
+                        {
+                            "name": "Dashboard Requirements",
+                            "description": "Dashboard and visualization requirements",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Automated Alerting",
+                            "description": "Automated alerting and monitoring strategy",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Visualization Standards",
+                            "description": "Data visualization standards and best practices",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Access Controls",
+                            "description": "Stakeholder access permissions and security",
+                            "weight": 1.0
+                        }
+                    ]
+                }
+            ]
+        },
+        {
+            "type": "engineering",
+            "name": "Engineering Agent",
+            "description": "Evaluates technical architecture, implementation plan, and operational readiness",
+            "requirements": [
+                {
+                    "category": "Technical Architecture",
+                    "description": "System design and technical specifications",
+                    "weight": 30,
+                    "criteria": [
+                        {
+                            "name": "System Architecture",
+                            "description": "Well-documented system architecture and design",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Technology Stack",
+                            "description": "Justified technology choices and stack selection",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Scalability Requirements",
+                            "description": "Scalability requirements and capacity planning",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Security Considerations",
+                            "description": "Security architecture and threat modeling",
+                            "weight": 1.0
+                        }
+                    ]
+                },
+                {
+                    "category": "Implementation Plan",
+                    "description": "Development planning and resource allocation",
+                    "weight": 25,
+                    "criteria": [
+                        {
+                            "name": "Development Timeline",
+                            "description": "Realistic development timeline and phases",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Resource Requirements",
+                            "description": "Clear resource and team requirements",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Dependency Management",
+                            "description": "Identification and management of dependencies",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Testing Strategy",
+                            "description": "Comprehensive testing strategy and coverage",
+                            "weight": 1.0
+                        }
+                    ]
+                },
+                {
+                    "category": "Operational Readiness",
+                    "description": "Production deployment and operational considerations",
+                    "weight": 25,
+                    "criteria": [
+                        {
+                            "name": "Monitoring Strategy",
+                            "description": "Comprehensive monitoring and alerting strategy",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Deployment Procedures",
+                            "description": "Deployment and rollback procedures",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Performance Benchmarks",
+                            "description": "Performance requirements and benchmarks",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Disaster Recovery",
+                            "description": "Disaster recovery and business continuity plan",
+                            "weight": 1.0
+                        }
+                    ]
+                },
+                {
+                    "category": "Quality Assurance",
+                    "description": "Code quality and testing standards",
+                    "weight": 20,
+                    "criteria": [
+                        {
+                            "name": "Code Quality Standards",
+                            "description": "Defined code quality standards and practices",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Test Coverage",
+                            "description": "Automated testing coverage and quality gates",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Security Testing",
+                            "description": "Security testing and vulnerability assessment",
+                            "weight": 1.0
+                        },
+                        {
+                            "name": "Performance Testing",
+                            "description": "Performance testing strategy and benchmarks",
+                            "weight": 1.0
+                        }
+                    ]
+                }
+            ]
+        }
+    ],
+    "scoring": {
+        "scale": "0-10",
+        "weights": {
+            "product_manager": 0.4,
+            "data_scientist": 0.3,
+            "engineering": 0.3
+        },
+        "thresholds": {
+            "excellent": 8.5,
+            "good": 7.0,
+            "acceptable": 5.5,
+            "needs_improvement": 3.0
+        }
+    }
+}
+
+
+# Stands in for the creation date in the rendered sample YAML
+SAMPLE_DATE_PLACEHOLDER = "__LAST_UPDATED__"
+
+
+@lru_cache(maxsize=None)
+def sample_requirements_yaml() -> bytes:
+    """SAMPLE_REQUIREMENTS rendered as YAML once per process, with SAMPLE_DATE_PLACEHOLDER as its date."""
+    data = {
+        **SAMPLE_REQUIREMENTS,
+        "metadata": {**SAMPLE_REQUIREMENTS["metadata"], "last_updated": SAMPLE_DATE_PLACEHOLDER}
+    }
+    return yaml.dump(
+        data, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False, indent=2
+    ).encode('utf-8')
+
+
+def is_json_file(path: str) -> bool:
+    """Whether a requirements file is JSON rather than YAML, going by its extension."""
+    return Path(path).suffix.lower() == ".json"
+
+
+def render_json(data: Dict[str, Any]) -> bytes:
+    """Serialize requirements data to indented UTF-8 JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def construct_spec(data: Dict[str, Any]) -> "RequirementsSpec":
+    """
+    Build a RequirementsSpec from trusted data without running validation.
+    
+    Only for data known to be valid, such as the built-in sample; defaults are still applied.
+    """
+    from .requirements_models import (
+        RequirementCriterion, RequirementCategory, AgentRequirement, ScoringConfig, RequirementsSpec
+    )
+    
+    agents = [
+        AgentRequirement.model_construct(**{
+            **agent,
+            "requirements": [
+                RequirementCategory.model_construct(**{
+                    **category,
+                    "criteria": [RequirementCriterion.model_construct(**criterion) for criterion in category["criteria"]]
+                })
+                for category in agent["requirements"]
+            ]
+        })
+        for agent in data["agents"]
+    ]
+    return RequirementsSpec.model_construct(
+        metadata=data["metadata"],
+        agents=agents,
+        scoring=ScoringConfig.model_construct(**data.get("scoring", {}))
+    )
+
+
+def intern_strings(value: Any) -> Any:
+    """Intern the short strings in parsed YAML so values repeated across agents share one object."""
+    if isinstance(value, str):
+        return sys.intern(value) if len(value) < INTERN_MAX_LENGTH else value
+    if isinstance(value, dict):
+        return {intern_strings(key): intern_strings(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [intern_strings(item) for item in value]
+    return value
+
+
+def parse_spec(path: str, trusted: bool = False) -> "RequirementsSpec":
+    """Parse a requirements YAML or JSON file into a RequirementsSpec."""
+    # Read in one call; the parser decodes the UTF-8 bytes itself
+    content = Path(path).read_bytes()
+    if is_json_file(path):
+        # JSON parses far faster than YAML, so generated or production files can skip the YAML parser
+        data = orjson.loads(content) if ORJSON_AVAILABLE else json.loads(content)
+    else:
+        data = yaml.load(content, Loader=YAML_LOADER)
+    data = intern_strings(data)
+    if trusted:
+        return construct_spec(data)
     
-    @validator('weight')
-    def weight_must_be_positive(cls, v):
-        if v <= 0:
-            raise ValueError('Weight must be positive')
-        return v
-
-
-class RequirementCategory(BaseModel):
-    """Category of requirements with multiple criteria."""
-    category: str
-    description: Optional[str] = None
-    criteria: List[RequirementCriterion]
-    weight: float = Field(default=25.0, ge=0, le=100)
+    from .requirements_models import RequirementsSpec
+    return RequirementsSpec.model_validate(data)
+
+
+@lru_cache(maxsize=32)
+def _parse_spec_version(path: str, mtime_ns: int, size: int, trusted: bool) -> "RequirementsSpec":
+    """parse_spec() memoized per file version; the modification time and size only key the cache."""
+    return parse_spec(path, trusted)
+
+
+def file_version(file_path: str) -> Optional[Tuple[str, int, int]]:
+    """Identify a requirements file version by path, modification time and size."""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+def load_spec_version(
+    file_path: str,
+    trusted: bool = False
+) -> Tuple["RequirementsSpec", Optional[Tuple[str, int, int]]]:
+    """
+    Load requirements from a YAML or JSON file, along with the file_version() they were read at.
     
-    @validator('criteria')
-    def must_have_criteria(cls, v):
-        if not v:
-            raise ValueError('Category must have at least one criterion')
-        return v
-
-
-class AgentRequirement(BaseModel):
-    """Requirements specification for a single agent."""
-    type: str
-    name: str
-    description: str
-    requirements: List[RequirementCategory]
+    Specs are frozen and unchanged files are served from the parse cache, so the returned
+    spec is shared rather than copied and can be passed between threads and agents as is.
     
-    @validator('requirements')
-    def must_have_requirements(cls, v):
-        if not v:
-            raise ValueError('Agent must have at least one requirement category')
-        return v
+    Args:
+        file_path: Path to the requirements file; files ending in .json are read as JSON
+        trusted: Skip validation, for files known to be valid (e.g. generated by this tool)
+    """
+    # No exists() pre-check: a missing file surfaces as FileNotFoundError from the read itself
+    try:
+        # Taken before reading, so a concurrent edit makes the version look stale rather than current
+        version = file_version(file_path)
+        if version is None:
+            return parse_spec(file_path, trusted), version
+        return _parse_spec_version(*version, trusted), version
+        
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Requirements file not found: {file_path}") from None
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML format: {e}")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON format: {e}")
+    except Exception as e:
+        raise ValueError(f"Failed to load requirements: {e}")
 
 
-class ScoringConfig(BaseModel):
-    """Scoring configuration for the review system."""
-    scale: str = "0-10"
-    weights: Dict[str, float] = Field(default_factory=dict)
-    thresholds: Dict[str, float] = Field(default_factory=lambda: {
-        "excellent": 8.5,
-        "good": 7.0,
-        "acceptable": 5.5,
-        "needs_improvement": 3.0
-    })
+def load_spec(file_path: str, trusted: bool = False) -> "RequirementsSpec":
+    """Load requirements from a YAML or JSON file; see load_spec_version()."""
+    return load_spec_version(file_path, trusted)[0]
 
 
-class RequirementsSpec(BaseModel):
-    """Complete requirements specification."""
-    metadata: Dict[str, Any]
-    agents: List[AgentRequirement]
-    scoring: ScoringConfig
+def get_agent(spec: "RequirementsSpec", agent_type: str) -> "AgentRequirement":
+    """Get a spec's requirements for an agent type."""
+    try:
+        return spec.agents_by_type[agent_type]
+    except KeyError:
+        raise ValueError(f"Agent type '{agent_type}' not found in requirements")
 
 
 class RequirementsManager:
-    """Manages loading, validation, and access to requirements specifications."""
+    """
+    Manages loading, validation, and access to requirements specifications.
+    
+    Holds the currently loaded spec for callers that want one object to pass around;
+    the spec itself is immutable, and the module functions work on specs directly.
+    """
     
     def __init__(self):
-        self.requirements: Optional[RequirementsSpec] = None
+        self.requirements: Optional["RequirementsSpec"] = None
         self._file_path: Optional[Path] = None
+        # file_version() of the file the current requirements were loaded from
+        self.loaded_version: Optional[Tuple[str, int, int]] = None
+        # The spec's agents and scoring config, kept so the getters skip the attribute lookups
+        self._agents: Optional[List["AgentRequirement"]] = None
+        self._scoring: Optional["ScoringConfig"] = None
     
-    def load_requirements(self, file_path: str) -> RequirementsSpec:
-        """Load requirements from YAML file."""
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Requirements file not found: {file_path}")
+    file_version = staticmethod(file_version)
+    
+    def _set_requirements(
+        self,
+        requirements: "RequirementsSpec",
+        path: Path,
+        version: Optional[Tuple[str, int, int]]
+    ):
+        """Make a spec the loaded one, along with the references the getters return."""
+        self.requirements = requirements
+        self._agents = requirements.agents
+        self._scoring = requirements.scoring
+        self._file_path = path
+        self.loaded_version = version
+    
+    def load_requirements(self, file_path: str, trusted: bool = False) -> "RequirementsSpec":
+        """
+        Load requirements from a YAML or JSON file.
         
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-            
-            self.requirements = RequirementsSpec(**data)
-            self._file_path = path
-            return self.requirements
-            
-        except yaml.YAMLError as e:
-            raise ValueError(f"Invalid YAML format: {e}")
-        except Exception as e:
-            raise ValueError(f"Failed to load requirements: {e}")
+        Args:
+            file_path: Path to the requirements file; files ending in .json are read as JSON
+            trusted: Skip validation, for files known to be valid (e.g. generated by this tool)
+        """
+        requirements, version = load_spec_version(file_path, trusted)
+        self._set_requirements(requirements, Path(file_path), version)
+        return requirements
     
-    def get_agent_requirements(self, agent_type: str) -> AgentRequirement:
+    def get_agent_requirements(self, agent_type: str) -> "AgentRequirement":
         """Get requirements for a specific agent type."""
         if not self.requirements:
             raise ValueError("Requirements not loaded. Call load_requirements() first.")
         
-        for agent in self.requirements.agents:
-            if agent.type == agent_type:
-                return agent
+        return get_agent(self.requirements, agent_type)
+    
+    def has_agent(self, agent_type: str) -> bool:
+        """Check whether the loaded requirements define an agent type."""
+        if not self.requirements:
+            raise ValueError("Requirements not loaded. Call load_requirements() first.")
         
-        raise ValueError(f"Agent type '{agent_type}' not found in requirements")
+        return agent_type in self.requirements.agent_types
     
-    def get_all_agents(self) -> List[AgentRequirement]:
+    def get_all_agents(self) -> List["AgentRequirement"]:
         """Get all agent requirements."""
-        if not self.requirements:
+        if self._agents is None:
             raise ValueError("Requirements not loaded. Call load_requirements() first.")
         
-        return self.requirements.agents
+        return self._agents
     
-    def get_scoring_config(self) -> ScoringConfig:
+    def get_scoring_config(self) -> "ScoringConfig":
         """Get scoring configuration."""
-        if not self.requirements:
+        if self._scoring is None:
             raise ValueError("Requirements not loaded. Call load_requirements() first.")
         
-        return self.requirements.scoring
+        return self._scoring
     
     def create_sample_requirements(self, file_path: str) -> str:
-        """Create a sample requirements file."""
+        """Create a sample requirements file, written as JSON when the path ends in .json."""
+        last_updated = datetime.now().strftime("%Y-%m-%d")
         sample_data = {
-            "metadata": {
-                "version": "1.0",
-                "description": "Launch document review requirements for multi-agent system",
-                "last_updated": datetime.now().strftime("%Y-%m-%d"),
-                "created_by": "Launch Doc Reviewer System"
-            },
-            "agents": [
-                {
-                    "type": "product_manager",
-                    "name": "Product Manager Agent",
-                    "description": "Evaluates business strategy, market fit, and product requirements",
-                    "requirements": [
-                        {
-                            "category": "Market Analysis",
-                            "description": "Assessment of market opportunity and competitive landscape",
-                            "weight": 25,
-                            "criteria": [
-                                {
-                                    "name": "Target Market Definition",
-                                    "description": "Clear definition of target market segments and size",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Competitive Analysis",
-                                    "description": "Analysis of competitive landscape and differentiation",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Market Opportunity",
-                                    "description": "Quantification of market size and growth potential",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Customer Personas",
-                                    "description": "Well-defined customer personas and use cases",
-                                    "weight": 1.0
-                                }
-                            ]
-                        },
-                        {
-                            "category": "Product Strategy",
-                            "description": "Product vision, goals, and strategic direction",
-                            "weight": 25,
-                            "criteria": [
-                                {
-                                    "name": "Product Vision",
-                                    "description": "Clear product vision and value proposition",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Success Metrics",
-                                    "description": "Well-defined KPIs and success criteria",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Feature Prioritization",
-                                    "description": "Justified feature prioritization and roadmap",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Go-to-Market Strategy",
-                                    "description": "Comprehensive go-to-market plan",
-                                    "weight": 1.0
-                                }
-                            ]
-                        },
-                        {
-                            "category": "Business Case",
-                            "description": "Financial justification and business impact",
-                            "weight": 25,
-                            "criteria": [
-                                {
-                                    "name": "Revenue Projections",
-                                    "description": "Realistic revenue forecasts and assumptions",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Cost Analysis",
-                                    "description": "Comprehensive cost structure and analysis",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Risk Assessment",
-                                    "description": "Identification and mitigation of key risks",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "ROI Calculation",
-                                    "description": "Return on investment calculations and timeline",
-                                    "weight": 1.0
-                                }
-                            ]
-                        },
-                        {
-                            "category": "Stakeholder Alignment",
-                            "description": "Stakeholder management and alignment strategy",
-                            "weight": 25,
-                            "criteria": [
-                                {
-                                    "name": "Stakeholder Identification",
-                                    "description": "Complete identification of key stakeholders",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Approval Process",
-                                    "description": "Clear sign-off and approval process",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Communication Plan",
-                                    "description": "Comprehensive communication strategy",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Timeline and Milestones",
-                                    "description": "Clear project timeline with key milestones",
-                                    "weight": 1.0
-                                }
-                            ]
-                        }
-                    ]
-                },
-                {
-                    "type": "data_scientist",
-                    "name": "Data Scientist Agent",
-                    "description": "Evaluates data requirements, analytics strategy, and measurement plans",
-                    "requirements": [
-                        {
-                            "category": "Data Requirements",
-                            "description": "Data sourcing, quality, and governance requirements",
-                            "weight": 30,
-                            "criteria": [
-                                {
-                                    "name": "Data Sources",
-                                    "description": "Clear identification of required data sources",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Data Quality Standards",
-                                    "description": "Defined data quality requirements and validation",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Data Governance",
-                                    "description": "Data governance framework and policies",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Privacy and Compliance",
-                                    "description": "Privacy protection and regulatory compliance",
-                                    "weight": 1.0
-                                }
-                            ]
-                        },
-                        {
-                            "category": "Analytics Strategy",
-                            "description": "Measurement methodology and statistical approach",
-                            "weight": 30,
-                            "criteria": [
-                                {
-                                    "name": "Key Metrics Definition",
-                                    "description": "Well-defined primary and secondary metrics",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Measurement Methodology",
-                                    "description": "Clear measurement and analysis methodology",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Statistical Considerations",
-                                    "description": "Statistical significance and power analysis",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Experimentation Strategy",
-                                    "description": "A/B testing and experimentation framework",
-                                    "weight": 1.0
-                                }
-                            ]
-                        },
-                        {
-                            "category": "Technical Implementation",
-                            "description": "Data infrastructure and technical architecture",
-                            "weight": 25,
-                            "criteria": [
-                                {
-                                    "name": "Data Pipeline Architecture",
-                                    "description": "Scalable data pipeline design and architecture",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Analytics Tools",
-                                    "description": "Selection of appropriate analytics tools and platforms",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Processing Requirements",
-                                    "description": "Real-time vs batch processing requirements",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Scalability Planning",
-                                    "description": "Scalability considerations and capacity planning",
-                                    "weight": 1.0
-                                }
-                            ]
-                        },
-                        {
-                            "category": "Reporting and Insights",
-                            "description": "Reporting strategy and stakeholder access",
-                            "weight": 15,
-                            "criteria": [
-                                {
-                                    "name": "Dashboard Requirements",
-                                    "description": "Dashboard and visualization requirements",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Automated Alerting",
-                                    "description": "Automated alerting and monitoring strategy",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Visualization Standards",
-                                    "description": "Data visualization standards and best practices",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Access Controls",
-                                    "description": "Stakeholder access permissions and security",
-                                    "weight": 1.0
-                                }
-                            ]
-                        }
-                    ]
-                },
-                {
-                    "type": "engineering",
-                    "name": "Engineering Agent",
-                    "description": "Evaluates technical architecture, implementation plan, and operational readiness",
-                    "requirements": [
-                        {
-                            "category": "Technical Architecture",
-                            "description": "System design and technical specifications",
-                            "weight": 30,
-                            "criteria": [
-                                {
-                                    "name": "System Architecture",
-                                    "description": "Well-documented system architecture and design",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Technology Stack",
-                                    "description": "Justified technology choices and stack selection",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Scalability Requirements",
-                                    "description": "Scalability requirements and capacity planning",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Security Considerations",
-                                    "description": "Security architecture and threat modeling",
-                                    "weight": 1.0
-                                }
-                            ]
-                        },
-                        {
-                            "category": "Implementation Plan",
-                            "description": "Development planning and resource allocation",
-                            "weight": 25,
-                            "criteria": [
-                                {
-                                    "name": "Development Timeline",
-                                    "description": "Realistic development timeline and phases",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Resource Requirements",
-                                    "description": "Clear resource and team requirements",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Dependency Management",
-                                    "description": "Identification and management of dependencies",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Testing Strategy",
-                                    "description": "Comprehensive testing strategy and coverage",
-                                    "weight": 1.0
-                                }
-                            ]
-                        },
-                        {
-                            "category": "Operational Readiness",
-                            "description": "Production deployment and operational considerations",
-                            "weight": 25,
-                            "criteria": [
-                                {
-                                    "name": "Monitoring Strategy",
-                                    "description": "Comprehensive monitoring and alerting strategy",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Deployment Procedures",
-                                    "description": "Deployment and rollback procedures",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Performance Benchmarks",
-                                    "description": "Performance requirements and benchmarks",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Disaster Recovery",
-                                    "description": "Disaster recovery and business continuity plan",
-                                    "weight": 1.0
-                                }
-                            ]
-                        },
-                        {
-                            "category": "Quality Assurance",
-                            "description": "Code quality and testing standards",
-                            "weight": 20,
-                            "criteria": [
-                                {
-                                    "name": "Code Quality Standards",
-                                    "description": "Defined code quality standards and practices",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Test Coverage",
-                                    "description": "Automated testing coverage and quality gates",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Security Testing",
-                                    "description": "Security testing and vulnerability assessment",
-                                    "weight": 1.0
-                                },
-                                {
-                                    "name": "Performance Testing",
-                                    "description": "Performance testing strategy and benchmarks",
-                                    "weight": 1.0
-                                }
-                            ]
-                        }
-                    ]
-                }
-            ],
-            "scoring": {
-                "scale": "0-10",
-                "weights": {
-                    "product_manager": 0.4,
-                    "data_scientist": 0.3,
-                    "engineering": 0.3
-                },
-                "thresholds": {
-                    "excellent": 8.5,
-                    "good": 7.0,
-                    "acceptable": 5.5,
-                    "needs_improvement": 3.0
-                }
-            }
+            **SAMPLE_REQUIREMENTS,
+            "metadata": {**SAMPLE_REQUIREMENTS["metadata"], "last_updated": last_updated}
         }
         
         try:
             path = Path(file_path)
             path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(path, 'w', encoding='utf-8') as f:
-                yaml.dump(sample_data, f, default_flow_style=False, sort_keys=False, indent=2)
+            if is_json_file(file_path):
+                path.write_bytes(render_json(sample_data))
+            else:
+                # The sample is only emitted once per process; each file just fills in the date.
+                # Quoted as the emitter would, so the date stays a string when read back
+                path.write_bytes(sample_requirements_yaml().replace(
+                    SAMPLE_DATE_PLACEHOLDER.encode(), f"'{last_updated}'".encode()
+                ))
+            
+            # The sample is known to be valid, so it is kept as loaded without parsing the file back
+            self._set_requirements(construct_spec(sample_data), path, self.file_version(str(path)))
             
             return str(path)
         except Exception as e:
@@ -512,7 +675,10 @@ class RequirementsManager:
         # Additional custom validation can be added here if needed
         
         # Check that agent weights sum to reasonable total
-        total_weight = sum(self.requirements.scoring.weights.values())
+        weights = self.requirements.scoring.weights
+        if not weights:
+            raise ValueError("No agent weights configured in scoring")
+        total_weight = math.fsum(weights.values())
         if abs(total_weight - 1.0) > 0.01:  # Allow small floating point errors
             raise ValueError(f"Agent weights should sum to 1.0, got {total_weight}")
         
@@ -0,0 +1,129 @@
+"""
+Pydantic models for requirements specifications.
+Imported lazily by requirements_manager, which re-exports them.
+"""
+
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+# (threshold key, assessment, default threshold) in the order scores are checked against them;
+# scores below every threshold are assessed as "Needs Improvement"
+ASSESSMENT_LEVELS = (
+    ("excellent", "Excellent", 8.5),
+    ("good", "Good", 7.0),
+    ("acceptable", "Acceptable", 5.5)
+)
+
+
+class RequirementCriterion(BaseModel):
+    """Individual criterion within a requirement category."""
+    model_config = ConfigDict(frozen=True)
+    
+    name: str
+    description: Optional[str] = None
+    weight: float = 1.0
+    
+    @field_validator('description', mode='before')
+    @classmethod
+    def empty_description_to_none(cls, v):
+        return v or None
+    
+    @field_validator('weight')
+    @classmethod
+    def weight_must_be_positive(cls, v):
+        if v <= 0:
+            raise ValueError('Weight must be positive')
+        return v
+
+
+class RequirementCategory(BaseModel):
+    """Category of requirements with multiple criteria."""
+    model_config = ConfigDict(frozen=True)
+    
+    category: str
+    description: Optional[str] = None
+    criteria: List[RequirementCriterion]
+    weight: float = Field(default=25.0, ge=0, le=100)
+    
+    @field_validator('description', mode='before')
+    @classmethod
+    def empty_description_to_none(cls, v):
+        return v or None
+    
+    @field_validator('criteria')
+    @classmethod
+    def must_have_criteria(cls, v):
+        if not v:
+            raise ValueError('Category must have at least one criterion')
+        return v
+    
+    @cached_property
+    def criteria_text(self) -> str:
+        """Criteria as a bulleted list for evaluation prompts, built once per category."""
+        return "\n".join(
+            f"- {criterion.name}: {criterion.description or 'No description provided'}"
+            for criterion in self.criteria
+        )
+
+
+class AgentRequirement(BaseModel):
+    """Requirements specification for a single agent."""
+    model_config = ConfigDict(frozen=True)
+    
+    type: str
+    name: str
+    description: str
+    requirements: List[RequirementCategory]
+    
+    @field_validator('requirements')
+    @classmethod
+    def must_have_requirements(cls, v):
+        if not v:
+            raise ValueError('Agent must have at least one requirement category')
+        return v
+
+
+class ScoringConfig(BaseModel):
+    """Scoring configuration for the review system."""
+    model_config = ConfigDict(frozen=True)
+    
+    scale: str = "0-10"
+    weights: Dict[str, float] = Field(default_factory=dict)
+    thresholds: Dict[str, float] = Field(default_factory=lambda: {
+        "excellent": 8.5,
+        "good": 7.0,
+        "acceptable": 5.5,
+        "needs_improvement": 3.0
+    })
+    
+    @cached_property
+    def assessment_thresholds(self) -> Tuple[Tuple[float, str], ...]:
+        """(minimum score, assessment) pairs in the order they are checked, resolved once per config."""
+        return tuple(
+            (self.thresholds.get(key, default), assessment)
+            for key, assessment, default in ASSESSMENT_LEVELS
+        )
+
+
+class RequirementsSpec(BaseModel):
+    """Complete requirements specification."""
+    model_config = ConfigDict(frozen=True)
+    
+    metadata: Dict[str, Any]
+    agents: List[AgentRequirement]
+    scoring: ScoringConfig
+    
+    @cached_property
+    def agents_by_type(self) -> Dict[str, AgentRequirement]:
+        """Agents keyed by type, built once per spec; the first agent of a type wins."""
+        index: Dict[str, AgentRequirement] = {}
+        for agent in self.agents:
+            index.setdefault(agent.type, agent)
+        return index
+    
+    @cached_property
+    def agent_types(self) -> FrozenSet[str]:
+        """Types of the agents in this spec, for membership checks."""
+        return frozenset(self.agents_by_type)
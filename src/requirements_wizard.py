@@ -4,8 +4,9 @@ Interactive requirements setup wizard for easy configuration of agent requiremen
 
 import os
 import yaml
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from rich.console import Console
@@ -14,17 +15,374 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from .requirements_manager import RequirementsManager
+from .requirements_manager import RequirementsManager, YAML_DUMPER, render_json
 
 
-@dataclass
+# Sort order of template importance levels, highest first
+IMPORTANCE_RANK = {"essential": 2, "important": 1, "optional": 0}
+
+
+@dataclass(frozen=True)
 class RequirementTemplate:
     """Template for a requirement category."""
+    # Declared by hand since dataclass(slots=True) needs Python 3.10. The last two are
+    # derived in __post_init__: the lowercased name and criteria, joined into one text
+    # that focus areas are matched against, and the IMPORTANCE_RANK of the template's importance
+    __slots__ = ("name", "description", "criteria", "default_weight", "importance", "search_text", "importance_rank")
+    
     name: str
     description: str
-    criteria: List[str]
+    criteria: Tuple[str, ...]
     default_weight: int
     importance: str  # "essential", "important", "optional"
+    
+    def __post_init__(self):
+        # Frozen, so the derived attributes are set past the generated __setattr__
+        # Focus areas are single words, so a match never spans the newline separators
+        object.__setattr__(self, "search_text", "\n".join((self.name, *self.criteria)).lower())
+        object.__setattr__(self, "importance_rank", IMPORTANCE_RANK[self.importance])
+    
+    # Pickle/copy state, which slots=True would also generate: the default restores slots
+    # through the frozen __setattr__ and fails
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state: Tuple[Any, ...]):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+def by_importance(templates: Tuple[RequirementTemplate, ...]) -> Tuple[RequirementTemplate, ...]:
+    """Order templates by importance, then default weight, both descending."""
+    return tuple(sorted(templates, key=lambda t: (t.importance_rank, t.default_weight), reverse=True))
+
+
+# Product Manager requirement templates
+PM_TEMPLATES = by_importance((
+    RequirementTemplate(
+        name="Market Analysis",
+        description="Assessment of market opportunity and competitive landscape",
+        criteria=(
+            "Target market clearly defined with size and demographics",
+            "Competitive landscape analyzed with differentiation strategy",
+            "Market opportunity quantified with TAM/SAM/SOM",
+            "Customer personas identified with pain points and needs"
+        ),
+        default_weight=25,
+        importance="essential"
+    ),
+    RequirementTemplate(
+        name="Product Strategy",
+        description="Product vision, goals, and strategic direction",
+        criteria=(
+            "Product vision and value proposition clearly articulated",
+            "Success metrics and KPIs defined with baselines",
+            "Feature prioritization justified with user impact",
+            "Product roadmap aligned with business objectives"
+        ),
+        default_weight=25,
+        importance="essential"
+    ),
+    RequirementTemplate(
+        name="Business Case",
+        description="Financial justification and business impact",
+        criteria=(
+            "Revenue projections with realistic assumptions",
+            "Cost analysis including development and operational costs",
+            "Risk assessment with mitigation strategies",
+            "ROI calculations with timeline and break-even analysis"
+        ),
+        default_weight=25,
+        importance="important"
+    ),
+    RequirementTemplate(
+        name="Go-to-Market Strategy",
+        description="Launch and marketing strategy",
+        criteria=(
+            "Launch timeline with key milestones defined",
+            "Marketing channels and customer acquisition strategy",
+            "Pricing strategy with competitive analysis",
+            "Sales enablement and channel partner strategy"
+        ),
+        default_weight=15,
+        importance="important"
+    ),
+    RequirementTemplate(
+        name="Stakeholder Management",
+        description="Stakeholder alignment and communication",
+        criteria=(
+            "Key stakeholders identified with roles and responsibilities",
+            "Communication plan with regular updates and feedback loops",
+            "Decision-making process clearly defined",
+            "Change management strategy for organizational impact"
+        ),
+        default_weight=10,
+        importance="optional"
+    )
+))
+
+
+# Data Scientist requirement templates
+DS_TEMPLATES = by_importance((
+    RequirementTemplate(
+        name="Data Requirements",
+        description="Data sourcing, quality, and governance",
+        criteria=(
+            "Data sources identified with availability and access methods",
+            "Data quality requirements and validation rules specified",
+            "Data governance framework with privacy and compliance",
+            "Data collection and storage strategy defined"
+        ),
+        default_weight=30,
+        importance="essential"
+    ),
+    RequirementTemplate(
+        name="Analytics Strategy",
+        description="Measurement methodology and KPI framework",
+        criteria=(
+            "Key metrics and KPIs clearly defined with business relevance",
+            "Measurement methodology with statistical rigor",
+            "Baseline establishment and target setting",
+            "Reporting frequency and stakeholder access defined"
+        ),
+        default_weight=25,
+        importance="essential"
+    ),
+    RequirementTemplate(
+        name="Experimentation Framework",
+        description="A/B testing and experimental design",
+        criteria=(
+            "Hypothesis formation with clear success criteria",
+            "Experimental design with proper controls and randomization",
+            "Sample size calculations and statistical power analysis",
+            "Results interpretation and decision-making framework"
+        ),
+        default_weight=20,
+        importance="important"
+    ),
+    RequirementTemplate(
+        name="Technical Implementation",
+        description="Data infrastructure and analytics tooling",
+        criteria=(
+            "Data pipeline architecture with ETL/ELT processes",
+            "Analytics tools and platforms selection",
+            "Real-time vs batch processing requirements",
+            "Scalability and performance considerations"
+        ),
+        default_weight=15,
+        importance="important"
+    ),
+    RequirementTemplate(
+        name="Machine Learning",
+        description="ML models and predictive analytics",
+        criteria=(
+            "Model requirements and performance targets",
+            "Training data availability and quality",
+            "Model validation and monitoring strategy",
+            "MLOps pipeline for model deployment and maintenance"
+        ),
+        default_weight=10,
+        importance="optional"
+    )
+))
+
+
+# Engineering requirement templates
+ENG_TEMPLATES = by_importance((
+    RequirementTemplate(
+        name="Technical Architecture",
+        description="System design and technical specifications",
+        criteria=(
+            "System architecture documented with component interactions",
+            "Technology stack justified with trade-offs explained",
+            "Scalability requirements and capacity planning",
+            "Security architecture with threat modeling"
+        ),
+        default_weight=30,
+        importance="essential"
+    ),
+    RequirementTemplate(
+        name="Implementation Plan",
+        description="Development timeline and resource planning",
+        criteria=(
+            "Development timeline with realistic estimates",
+            "Resource requirements and team allocation",
+            "Dependencies identified and managed",
+            "Risk mitigation strategies for technical challenges"
+        ),
+        default_weight=25,
+        importance="essential"
+    ),
+    RequirementTemplate(
+        name="Quality Assurance",
+        description="Testing strategy and code quality",
+        criteria=(
+            "Testing strategy with unit, integration, and E2E tests",
+            "Code quality standards and review processes",
+            "Performance testing and benchmarking",
+            "Security testing and vulnerability assessment"
+        ),
+        default_weight=20,
+        importance="important"
+    ),
+    RequirementTemplate(
+        name="Operational Readiness",
+        description="Production deployment and monitoring",
+        criteria=(
+            "Monitoring and alerting strategy with SLI/SLO definitions",
+            "Deployment strategy with rollback procedures",
+            "Incident response and on-call procedures",
+            "Capacity planning and auto-scaling configuration"
+        ),
+        default_weight=15,
+        importance="important"
+    ),
+    RequirementTemplate(
+        name="DevOps and Infrastructure",
+        description="CI/CD and infrastructure management",
+        criteria=(
+            "CI/CD pipeline with automated testing and deployment",
+            "Infrastructure as Code with version control",
+            "Environment management and configuration",
+            "Backup and disaster recovery procedures"
+        ),
+        default_weight=10,
+        importance="optional"
+    )
+))
+
+
+# Wizard menu options, keyed by the number entered to pick them
+DOCUMENT_TYPES = {
+    "1": "Product Launch",
+    "2": "Feature Release",
+    "3": "Technical Specification",
+    "4": "Business Proposal",
+    "5": "Research Project",
+    "6": "Custom"
+}
+
+INDUSTRIES = {
+    "1": "Technology/Software",
+    "2": "E-commerce/Retail",
+    "3": "Financial Services",
+    "4": "Healthcare/Medical",
+    "5": "Manufacturing",
+    "6": "Media/Entertainment",
+    "7": "Education",
+    "8": "Generic/Other"
+}
+
+WEIGHT_PRESETS = {
+    "1": {"pm": 0.5, "ds": 0.25, "eng": 0.25, "desc": "Business-focused (PM heavy)"},
+    "2": {"pm": 0.33, "ds": 0.33, "eng": 0.34, "desc": "Balanced across all agents"},
+    "3": {"pm": 0.2, "ds": 0.3, "eng": 0.5, "desc": "Technical-focused (Engineering heavy)"},
+    "4": {"pm": 0.3, "ds": 0.5, "eng": 0.2, "desc": "Data-driven (Data Science heavy)"},
+    "5": {"pm": 0, "ds": 0, "eng": 0, "desc": "Custom weights"}
+}
+
+# Valid answers for each menu, built once rather than from the dict keys on every prompt
+DOCUMENT_TYPE_CHOICES = tuple(DOCUMENT_TYPES)
+INDUSTRY_CHOICES = tuple(INDUSTRIES)
+WEIGHT_PRESET_CHOICES = tuple(WEIGHT_PRESETS)
+
+# (focus area key, description), numbered from 1 in the wizard
+FOCUS_AREAS = (
+    ("market", "Market Analysis & Strategy"),
+    ("technical", "Technical Implementation"),
+    ("data", "Data & Analytics"),
+    ("business", "Business Case & Financials"),
+    ("operations", "Operational Readiness"),
+    ("compliance", "Compliance & Governance"),
+    ("user", "User Experience & Research"),
+    ("performance", "Performance & Scalability")
+)
+
+
+# The menu tables never change, so each is built once and reprinted as is
+
+@lru_cache(maxsize=None)
+def document_type_table() -> Table:
+    """Table of the document type options."""
+    table = Table(title="Document Types")
+    table.add_column("Option", style="cyan")
+    table.add_column("Type", style="white")
+    
+    for key, value in DOCUMENT_TYPES.items():
+        table.add_row(key, value)
+    
+    return table
+
+
+@lru_cache(maxsize=None)
+def focus_area_table() -> Table:
+    """Table of the focus area options."""
+    table = Table(title="Focus Areas")
+    table.add_column("ID", style="cyan")
+    table.add_column("Area", style="white")
+    
+    for i, (key, description) in enumerate(FOCUS_AREAS, 1):
+        table.add_row(str(i), description)
+    
+    return table
+
+
+@lru_cache(maxsize=None)
+def industry_table() -> Table:
+    """Table of the industry options."""
+    table = Table(title="Industries")
+    table.add_column("Option", style="cyan")
+    table.add_column("Industry", style="white")
+    
+    for key, value in INDUSTRIES.items():
+        table.add_row(key, value)
+    
+    return table
+
+
+@lru_cache(maxsize=None)
+def weight_preset_table() -> Table:
+    """Table of the agent weight presets."""
+    table = Table(title="Weight Presets")
+    table.add_column("Option", style="cyan")
+    table.add_column("PM", justify="center")
+    table.add_column("DS", justify="center")
+    table.add_column("Eng", justify="center")
+    table.add_column("Description", style="dim")
+    
+    for key, preset in WEIGHT_PRESETS.items():
+        if key != "5":
+            table.add_row(
+                key,
+                f"{int(preset['pm']*100)}%",
+                f"{int(preset['ds']*100)}%",
+                f"{int(preset['eng']*100)}%",
+                preset['desc']
+            )
+        else:
+            table.add_row(key, "-", "-", "-", preset['desc'])
+    
+    return table
+
+
+@lru_cache(maxsize=8)
+def template_table(templates: Tuple[RequirementTemplate, ...]) -> Table:
+    """Table of the categories available for manual selection."""
+    table = Table()
+    table.add_column("ID", style="cyan")
+    table.add_column("Category", style="white")
+    table.add_column("Importance", style="yellow")
+    table.add_column("Description", style="dim")
+    
+    for i, template in enumerate(templates, 1):
+        table.add_row(
+            str(i),
+            template.name,
+            template.importance,
+            template.description[:50] + "..." if len(template.description) > 50 else template.description
+        )
+    
+    return table
 
 
 class RequirementsWizard:
@@ -34,10 +392,10 @@ class RequirementsWizard:
         self.console = Console()
         self.requirements_manager = RequirementsManager()
         
-        # Predefined templates for different focus areas
-        self.pm_templates = self._get_pm_templates()
-        self.ds_templates = self._get_ds_templates()
-        self.eng_templates = self._get_eng_templates()
+        # Predefined templates for different focus areas, shared by every wizard
+        self.pm_templates = PM_TEMPLATES
+        self.ds_templates = DS_TEMPLATES
+        self.eng_templates = ENG_TEMPLATES
     
     def run_interactive_setup(self) -> str:
         """Run the interactive setup wizard."""
@@ -66,6 +424,7 @@ class RequirementsWizard:
         output_file = self._save_requirements(requirements)
         
         self.console.print(f"\n[green]✅ Requirements saved to: {output_file}[/green]")
+        self.console.print(f"[dim]JSON copy for faster loading: {Path(output_file).with_suffix('.json')}[/dim]")
         self.console.print("You can now use this file for document reviews!")
         
         return output_file
@@ -74,92 +433,54 @@ class RequirementsWizard:
         """Get the type of document being reviewed."""
         self.console.print("[bold]Step 1: Document Type[/bold]")
         
-        options = {
-            "1": "Product Launch",
-            "2": "Feature Release",
-            "3": "Technical Specification",
-            "4": "Business Proposal",
-            "5": "Research Project",
-            "6": "Custom"
-        }
-        
-        table = Table(title="Document Types")
-        table.add_column("Option", style="cyan")
-        table.add_column("Type", style="white")
-        
-        for key, value in options.items():
-            table.add_row(key, value)
-        
-        self.console.print(table)
+        self.console.print(document_type_table())
         
         choice = Prompt.ask(
             "What type of document will you be reviewing?",
-            choices=list(options.keys()),
+            choices=DOCUMENT_TYPE_CHOICES,
             default="1"
         )
         
         if choice == "6":
             return Prompt.ask("Enter custom document type")
         
-        return options[choice]
+        return DOCUMENT_TYPES[choice]
     
     def _get_focus_areas(self) -> List[str]:
         """Get the focus areas for the review."""
         self.console.print("\n[bold]Step 2: Focus Areas[/bold]")
         self.console.print("Select the areas most important for your review (you can choose multiple):")
         
-        focus_options = [
-            ("market", "Market Analysis & Strategy"),
-            ("technical", "Technical Implementation"),
-            ("data", "Data & Analytics"),
-            ("business", "Business Case & Financials"),
-            ("operations", "Operational Readiness"),
-            ("compliance", "Compliance & Governance"),
-            ("user", "User Experience & Research"),
-            ("performance", "Performance & Scalability")
-        ]
+        self.console.print(focus_area_table())
         
-        selected_areas = []
+        # One prompt for all areas rather than a yes/no question per area
+        raw = Prompt.ask("Enter comma-separated IDs for areas to include", default="1,2,4")
         
-        for key, description in focus_options:
-            if Confirm.ask(f"Include {description}?", default=False):
-                selected_areas.append(key)
+        selected_ids = set()
+        for part in raw.replace(" ", "").split(","):
+            if part.isdigit() and 1 <= int(part) <= len(FOCUS_AREAS):
+                selected_ids.add(int(part))
+            elif part:
+                self.console.print(f"[yellow]Ignoring invalid focus area ID: {part}[/yellow]")
         
+        selected_areas = [key for i, (key, _) in enumerate(FOCUS_AREAS, 1) if i in selected_ids]
         return selected_areas if selected_areas else ["market", "technical", "business"]
     
     def _get_industry(self) -> str:
         """Get the industry context."""
         self.console.print("\n[bold]Step 3: Industry Context[/bold]")
         
-        industries = {
-            "1": "Technology/Software",
-            "2": "E-commerce/Retail",
-            "3": "Financial Services",
-            "4": "Healthcare/Medical",
-            "5": "Manufacturing",
-            "6": "Media/Entertainment",
-            "7": "Education",
-            "8": "Generic/Other"
-        }
-        
-        table = Table(title="Industries")
-        table.add_column("Option", style="cyan")
-        table.add_column("Industry", style="white")
-        
-        for key, value in industries.items():
-            table.add_row(key, value)
-        
-        self.console.print(table)
+        self.console.print(industry_table())
         
         choice = Prompt.ask(
             "What industry does this relate to?",
-            choices=list(industries.keys()),
+            choices=INDUSTRY_CHOICES,
             default="8"
         )
         
-        return industries[choice]
+        return INDUSTRIES[choice]
     
-    def _configure_agent(self, agent_name: str, templates: List[RequirementTemplate], focus_areas: List[str]) -> Dict:
+    def _configure_agent(self, agent_name: str, templates: Sequence[RequirementTemplate], focus_areas: List[str]) -> Dict:
         """Configure requirements for a specific agent."""
         self.console.print(f"\n[bold]Step 4: {agent_name} Agent Configuration[/bold]")
         
@@ -180,46 +501,29 @@ class RequirementsWizard:
         # Adjust weights
         return self._adjust_category_weights(selected_templates)
     
-    def _filter_templates(self, templates: List[RequirementTemplate], focus_areas: List[str]) -> List[RequirementTemplate]:
+    def _filter_templates(self, templates: Sequence[RequirementTemplate], focus_areas: List[str]) -> List[RequirementTemplate]:
         """Filter templates based on focus areas."""
         # Simple scoring based on focus areas
         scored_templates = []
         
         for template in templates:
-            score = 0
-            template_lower = template.name.lower()
-            
-            for focus in focus_areas:
-                if focus in template_lower or any(focus in criterion.lower() for criterion in template.criteria):
-                    score += 2 if template.importance == "essential" else 1
+            matches = sum(1 for focus in focus_areas if focus in template.search_text)
+            score = matches * (2 if template.importance == "essential" else 1)
             
             scored_templates.append((score, template))
         
-        # Sort by score and importance
-        scored_templates.sort(key=lambda x: (x[0], x[1].importance == "essential"), reverse=True)
+        # Sort by score; the sort is stable and templates are stored by_importance(),
+        # so equal scores stay in importance order
+        scored_templates.sort(key=lambda x: x[0], reverse=True)
         return [template for score, template in scored_templates]
     
-    def _manual_template_selection(self, templates: List[RequirementTemplate]) -> List[RequirementTemplate]:
+    def _manual_template_selection(self, templates: Sequence[RequirementTemplate]) -> List[RequirementTemplate]:
         """Allow manual selection of templates."""
         self.console.print("\n[dim]Available categories:[/dim]")
-        
-        table = Table()
-        table.add_column("ID", style="cyan")
-        table.add_column("Category", style="white")
-        table.add_column("Importance", style="yellow")
-        table.add_column("Description", style="dim")
-        
-        for i, template in enumerate(templates, 1):
-            table.add_row(
-                str(i),
-                template.name,
-                template.importance,
-                template.description[:50] + "..." if len(template.description) > 50 else template.description
-            )
-        
-        self.console.print(table)
+        self.console.print(template_table(tuple(templates)))
         
         selected = []
+        selected_ids = set()
         while len(selected) < 5:  # Max 5 categories
             choice = Prompt.ask(
                 f"Select category {len(selected) + 1} (enter number, or 'done' to finish)",
@@ -229,14 +533,16 @@ class RequirementsWizard:
             if choice.lower() == "done":
                 break
             
-            try:
-                idx = int(choice) - 1
-                if 0 <= idx < len(templates) and templates[idx] not in selected:
-                    selected.append(templates[idx])
-                else:
-                    self.console.print("[red]Invalid selection or already selected[/red]")
-            except ValueError:
+            if not choice.isdigit():
                 self.console.print("[red]Please enter a number or 'done'[/red]")
+                continue
+            
+            idx = int(choice) - 1
+            if 0 <= idx < len(templates) and idx not in selected_ids:
+                selected_ids.add(idx)
+                selected.append(templates[idx])
+            else:
+                self.console.print("[red]Invalid selection or already selected[/red]")
         
         return selected
     
@@ -250,17 +556,18 @@ class RequirementsWizard:
         weights = {}
         remaining = 100
         
-        for i, template in enumerate(templates):
-            if i == len(templates) - 1:  # Last category gets remaining weight
+        # Each category after the current one needs at least 1%
+        for template, slots_after in zip(templates, range(len(templates) - 1, -1, -1)):
+            if slots_after == 0:  # Last category gets remaining weight
                 weights[template.name] = remaining
                 self.console.print(f"{template.name}: [yellow]{remaining}%[/yellow] (remaining)")
             else:
-                default_weight = min(template.default_weight, remaining - (len(templates) - i - 1))
+                max_weight = remaining - slots_after
                 weight = IntPrompt.ask(
                     f"Weight for {template.name}",
-                    default=default_weight
+                    default=min(template.default_weight, max_weight)
                 )
-                weight = min(weight, remaining - (len(templates) - i - 1))
+                weight = min(weight, max_weight)
                 weights[template.name] = weight
                 remaining -= weight
                 self.console.print(f"{template.name}: [yellow]{weight}%[/yellow]")
@@ -272,38 +579,11 @@ class RequirementsWizard:
         self.console.print("\n[bold]Step 5: Agent Scoring Weights[/bold]")
         self.console.print("How much should each agent's evaluation contribute to the overall score?")
         
-        presets = {
-            "1": {"pm": 0.5, "ds": 0.25, "eng": 0.25, "desc": "Business-focused (PM heavy)"},
-            "2": {"pm": 0.33, "ds": 0.33, "eng": 0.34, "desc": "Balanced across all agents"},
-            "3": {"pm": 0.2, "ds": 0.3, "eng": 0.5, "desc": "Technical-focused (Engineering heavy)"},
-            "4": {"pm": 0.3, "ds": 0.5, "eng": 0.2, "desc": "Data-driven (Data Science heavy)"},
-            "5": {"pm": 0, "ds": 0, "eng": 0, "desc": "Custom weights"}
-        }
-        
-        table = Table(title="Weight Presets")
-        table.add_column("Option", style="cyan")
-        table.add_column("PM", justify="center")
-        table.add_column("DS", justify="center")
-        table.add_column("Eng", justify="center")
-        table.add_column("Description", style="dim")
-        
-        for key, preset in presets.items():
-            if key != "5":
-                table.add_row(
-                    key,
-                    f"{int(preset['pm']*100)}%",
-                    f"{int(preset['ds']*100)}%",
-                    f"{int(preset['eng']*100)}%",
-                    preset['desc']
-                )
-            else:
-                table.add_row(key, "-", "-", "-", preset['desc'])
-        
-        self.console.print(table)
+        self.console.print(weight_preset_table())
         
         choice = Prompt.ask(
             "Select weight distribution",
-            choices=list(presets.keys()),
+            choices=WEIGHT_PRESET_CHOICES,
             default="2"
         )
         
@@ -320,7 +600,7 @@ class RequirementsWizard:
                 "engineering": eng_weight
             }
         else:
-            preset = presets[choice]
+            preset = WEIGHT_PRESETS[choice]
             return {
                 "product_manager": preset["pm"],
                 "data_scientist": preset["ds"],
@@ -331,61 +611,19 @@ class RequirementsWizard:
                              ds_config: Dict, eng_config: Dict, weights: Dict) -> Dict:
         """Generate the final requirements structure."""
         
-        agents = []
-        
-        # Product Manager
-        if pm_config["categories"]:
-            pm_requirements = []
-            for template in pm_config["categories"]:
-                pm_requirements.append({
-                    "category": template.name,
-                    "description": template.description,
-                    "weight": pm_config["weights"][template.name],
-                    "criteria": [{"name": criterion, "weight": 1.0} for criterion in template.criteria]
-                })
-            
-            agents.append({
-                "type": "product_manager",
-                "name": "Product Manager Agent",
-                "description": f"Evaluates {doc_type} from business and product strategy perspective",
-                "requirements": pm_requirements
-            })
-        
-        # Data Scientist
-        if ds_config["categories"]:
-            ds_requirements = []
-            for template in ds_config["categories"]:
-                ds_requirements.append({
-                    "category": template.name,
-                    "description": template.description,
-                    "weight": ds_config["weights"][template.name],
-                    "criteria": [{"name": criterion, "weight": 1.0} for criterion in template.criteria]
-                })
-            
-            agents.append({
-                "type": "data_scientist",
-                "name": "Data Scientist Agent",
-                "description": f"Evaluates data and analytics aspects of {doc_type}",
-                "requirements": ds_requirements
-            })
-        
-        # Engineering
-        if eng_config["categories"]:
-            eng_requirements = []
-            for template in eng_config["categories"]:
-                eng_requirements.append({
-                    "category": template.name,
-                    "description": template.description,
-                    "weight": eng_config["weights"][template.name],
-                    "criteria": [{"name": criterion, "weight": 1.0} for criterion in template.criteria]
-                })
-            
-            agents.append({
-                "type": "engineering",
-                "name": "Engineering Agent",
-                "description": f"Evaluates technical implementation and operational readiness of {doc_type}",
-                "requirements": eng_requirements
-            })
+        agent_specs = [
+            ("product_manager", "Product Manager Agent",
+             f"Evaluates {doc_type} from business and product strategy perspective", pm_config),
+            ("data_scientist", "Data Scientist Agent",
+             f"Evaluates data and analytics aspects of {doc_type}", ds_config),
+            ("engineering", "Engineering Agent",
+             f"Evaluates technical implementation and operational readiness of {doc_type}", eng_config)
+        ]
+        agents = [
+            self._build_agent(agent_type, name, description, config)
+            for agent_type, name, description, config in agent_specs
+            if config["categories"]
+        ]
         
         return {
             "metadata": {
@@ -409,222 +647,66 @@ class RequirementsWizard:
             }
         }
     
+    def _build_agent(self, agent_type: str, name: str, description: str, config: Dict) -> Dict:
+        """Build one agent's requirements from its configured categories and weights."""
+        return {
+            "type": agent_type,
+            "name": name,
+            "description": description,
+            "requirements": [
+                {
+                    "category": template.name,
+                    "description": template.description,
+                    "weight": config["weights"][template.name],
+                    "criteria": [{"name": criterion, "weight": 1.0} for criterion in template.criteria]
+                }
+                for template in config["categories"]
+            ]
+        }
+    
     def _save_requirements(self, requirements: Dict) -> str:
-        """Save requirements to file."""
+        """Save requirements to a YAML file, plus a JSON copy next to it; returns the YAML path."""
         # Generate filename based on document type and industry
         doc_type = requirements["metadata"]["document_type"].lower().replace(" ", "-")
         industry = requirements["metadata"]["industry"].lower().replace("/", "-").replace(" ", "-")
         filename = f"requirements-{doc_type}-{industry}.yaml"
         
-        output_path = Path(filename)
+        base_path = Path(filename)
+        output_path = base_path
         
-        # Make sure we don't overwrite
-        counter = 1
-        while output_path.exists():
-            name_part = output_path.stem
-            extension = output_path.suffix
-            output_path = Path(f"{name_part}-{counter}{extension}")
+        # Make sure we don't overwrite: both the YAML file and its JSON copy are claimed with
+        # O_EXCL, so if either name is taken (possibly by a concurrent wizard) the claim is
+        # released and the pair moves to the next counter together
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+        counter = 0
+        while True:
+            json_path = output_path.with_suffix('.json')
+            try:
+                fd = os.open(output_path, flags, 0o644)
+            except FileExistsError:
+                pass
+            else:
+                try:
+                    json_fd = os.open(json_path, flags, 0o644)
+                    break
+                except FileExistsError:
+                    os.close(fd)
+                    os.remove(output_path)
             counter += 1
+            output_path = Path(f"{base_path.stem}-{counter}{base_path.suffix}")
+        
+        # Written as UTF-8 bytes by the emitter, with no text-layer re-encoding
+        with os.fdopen(fd, 'wb') as f:
+            yaml.dump(
+                requirements, f, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False, indent=2,
+                encoding='utf-8', allow_unicode=True
+            )
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            yaml.dump(requirements, f, default_flow_style=False, sort_keys=False, indent=2)
+        # JSON copy of the same requirements; JSON files load much faster than YAML
+        with os.fdopen(json_fd, 'wb') as f:
+            f.write(render_json(requirements))
         
         return str(output_path)
-    
-    def _get_pm_templates(self) -> List[RequirementTemplate]:
-        """Get Product Manager requirement templates."""
-        return [
-            RequirementTemplate(
-                name="Market Analysis",
-                description="Assessment of market opportunity and competitive landscape",
-                criteria=[
-                    "Target market clearly defined with size and demographics",
-                    "Competitive landscape analyzed with differentiation strategy",
-                    "Market opportunity quantified with TAM/SAM/SOM",
-                    "Customer personas identified with pain points and needs"
-                ],
-                default_weight=25,
-                importance="essential"
-            ),
-            RequirementTemplate(
-                name="Product Strategy",
-                description="Product vision, goals, and strategic direction",
-                criteria=[
-                    "Product vision and value proposition clearly articulated",
-                    "Success metrics and KPIs defined with baselines",
-                    "Feature prioritization justified with user impact",
-                    "Product roadmap aligned with business objectives"
-                ],
-                default_weight=25,
-                importance="essential"
-            ),
-            RequirementTemplate(
-                name="Business Case",
-                description="Financial justification and business impact",
-                criteria=[
-                    "Revenue projections with realistic assumptions",
-                    "Cost analysis including development and operational costs",
-                    "Risk assessment with mitigation strategies",
-                    "ROI calculations with timeline and break-even analysis"
-                ],
-                default_weight=25,
-                importance="important"
-            ),
-            RequirementTemplate(
-                name="Go-to-Market Strategy",
-                description="Launch and marketing strategy",
-                criteria=[
-                    "Launch timeline with key milestones defined",
-                    "Marketing channels and customer acquisition strategy",
-                    "Pricing strategy with competitive analysis",
-                    "Sales enablement and channel partner strategy"
-                ],
-                default_weight=15,
-                importance="important"
-            ),
-            RequirementTemplate(
-                name="Stakeholder Management",
-                description="Stakeholder alignment and communication",
-                criteria=[
-                    "Key stakeholders identified with roles and responsibilities",
-                    "Communication plan with regular updates and feedback loops",
-                    "Decision-making process clearly defined",
-                    "Change management strategy for organizational impact"
-                ],
-                default_weight=10,
-                importance="optional"
-            )
-        ]
-    
-    def _get_ds_templates(self) -> List[RequirementTemplate]:
-        """Get Data Scientist requirement templates."""
-        return [
-            RequirementTemplate(
-                name="Data Requirements",
-                description="Data sourcing, quality, and governance",
-                criteria=[
-                    "Data sources identified with availability and access methods",
-                    "Data quality requirements and validation rules specified",
-                    "Data governance framework with privacy and compliance",
-                    "Data collection and storage strategy defined"
-                ],
-                default_weight=30,
-                importance="essential"
-            ),
-            RequirementTemplate(
-                name="Analytics Strategy",
-                description="Measurement methodology and KPI framework",
-                criteria=[
-                    "Key metrics and KPIs clearly defined with business relevance",
-                    "Measurement methodology with statistical rigor",
-                    "Baseline establishment and target setting",
-                    "Reporting frequency and stakeholder access defined"
-                ],
-                default_weight=25,
-                importance="essential"
-            ),
-            RequirementTemplate(
-                name="Experimentation Framework",
-                description="A/B testing and experimental design",
-                criteria=[
-                    "Hypothesis formation with clear success criteria",
-                    "Experimental design with proper controls and randomization",
-                    "Sample size calculations and statistical power analysis",
-                    "Results interpretation and decision-making framework"
-                ],
-                default_weight=20,
-                importance="important"
-            ),
-            RequirementTemplate(
-                name="Technical Implementation",
-                description="Data infrastructure and analytics tooling",
-                criteria=[
-                    "Data pipeline architecture with ETL/ELT processes",
-                    "Analytics tools and platforms selection",
-                    "Real-time vs batch processing requirements",
-                    "Scalability and performance considerations"
-                ],
-                default_weight=15,
-                importance="important"
-            ),
-            RequirementTemplate(
-                name="Machine Learning",
-                description="ML models and predictive analytics",
-                criteria=[
-                    "Model requirements and performance targets",
-                    "Training data availability and quality",
-                    "Model validation and monitoring strategy",
-                    "MLOps pipeline for model deployment and maintenance"
-                ],
-                default_weight=10,
-                importance="optional"
-            )
-        ]
-    
-    def _get_eng_templates(self) -> List[RequirementTemplate]:
-        """Get Engineering requirement templates."""
-        return [
-            RequirementTemplate(
-                name="Technical Architecture",
-                description="System design and technical specifications",
-                criteria=[
-                    "System architecture documented with component interactions",
-                    "Technology stack justified with trade-offs explained",
-                    "Scalability requirements and capacity planning",
-                    "Security architecture with threat modeling"
-                ],
-                default_weight=30,
-                importance="essential"
-            ),
-            RequirementTemplate(
-                name="Implementation Plan",
-                description="Development timeline and resource planning",
-                criteria=[
-                    "Development timeline with realistic estimates",
-                    "Resource requirements and team allocation",
-                    "Dependencies identified and managed",
-                    "Risk mitigation strategies for technical challenges"
-                ],
-                default_weight=25,
-                importance="essential"
-            ),
-            RequirementTemplate(
-                name="Quality Assurance",
-                description="Testing strategy and code quality",
-                criteria=[
-                    "Testing strategy with unit, integration, and E2E tests",
-                    "Code quality standards and review processes",
-                    "Performance testing and benchmarking",
-                    "Security testing and vulnerability assessment"
-                ],
-                default_weight=20,
-                importance="important"
-            ),
-            RequirementTemplate(
-                name="Operational Readiness",
-                description="Production deployment and monitoring",
-                criteria=[
-                    "Monitoring and alerting strategy with SLI/SLO definitions",
-                    "Deployment strategy with rollback procedures",
-                    "Incident response and on-call procedures",
-                    "Capacity planning and auto-scaling configuration"
-                ],
-                default_weight=15,
-                importance="important"
-            ),
-            RequirementTemplate(
-                name="DevOps and Infrastructure",
-                description="CI/CD and infrastructure management",
-                criteria=[
-                    "CI/CD pipeline with automated testing and deployment",
-                    "Infrastructure as Code with version control",
-                    "Environment management and configuration",
-                    "Backup and disaster recovery procedures"
-                ],
-                default_weight=10,
-                importance="optional"
-            )
-        ]
 
 
 def run_requirements_wizard() -> str:
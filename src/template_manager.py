@@ -3,25 +3,83 @@ Template manager for handling predefined requirements templates.
 """
 
 import os
+import copy
+import math
+import bisect
 import yaml
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass
+from functools import lru_cache
 
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
+from .requirements_manager import YAML_LOADER, YAML_DUMPER
 
-@dataclass
+
+@lru_cache(maxsize=100)
+def _parse_yaml_version(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file, memoized per file version; the modification time and size only key the cache."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=YAML_LOADER)
+
+
+def load_yaml(path: str, copy_result: bool = True) -> Any:
+    """
+    Parse a YAML file, reusing the previous parse while the file is unchanged.
+    
+    Args:
+        path: Path to the YAML file
+        copy_result: Return a deep copy that callers may modify. Read-only callers pass False
+            to share the cached parse itself, which must then not be modified
+    """
+    stat = os.stat(path)
+    data = _parse_yaml_version(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    return copy.deepcopy(data) if copy_result else data
+
+
+# Difficulty cells for the templates table, markup included
+DIFFICULTY_COLORS = {
+    'beginner': 'green',
+    'intermediate': 'yellow',
+    'advanced': 'red'
+}
+DIFFICULTY_CELLS = {difficulty: f"[{color}]{difficulty}[/{color}]" for difficulty, color in DIFFICULTY_COLORS.items()}
+
+
+@dataclass(frozen=True)
 class RequirementTemplate:
     """Represents a requirements template."""
+    # Declared by hand since dataclass(slots=True) needs Python 3.10. The last one is derived
+    # in __post_init__: the description as shown in the templates table
+    __slots__ = ("name", "description", "document_type", "difficulty", "file_path", "metadata", "short_description")
+    
     name: str
     description: str
     document_type: str
     difficulty: str
     file_path: str
-    metadata: Dict
+    metadata: Mapping[str, Any]  # Read-only view of the template file's metadata section
+    
+    def __post_init__(self):
+        # Frozen, so the derived attribute is set past the generated __setattr__
+        description = self.description[:50] + "..." if len(self.description) > 50 else self.description
+        object.__setattr__(self, "short_description", description)
+    
+    # Pickle/copy state, which slots=True would also generate: the default restores slots
+    # through the frozen __setattr__ and fails. The metadata view is not picklable, so its
+    # contents are stored and wrapped again on restore
+    def __getstate__(self) -> Tuple[Any, ...]:
+        state = [getattr(self, name) for name in self.__slots__]
+        state[self.__slots__.index("metadata")] = dict(self.metadata)
+        return tuple(state)
+    
+    def __setstate__(self, state: Tuple[Any, ...]):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, MappingProxyType(value) if name == "metadata" else value)
 
 
 class TemplateManager:
@@ -31,6 +89,34 @@ class TemplateManager:
         self.console = Console()
         self.templates_dir = Path(__file__).parent.parent / "templates"
         self.templates = self._load_templates()
+        self._index_templates()
+    
+    def _index_templates(self):
+        """
+        Index templates by lowercase name and by (difficulty, industry) for recommendation lookups,
+        and collect the industries they cover.
+        
+        For recommendations, each template is filed under its exact values and under None in either
+        position, so a lookup with any combination of the two criteria omitted is a single dict hit.
+        """
+        # Reversed so that, as with a front-to-back scan, the first template with a name wins
+        self._by_name: Dict[str, RequirementTemplate] = {
+            template.name.lower(): template for template in reversed(self.templates)
+        }
+        
+        self._recommendation_index: Dict[Tuple[Optional[str], Optional[str]], List[RequirementTemplate]] = {}
+        for template in self.templates:
+            difficulty = template.difficulty
+            industry = (template.metadata.get('industry') or '').lower()
+            for key in ((difficulty, industry), (difficulty, None), (None, industry), (None, None)):
+                self._recommendation_index.setdefault(key, []).append(template)
+        
+        # Display names of the industries covered, for get_industries()
+        self._industries: Tuple[str, ...] = tuple(sorted({
+            template.metadata['industry'].replace('_', ' ').title()
+            for template in self.templates
+            if template.metadata.get('industry')
+        }))
     
     def _load_templates(self) -> List[RequirementTemplate]:
         """Load all available templates from the templates directory."""
@@ -41,24 +127,32 @@ class TemplateManager:
         
         for template_file in self.templates_dir.glob("requirements-*.yaml"):
             try:
-                with open(template_file, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
-                
-                metadata = data.get('metadata', {})
-                template = RequirementTemplate(
-                    name=metadata.get('template_name', template_file.stem),
-                    description=metadata.get('description', 'No description available'),
-                    document_type=metadata.get('document_type', 'Unknown'),
-                    difficulty=metadata.get('difficulty', 'intermediate'),
-                    file_path=str(template_file),
-                    metadata=metadata
-                )
-                templates.append(template)
+                data = load_yaml(str(template_file), copy_result=False)
+                templates.append(self._template_from_data(template_file, data))
                 
             except Exception as e:
                 print(f"Warning: Could not load template {template_file}: {e}")
         
-        return sorted(templates, key=lambda t: (t.difficulty, t.name))
+        return sorted(templates, key=self._sort_key)
+    
+    @staticmethod
+    def _sort_key(template: RequirementTemplate) -> Tuple[str, str]:
+        """Order in which templates are listed and numbered."""
+        return (template.difficulty, template.name)
+    
+    @staticmethod
+    def _template_from_data(template_file: Path, data: Dict) -> RequirementTemplate:
+        """Build a template from its file's parsed contents."""
+        # Only the metadata is kept, as a read-only view of its own copy
+        metadata = dict(data.get('metadata', {}))
+        return RequirementTemplate(
+            name=metadata.get('template_name', template_file.stem),
+            description=metadata.get('description', 'No description available'),
+            document_type=metadata.get('document_type', 'Unknown'),
+            difficulty=metadata.get('difficulty', 'intermediate'),
+            file_path=str(template_file),
+            metadata=MappingProxyType(metadata)
+        )
     
     def list_templates(self) -> List[RequirementTemplate]:
         """Get all available templates."""
@@ -80,23 +174,19 @@ class TemplateManager:
         table.add_column("Industry", style="magenta", width=12)
         table.add_column("Description", style="dim")
         
-        for i, template in enumerate(self.templates, 1):
-            difficulty_color = {
-                'beginner': 'green',
-                'intermediate': 'yellow', 
-                'advanced': 'red'
-            }.get(template.difficulty, 'white')
-            
-            industry = template.metadata.get('industry', 'General').replace('_', ' ').title()
-            
-            table.add_row(
+        rows = [
+            (
                 str(i),
                 template.name,
                 template.document_type,
-                f"[{difficulty_color}]{template.difficulty}[/{difficulty_color}]",
-                industry,
-                template.description[:50] + "..." if len(template.description) > 50 else template.description
+                DIFFICULTY_CELLS.get(template.difficulty) or f"[white]{template.difficulty}[/white]",
+                template.metadata.get('industry', 'General').replace('_', ' ').title(),
+                template.short_description
             )
+            for i, template in enumerate(self.templates, 1)
+        ]
+        for row in rows:
+            table.add_row(*row)
         
         self.console.print(table)
     
@@ -108,16 +198,12 @@ class TemplateManager:
     
     def get_template_by_name(self, name: str) -> Optional[RequirementTemplate]:
         """Get a template by name."""
-        for template in self.templates:
-            if template.name.lower() == name.lower():
-                return template
-        return None
+        return self._by_name.get(name.lower())
     
     def load_template_requirements(self, template: RequirementTemplate) -> Dict:
         """Load the full requirements from a template."""
         try:
-            with open(template.file_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            return load_yaml(template.file_path)
         except Exception as e:
             raise ValueError(f"Could not load template {template.name}: {e}")
     
@@ -143,41 +229,40 @@ class TemplateManager:
         
         # Save template
         with open(template_path, 'w', encoding='utf-8') as f:
-            yaml.dump(requirements, f, default_flow_style=False, sort_keys=False, indent=2)
+            yaml.dump(requirements, f, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False, indent=2)
         
-        # Reload templates to include the new one
-        self.templates = self._load_templates()
+        # Add the new template in sorted position from the data just written, replacing any
+        # template previously loaded from the same file, without re-reading the directory
+        new_template = self._template_from_data(template_path, requirements)
+        templates = [t for t in self.templates if t.file_path != new_template.file_path]
+        position = bisect.bisect_right([self._sort_key(t) for t in templates], self._sort_key(new_template))
+        templates.insert(position, new_template)
+        self.templates = templates
+        self._index_templates()
         
         return str(template_path)
     
     def get_recommendations(self, document_type: str = None, difficulty: str = None, industry: str = None) -> List[RequirementTemplate]:
         """Get recommended templates based on criteria."""
-        filtered = self.templates
+        key = (difficulty.lower() if difficulty else None, industry.lower() if industry else None)
+        filtered = self._recommendation_index.get(key, [])
         
+        # Document types match on substrings, so they are filtered within the indexed bucket
         if document_type:
-            filtered = [t for t in filtered if document_type.lower() in t.document_type.lower()]
-        
-        if difficulty:
-            filtered = [t for t in filtered if t.difficulty == difficulty.lower()]
-        
-        if industry:
-            filtered = [t for t in filtered if t.metadata.get('industry', '').lower() == industry.lower()]
+            document_type = document_type.lower()
+            filtered = [t for t in filtered if document_type in t.document_type.lower()]
         
         return filtered[:3]  # Top 3 recommendations
     
     def get_industries(self) -> List[str]:
         """Get list of available industries from templates."""
-        industries = set()
-        for template in self.templates:
-            industry = template.metadata.get('industry')
-            if industry:
-                industries.add(industry.replace('_', ' ').title())
-        return sorted(list(industries))
+        return list(self._industries)
     
     def preview_template(self, template: RequirementTemplate):
         """Show a preview of what the template includes."""
         try:
-            requirements = self.load_template_requirements(template)
+            # Only read here, so the cached parse is shared rather than copied
+            requirements = load_yaml(template.file_path, copy_result=False)
             
             self.console.print(Panel.fit(f"📖 Template Preview: {template.name}", style="blue bold"))
             
@@ -222,8 +307,7 @@ class TemplateManager:
         }
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                requirements = yaml.safe_load(f)
+            requirements = load_yaml(file_path, copy_result=False)
         except Exception as e:
             issues['errors'].append(f"Cannot load YAML file: {e}")
             return issues
@@ -264,14 +348,14 @@ class TemplateManager:
                         if not isinstance(agent['requirements'], list):
                             issues['errors'].append(f"Agent {i+1} requirements must be a list")
                         else:
-                            total_weight = 0
-                            for j, req in enumerate(agent['requirements']):
-                                if 'weight' in req:
-                                    total_weight += req['weight']
-                                if 'criteria' not in req:
-                                    issues['warnings'].append(f"Agent {i+1}, requirement {j+1} has no criteria")
-                                elif len(req['criteria']) == 0:
-                                    issues['warnings'].append(f"Agent {i+1}, requirement {j+1} has empty criteria")
+                            agent_requirements = agent['requirements']
+                            total_weight = sum(req['weight'] for req in agent_requirements if 'weight' in req)
+                            issues['warnings'].extend(
+                                f"Agent {i+1}, requirement {j+1} has "
+                                f"{'no' if 'criteria' not in req else 'empty'} criteria"
+                                for j, req in enumerate(agent_requirements)
+                                if 'criteria' not in req or len(req['criteria']) == 0
+                            )
                             
                             if abs(total_weight - 100) > 1:
                                 issues['warnings'].append(f"Agent {i+1} requirement weights sum to {total_weight}%, should be 100%")
@@ -281,7 +365,7 @@ class TemplateManager:
             scoring = requirements['scoring']
             if 'weights' in scoring:
                 weights = scoring['weights']
-                total_weight = sum(weights.values())
+                total_weight = math.fsum(weights.values())
                 if abs(total_weight - 1.0) > 0.01:
                     issues['warnings'].append(f"Agent scoring weights sum to {total_weight:.2f}, should be 1.0")
             
@@ -0,0 +1,128 @@
+"""
+Section splitting and keyword-based selection for long documents.
+Used to keep only the parts of a document relevant to a requirement category in LLM prompts.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import List, Iterable, Set, Optional, Dict, Tuple
+
+
+# Markdown-style headings start a new section
+HEADING_PATTERN = re.compile(r'^(?=#{1,6}\s)', re.MULTILINE)
+PARAGRAPH_PATTERN = re.compile(r'\n\s*\n')
+WORD_PATTERN = re.compile(r'[a-z0-9]+')
+
+# Common words that carry no signal for matching sections to criteria
+STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'have', 'in',
+    'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the', 'their', 'this', 'to', 'with',
+    'clear', 'clearly', 'defined', 'well', 'no', 'description', 'provided'
+})
+
+
+def tokenize(text: str) -> Set[str]:
+    """Get the set of meaningful lowercase words in a text."""
+    return {word for word in WORD_PATTERN.findall(text.lower()) if word not in STOPWORDS and len(word) > 2}
+
+
+def split_sections(text: str) -> List[str]:
+    """
+    Split a document into sections.
+    
+    Splits on markdown headings when present, otherwise on blank-line separated paragraphs.
+    
+    Args:
+        text: Full document text
+    
+    Returns:
+        Non-empty sections in document order
+    """
+    pattern = HEADING_PATTERN if HEADING_PATTERN.search(text) else PARAGRAPH_PATTERN
+    return [section.strip() for section in pattern.split(text) if section.strip()]
+
+
+def select_relevant_sections(
+    sections: List[str],
+    keywords: Iterable[str],
+    max_chars: int,
+    section_tokens: Optional[List[Set[str]]] = None
+) -> str:
+    """
+    Keep the sections that best match the given keywords, within a character budget.
+    
+    Args:
+        sections: Document sections in order
+        keywords: Text describing what the reader is looking for
+        max_chars: Maximum total length of the selected sections
+        section_tokens: Precomputed tokenize() output for each section
+    
+    Returns:
+        Selected sections joined in their original document order
+    """
+    if section_tokens is None:
+        section_tokens = [tokenize(section) for section in sections]
+    
+    keyword_tokens = set()
+    for keyword in keywords:
+        keyword_tokens |= tokenize(keyword)
+    
+    # Rank by keyword overlap; ties keep document order
+    ranked = sorted(
+        range(len(sections)),
+        key=lambda i: len(keyword_tokens & section_tokens[i]),
+        reverse=True
+    )
+    
+    selected = []
+    used_chars = 0
+    for index in ranked:
+        section_length = len(sections[index]) + 2
+        if used_chars + section_length > max_chars:
+            continue
+        selected.append(index)
+        used_chars += section_length
+    
+    if not selected and ranked:
+        # Even the best section alone is over budget; keep its beginning
+        return sections[ranked[0]][:max_chars]
+    
+    return '\n\n'.join(sections[i] for i in sorted(selected))
+
+
+@dataclass
+class DocumentContext:
+    """
+    A document prepared once for review and shared by every agent and category.
+    
+    Sections and their tokens are computed a single time, and section selections are
+    memoized so agents evaluating the same categories reuse each other's work.
+    """
+    full_text: str
+    sections: List[str]
+    section_tokens: List[Set[str]]
+    token_count: int
+    _selection_cache: Dict[Tuple[Tuple[str, ...], int], str] = field(default_factory=dict, init=False, repr=False)
+    
+    @classmethod
+    def from_text(cls, text: str) -> "DocumentContext":
+        """Split and tokenize a document's text."""
+        sections = split_sections(text)
+        return cls(
+            full_text=text,
+            sections=sections,
+            section_tokens=[tokenize(section) for section in sections],
+            token_count=len(text) // 4  # Rough estimate (~4 characters per token)
+        )
+    
+    def relevant_sections(self, keywords: Iterable[str], max_chars: int) -> str:
+        """Get the document text to inline in a prompt, trimmed to `max_chars` if needed."""
+        if len(self.full_text) <= max_chars:
+            return self.full_text
+        
+        key = (tuple(keywords), max_chars)
+        if key not in self._selection_cache:
+            self._selection_cache[key] = select_relevant_sections(
+                self.sections, key[0], max_chars, self.section_tokens
+            )
+        return self._selection_cache[key]
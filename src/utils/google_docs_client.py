@@ -4,9 +4,13 @@ Google Docs client for fetching and extracting text content from Google Document
 
 import os
 import re
+import time
+import asyncio
 import logging
-from typing import Optional, Dict, Any
-from urllib.parse import urlparse, parse_qs
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 
 try:
     from googleapiclient.discovery import build
@@ -19,12 +23,58 @@ except ImportError:
     GOOGLE_AVAILABLE = False
 
 
+# Common Google Docs URL patterns (Docs editor and Drive file links), as one compiled alternation
+DOCUMENT_ID_PATTERN = re.compile(
+    r'https://(?:docs\.google\.com/document|drive\.google\.com/file)/d/([a-zA-Z0-9_-]+)'
+)
+
+# Fallbacks tried in order when the common patterns don't match: any other docs.google.com
+# path with a /d/<id> segment (e.g. domain-scoped URLs), then an id query parameter
+DOCUMENT_ID_FALLBACK_PATTERNS = (
+    re.compile(r'://[^/?#]*docs\.google\.com[^/?#]*/(?:[^?#]*/)?d/([^/?#]+)'),
+    re.compile(r'\?(?:[^#]*&)?id=([^&#]+)'),
+)
+
+
+@lru_cache(maxsize=1024)
+def parse_document_id(url: str) -> str:
+    """Extract the document ID from a Google Docs URL; see GoogleDocsClient.extract_document_id()."""
+    for pattern in (DOCUMENT_ID_PATTERN, *DOCUMENT_ID_FALLBACK_PATTERNS):
+        match = pattern.search(url)
+        if match:
+            return match.group(1)
+    
+    raise ValueError(f"Invalid Google Docs URL format: {url}")
+
+
 class GoogleDocsClient:
     """Client for fetching content from Google Docs."""
     
     # Required scopes for reading Google Docs
     SCOPES = ['https://www.googleapis.com/auth/documents.readonly']
     
+    # Partial response mask: only the metadata and text runs we read, skipping styles,
+    # inline objects and other formatting that make up most of a full document resource
+    DOCUMENT_FIELDS = (
+        'title,revisionId,'
+        'body/content(paragraph/elements/textRun/content,'
+        'table/tableRows/tableCells/content/paragraph/elements/textRun/content)'
+    )
+    
+    # Authenticated clients shared process-wide, keyed by (credentials path, OAuth port)
+    _shared_clients: Dict[Tuple[Optional[str], int], "GoogleDocsClient"] = {}
+    _shared_clients_lock = threading.Lock()
+    
+    # Retries for requests failing with rate limiting or server errors, with exponential backoff
+    NUM_RETRIES = 3
+    
+    # Documents requested per batched HTTP call in fetch_many()
+    BATCH_SIZE = 50
+    
+    # get_document_info() results are reused for this many seconds, for up to this many documents
+    DOCUMENT_INFO_TTL = 60.0
+    DOCUMENT_INFO_CACHE_SIZE = 128
+    
     def __init__(self, credentials_path: Optional[str] = None, oauth_port: int = 8080):
         """
         Initialize Google Docs client.
@@ -43,8 +93,34 @@ class GoogleDocsClient:
         self.oauth_port = oauth_port
         self.logger = logging.getLogger(__name__)
         self.service = None
+        # Serializes API requests, since the underlying httplib2 transport is not thread-safe.
+        # A thread lock, so a shared client stays safe across event loops and threads
+        self._request_lock = threading.Lock()
+        # document ID -> (monotonic time fetched, metadata), oldest first
+        self._info_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # Fetches on the event loop, worker threads and batch callbacks all use the cache
+        self._info_cache_lock = threading.Lock()
         self._authenticate()
     
+    @classmethod
+    def shared(cls, credentials_path: Optional[str] = None, oauth_port: int = 8080) -> "GoogleDocsClient":
+        """
+        Get a process-wide client for the given credentials, creating it on first use.
+        
+        Reusing the client skips token loading and API discovery for every new reviewer.
+        
+        Args:
+            credentials_path: Path to Google API credentials JSON file
+            oauth_port: Port for OAuth redirect (must match Google Cloud Console config)
+        """
+        key = (credentials_path or os.getenv('GOOGLE_APPLICATION_CREDENTIALS'), oauth_port)
+        with cls._shared_clients_lock:
+            client = cls._shared_clients.get(key)
+            if client is None:
+                client = cls(key[0], oauth_port)
+                cls._shared_clients[key] = client
+        return client
+    
     def _authenticate(self):
         """Authenticate with Google API."""
         if not self.credentials_path:
@@ -94,7 +170,8 @@ class GoogleDocsClient:
                     token.write(creds.to_json())
             
             # Build the service
-            self.service = build('docs', 'v1', credentials=creds)
+            # The discovery document ships with the client library; skip the discovery cache lookup
+            self.service = build('docs', 'v1', credentials=creds, cache_discovery=False)
             self.logger.info("Successfully authenticated with Google Docs API")
             
         except GoogleAuthError as e:
@@ -102,6 +179,16 @@ class GoogleDocsClient:
         except Exception as e:
             raise RuntimeError(f"Failed to initialize Google Docs client: {e}")
     
+    def _execute(self, request):
+        """Execute an API request, one at a time on the shared, kept-alive transport."""
+        with self._request_lock:
+            return request.execute(num_retries=self.NUM_RETRIES)
+    
+    def _execute_batch(self, batch):
+        """Execute a batch request on the shared transport; responses go to each request's callback."""
+        with self._request_lock:
+            batch.execute()
+    
     def extract_document_id(self, url: str) -> str:
         """
         Extract document ID from Google Docs URL.
@@ -115,37 +202,7 @@ class GoogleDocsClient:
         Raises:
             ValueError: If URL is not a valid Google Docs URL
         """
-        # Common Google Docs URL patterns
-        patterns = [
-            r'https://docs\.google\.com/document/d/([a-zA-Z0-9-_]+)',
-            r'https://drive\.google\.com/file/d/([a-zA-Z0-9-_]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        
-        # Try parsing as query parameter
-        try:
-            parsed_url = urlparse(url)
-            if 'docs.google.com' in parsed_url.netloc:
-                # Extract from path
-                path_parts = parsed_url.path.split('/')
-                if 'd' in path_parts:
-                    id_index = path_parts.index('d') + 1
-                    if id_index < len(path_parts):
-                        return path_parts[id_index]
-            
-            # Check query parameters
-            query_params = parse_qs(parsed_url.query)
-            if 'id' in query_params:
-                return query_params['id'][0]
-                
-        except Exception:
-            pass
-        
-        raise ValueError(f"Invalid Google Docs URL format: {url}")
+        return parse_document_id(url)
     
     async def fetch_document_content(self, url: str) -> str:
         """
@@ -157,6 +214,25 @@ class GoogleDocsClient:
         Returns:
             Plain text content of the document
             
+        Raises:
+            RuntimeError: If document cannot be fetched
+        """
+        content, _ = await self.fetch_document(url)
+        return content
+    
+    async def fetch_document(self, url: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Fetch text content and metadata from Google Docs with a single API request.
+        
+        The blocking request runs in a worker thread, so other work can proceed
+        on the event loop while the document downloads.
+        
+        Args:
+            url: Google Docs URL
+            
+        Returns:
+            Tuple of plain text content and document metadata (as from get_document_info)
+            
         Raises:
             RuntimeError: If document cannot be fetched
         """
@@ -165,89 +241,161 @@ class GoogleDocsClient:
             self.logger.info(f"Fetching document content for ID: {document_id}")
             
             # Fetch document
-            document = self.service.documents().get(documentId=document_id).execute()
+            request = self.service.documents().get(documentId=document_id, fields=self.DOCUMENT_FIELDS)
+            document = await asyncio.get_running_loop().run_in_executor(None, self._execute, request)
             
             # Extract text content
             content = self._extract_text_from_document(document)
             
             self.logger.info(f"Successfully fetched document content ({len(content)} characters)")
-            return content
+            info = self._build_document_info(document_id, document, content)
+            self._cache_document_info(document_id, info)
+            return content, info
             
         except Exception as e:
             self.logger.error(f"Failed to fetch document content: {e}")
             raise RuntimeError(f"Failed to fetch Google Doc content: {e}")
     
+    async def fetch_many(self, urls: List[str]) -> Dict[str, str]:
+        """
+        Fetch text content for several Google Docs, BATCH_SIZE documents per HTTP request.
+        
+        Args:
+            urls: Google Docs URLs
+            
+        Returns:
+            Plain text content keyed by URL. URLs that are invalid or could not be fetched
+            are logged and left out
+            
+        Raises:
+            RuntimeError: If a batch request as a whole fails
+        """
+        results: Dict[str, str] = {}
+        
+        document_ids = {}
+        for url in dict.fromkeys(urls):
+            try:
+                document_ids[url] = self.extract_document_id(url)
+            except ValueError as e:
+                self.logger.error(f"Skipping document: {e}")
+        
+        def on_response(url: str, document_id: str):
+            def callback(request_id, document, exception):
+                if exception is not None:
+                    self.logger.error(f"Failed to fetch document content for ID {document_id}: {exception}")
+                    return
+                content = self._extract_text_from_document(document)
+                self._cache_document_info(document_id, self._build_document_info(document_id, document, content))
+                results[url] = content
+            return callback
+        
+        pending = list(document_ids.items())
+        loop = asyncio.get_running_loop()
+        for start in range(0, len(pending), self.BATCH_SIZE):
+            batch = self.service.new_batch_http_request()
+            for url, document_id in pending[start:start + self.BATCH_SIZE]:
+                batch.add(
+                    self.service.documents().get(documentId=document_id, fields=self.DOCUMENT_FIELDS),
+                    callback=on_response(url, document_id)
+                )
+            try:
+                await loop.run_in_executor(None, self._execute_batch, batch)
+            except Exception as e:
+                self.logger.error(f"Failed to fetch document batch: {e}")
+                raise RuntimeError(f"Failed to fetch Google Doc content: {e}")
+        
+        self.logger.info(f"Fetched {len(results)}/{len(document_ids)} documents")
+        return results
+    
     def _extract_text_from_document(self, document: Dict[str, Any]) -> str:
         """
         Extract plain text from Google Docs API response.
         
+        Paragraphs and tables are separated by blank lines, and table rows are written
+        as their cells joined with " | ". The text is collected in a single list of
+        pieces and joined once at the end.
+        
         Args:
             document: Document data from Google Docs API
             
         Returns:
             Plain text content
         """
-        content_parts = []
+        out: List[str] = []
         
         try:
             body = document.get('body', {})
             content = body.get('content', [])
             
             for element in content:
-                if 'paragraph' in element:
-                    paragraph = element['paragraph']
-                    paragraph_text = self._extract_paragraph_text(paragraph)
-                    if paragraph_text.strip():
-                        content_parts.append(paragraph_text)
+                start = len(out)
+                if out:
+                    out.append('\n\n')
                 
+                if 'paragraph' in element:
+                    has_text = self._append_paragraph_text(element['paragraph'], out)
                 elif 'table' in element:
-                    table = element['table']
-                    table_text = self._extract_table_text(table)
-                    if table_text.strip():
-                        content_parts.append(table_text)
+                    has_text = self._append_table_text(element['table'], out)
+                else:
+                    has_text = False
+                
+                # Blank paragraphs and tables are dropped along with their separator
+                if not has_text:
+                    del out[start:]
         
         except Exception as e:
             self.logger.error(f"Error extracting text from document: {e}")
             return "Error: Could not extract document content"
         
-        return '\n\n'.join(content_parts)
+        return ''.join(out)
     
-    def _extract_paragraph_text(self, paragraph: Dict[str, Any]) -> str:
-        """Extract text from a paragraph element."""
-        text_parts = []
+    def _append_paragraph_text(self, paragraph: Dict[str, Any], out: List[str]) -> bool:
+        """Append a paragraph's text runs to `out`; returns whether any of them is non-blank."""
+        has_text = False
         
         elements = paragraph.get('elements', [])
         for element in elements:
-            text_run = element.get('textRun', {})
-            text_content = text_run.get('content', '')
-            text_parts.append(text_content)
+            text_content = element.get('textRun', {}).get('content', '')
+            out.append(text_content)
+            if not has_text and text_content and not text_content.isspace():
+                has_text = True
         
+        return has_text
+    
+    def _extract_paragraph_text(self, paragraph: Dict[str, Any]) -> str:
+        """Extract text from a paragraph element."""
+        text_parts: List[str] = []
+        self._append_paragraph_text(paragraph, text_parts)
         return ''.join(text_parts)
     
-    def _extract_table_text(self, table: Dict[str, Any]) -> str:
-        """Extract text from a table element."""
-        table_parts = []
+    def _append_table_text(self, table: Dict[str, Any], out: List[str]) -> bool:
+        """Append a table's non-blank rows to `out`, one per line; returns whether any were appended."""
+        has_rows = False
         
         table_rows = table.get('tableRows', [])
         for row in table_rows:
+            # Cells are stripped as a whole, so each one is built before being added
             row_parts = []
             table_cells = row.get('tableCells', [])
             
             for cell in table_cells:
-                cell_content = cell.get('content', [])
-                cell_text = []
-                
-                for element in cell_content:
-                    if 'paragraph' in element:
-                        paragraph_text = self._extract_paragraph_text(element['paragraph'])
-                        cell_text.append(paragraph_text)
-                
+                cell_text = [
+                    self._extract_paragraph_text(element['paragraph'])
+                    for element in cell.get('content', [])
+                    if 'paragraph' in element
+                ]
                 row_parts.append(' '.join(cell_text).strip())
             
-            if any(part.strip() for part in row_parts):
-                table_parts.append(' | '.join(row_parts))
+            if any(row_parts):
+                if has_rows:
+                    out.append('\n')
+                for i, part in enumerate(row_parts):
+                    if i:
+                        out.append(' | ')
+                    out.append(part)
+                has_rows = True
         
-        return '\n'.join(table_parts)
+        return has_rows
     
     def get_document_info(self, url: str) -> Dict[str, Any]:
         """
@@ -261,22 +409,50 @@ class GoogleDocsClient:
         """
         try:
             document_id = self.extract_document_id(url)
-            document = self.service.documents().get(documentId=document_id).execute()
             
-            return {
-                'document_id': document_id,
-                'title': document.get('title', 'Untitled'),
-                'revision_id': document.get('revisionId', ''),
-                'created_time': document.get('createdTime', ''),
-                'modified_time': document.get('modifiedTime', ''),
-                'authors': [author.get('displayName', 'Unknown') for author in document.get('authors', [])],
-                'word_count': self._estimate_word_count(document),
-            }
+            # Metadata fetched within the last DOCUMENT_INFO_TTL seconds is reused without a request
+            with self._info_cache_lock:
+                cached = self._info_cache.get(document_id)
+            if cached is not None and time.monotonic() - cached[0] < self.DOCUMENT_INFO_TTL:
+                return dict(cached[1])
+            
+            document = self._execute(
+                self.service.documents().get(documentId=document_id, fields=self.DOCUMENT_FIELDS)
+            )
+            
+            info = self._build_document_info(document_id, document)
+            self._cache_document_info(document_id, info)
+            return dict(info)
             
         except Exception as e:
             self.logger.error(f"Failed to get document info: {e}")
             return {'error': str(e)}
     
+    def _cache_document_info(self, document_id: str, info: Dict[str, Any]):
+        """Remember a document's metadata for get_document_info(), evicting the oldest entries."""
+        with self._info_cache_lock:
+            self._info_cache.pop(document_id, None)
+            self._info_cache[document_id] = (time.monotonic(), info)
+            while len(self._info_cache) > self.DOCUMENT_INFO_CACHE_SIZE:
+                self._info_cache.popitem(last=False)
+    
+    def _build_document_info(
+        self,
+        document_id: str,
+        document: Dict[str, Any],
+        content: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the metadata dictionary for a fetched document, reusing its extracted text if given."""
+        return {
+            'document_id': document_id,
+            'title': document.get('title', 'Untitled'),
+            'revision_id': document.get('revisionId', ''),
+            'created_time': document.get('createdTime', ''),
+            'modified_time': document.get('modifiedTime', ''),
+            'authors': [author.get('displayName', 'Unknown') for author in document.get('authors', [])],
+            'word_count': len(content.split()) if content is not None else self._estimate_word_count(document),
+        }
+    
     def _estimate_word_count(self, document: Dict[str, Any]) -> int:
         """Estimate word count from document structure."""
         try:
@@ -0,0 +1,168 @@
+"""
+Response cache for LLM calls.
+Keys are SHA256 hashes of the full request so repeated reviews skip redundant API calls.
+"""
+
+import os
+import json
+import time
+import asyncio
+import hashlib
+import logging
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class CacheBackend(ABC):
+    """Storage backend for cached LLM responses."""
+    
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached value for `key`, or None if missing or expired."""
+        pass
+    
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: Optional[float] = None):
+        """Store `value` under `key`, expiring after `ttl` seconds if given."""
+        pass
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Process-local LRU cache backend."""
+    
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[Optional[float], str]]" = OrderedDict()
+    
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if expires_at is not None and expires_at < time.time():
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    async def set(self, key: str, value: str, ttl: Optional[float] = None):
+        expires_at = time.time() + ttl if ttl else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+class FileCacheBackend(CacheBackend):
+    """On-disk cache backend storing one JSON file per key, shared across runs."""
+    
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+    
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+    
+    def _read(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at < time.time():
+            path.unlink(missing_ok=True)
+            return None
+        
+        return entry.get("value")
+    
+    def _write(self, key: str, value: str, ttl: Optional[float]):
+        entry = {"expires_at": time.time() + ttl if ttl else None, "value": value}
+        tmp_path = self._path(key).with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, self._path(key))
+    
+    async def get(self, key: str) -> Optional[str]:
+        return await asyncio.get_running_loop().run_in_executor(None, self._read, key)
+    
+    async def set(self, key: str, value: str, ttl: Optional[float] = None):
+        await asyncio.get_running_loop().run_in_executor(None, self._write, key, value, ttl)
+
+
+class LLMCache:
+    """SHA256-keyed cache for low-temperature LLM responses."""
+    
+    # Cache entries for a week by default
+    DEFAULT_TTL = 7 * 24 * 60 * 60
+    
+    # Higher temperatures are too non-deterministic to be worth replaying
+    MAX_CACHEABLE_TEMPERATURE = 0.3
+    
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl: Optional[float] = DEFAULT_TTL):
+        self.backend = backend or InMemoryCacheBackend()
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.logger = logging.getLogger(__name__)
+    
+    @classmethod
+    def from_env(cls) -> Optional["LLMCache"]:
+        """Create a cache from LLM_CACHE ('memory', 'file' or 'off') and LLM_CACHE_DIR."""
+        mode = os.getenv("LLM_CACHE", "memory").lower()
+        
+        if mode in ("off", "none", "false", "0"):
+            return None
+        if mode == "file":
+            return cls(FileCacheBackend(os.getenv("LLM_CACHE_DIR", ".llm_cache")))
+        if mode == "memory":
+            return cls(InMemoryCacheBackend())
+        
+        raise ValueError(f"Unsupported LLM_CACHE mode: {mode}")
+    
+    def is_cacheable(self, temperature: float) -> bool:
+        """Check whether a request at this temperature may be served from cache."""
+        return temperature <= self.MAX_CACHEABLE_TEMPERATURE
+    
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> str:
+        """Build a cache key from every field that affects the response."""
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(request, option=orjson.OPT_SORT_KEYS)
+        else:
+            payload = json.dumps(request, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        return hashlib.sha256(payload).hexdigest()
+    
+    async def get(self, key: str) -> Optional[str]:
+        """Get a cached response, treating backend failures as misses."""
+        try:
+            value = await self.backend.get(key)
+        except Exception as e:
+            self.logger.warning(f"LLM cache read failed: {e}")
+            value = None
+        
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+    
+    async def set(self, key: str, value: str):
+        """Store a response, ignoring backend failures."""
+        try:
+            await self.backend.set(key, value, self.ttl)
+        except Exception as e:
+            self.logger.warning(f"LLM cache write failed: {e}")
@@ -4,32 +4,112 @@ Supports OpenAI, Anthropic, and local models via Ollama.
 """
 
 import os
+import re
 import json
 import logging
 import asyncio
-from typing import Optional, Dict, Any, List
+import hashlib
+import random
+import time
+from datetime import date
+from typing import Optional, Dict, Any, List, Tuple, AsyncIterator, Union
 from enum import Enum
 
+from .rate_limiter import RateLimiter
+from .llm_cache import LLMCache
+
 try:
     import openai
-    from openai import OpenAI
+    from openai import AsyncOpenAI
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
 
 try:
     import anthropic
-    from anthropic import Anthropic
+    from anthropic import AsyncAnthropic
     ANTHROPIC_AVAILABLE = True
 except ImportError:
     ANTHROPIC_AVAILABLE = False
 
+try:
+    # Bundled with the openai/anthropic SDKs
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    # Lets the shared httpx client multiplex concurrent requests over HTTP/2
+    import h2
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
 try:
     import aiohttp
     AIOHTTP_AVAILABLE = True
 except ImportError:
     AIOHTTP_AVAILABLE = False
 
+try:
+    from jiter import from_json
+    JITER_AVAILABLE = True
+except ImportError:
+    JITER_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Markdown code fence around a JSON response; the closing fence may be cut off
+JSON_FENCE_PATTERN = re.compile(r'^\s*```(?:json)?\s*(.*?)\s*(?:```)?\s*$', re.DOTALL)
+
+
+def dumps_json(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes, using orjson when available.
+    
+    Dates and datetimes are written in ISO 8601 format (natively by orjson).
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(data, ensure_ascii=False, indent=2 if indent else None, default=_isoformat).encode("utf-8")
+
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    """Parse JSON text or UTF-8 bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _isoformat(value: Any) -> str:
+    """json.dumps fallback for the date and datetime values orjson serializes natively."""
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Get the running event loop, or None when called outside of one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class LLMHTTPError(RuntimeError):
+    """HTTP error returned by a local LLM service."""
+    
+    def __init__(self, message: str, status_code: int, retry_after: Optional[str] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
 
 class LLMProvider(Enum):
     OPENAI = "openai"
@@ -40,37 +120,111 @@ class LLMProvider(Enum):
 
 class LLMClient:
     """Unified client for interacting with different LLM providers."""
+    __slots__ = (
+        "provider", "model", "base_url", "max_concurrency", "_client_key", "logger", "_http_session",
+        "_http_session_loop", "rate_limiter", "cache", "stream_json", "_prewarmed", "max_attempts", "_provider_info",
+        "_supports_json_mode"
+    )
+    
+    # (environment variable, fallback) for each provider's default model and base URL
+    DEFAULT_MODELS = {
+        LLMProvider.OPENAI: ("OPENAI_MODEL", "gpt-4-turbo-preview"),
+        LLMProvider.ANTHROPIC: ("ANTHROPIC_MODEL", "claude-3-sonnet-20240229"),
+        LLMProvider.OLLAMA: ("OLLAMA_MODEL", "llama3.1:8b"),
+        LLMProvider.LOCAL: ("LOCAL_MODEL", "llama3.1:8b")
+    }
+    DEFAULT_BASE_URLS = {
+        LLMProvider.OLLAMA: ("OLLAMA_BASE_URL", "http://localhost:11434"),
+        LLMProvider.LOCAL: ("LOCAL_BASE_URL", "http://localhost:8000")
+    }
+    
+    # Default cap on in-flight requests per client
+    DEFAULT_MAX_CONCURRENCY = 8
+    
+    # Retry policy for rate-limited / server error responses (override retries with LLM_MAX_RETRIES)
+    MAX_ATTEMPTS = 5
+    RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+    BASE_RETRY_DELAY = 1.0
+    MAX_RETRY_DELAY = 30.0
+    
+    # Connection pool settings for the shared SDK HTTP client
+    HTTP_MAX_CONNECTIONS = 64
+    HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
+    HTTP_TIMEOUT = 300.0
+    HTTP_CONNECT_TIMEOUT = 10.0
+    HTTP_KEEPALIVE_TIMEOUT = 60.0
+    
+    # System messages at least this long (~1024 tokens, the providers' minimum cacheable
+    # prefix) are marked for prompt caching on their own
+    PROMPT_CACHE_MIN_CHARS = 4096
+    
+    # Number of streamed chunks between checks for a completed JSON object
+    STREAM_CHECK_INTERVAL = 8
     
-    def __init__(self, provider: str = "openai", model: Optional[str] = None, base_url: Optional[str] = None):
+    # Request headers for the pre-serialized JSON bodies sent to local services
+    JSON_HEADERS = {"Content-Type": "application/json"}
+    
+    # SDK clients shared by all instances, keyed by (provider, api_key), with the event loop
+    # each client's connection pool belongs to
+    _shared_clients: Dict[Tuple[str, str], Tuple[Optional[asyncio.AbstractEventLoop], Any]] = {}
+    
+    # Concurrency limits shared by all instances calling the same endpoint and model with the
+    # same limit, keyed by (provider, base_url, model, max_concurrency), with the event loop
+    # each semaphore belongs to
+    _shared_semaphores: Dict[Tuple[str, str, str, int], Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+    
+    def __init__(
+        self,
+        provider: str = "openai",
+        model: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[LLMCache] = None
+    ):
         self.provider = LLMProvider(provider.lower())
         self.model = model or self._get_default_model()
+        self._supports_json_mode = "gpt-4" in self.model.lower()
         self.base_url = base_url or self._get_default_base_url()
-        self.client = None
+        self.max_concurrency = max_concurrency or int(
+            os.getenv("LLM_MAX_CONCURRENCY", self.DEFAULT_MAX_CONCURRENCY)
+        )
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        # (provider, api_key) of the shared SDK client; None for local services
+        self._client_key: Optional[Tuple[str, str]] = None
         self.logger = logging.getLogger(__name__)
+        # Created lazily so it binds to the running event loop
+        self._http_session: Optional["aiohttp.ClientSession"] = None
+        self._http_session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.rate_limiter = rate_limiter or RateLimiter.from_env(self.provider.value)
+        self.cache = cache or LLMCache.from_env()
+        self.stream_json = os.getenv("LLM_STREAM_JSON", "true").lower() in ("1", "true", "yes")
+        self._prewarmed = False
+        self.max_attempts = int(os.getenv("LLM_MAX_RETRIES", self.MAX_ATTEMPTS - 1)) + 1
         
         self._initialize_client()
+        
+        # Provider details are fixed for the client's lifetime
+        self._provider_info: Dict[str, Any] = {
+            "provider": self.provider.value,
+            "model": self.model,
+            "available": True
+        }
+        if self.provider in (LLMProvider.OLLAMA, LLMProvider.LOCAL):
+            self._provider_info["base_url"] = self.base_url
     
     def _get_default_model(self) -> str:
         """Get default model for the provider."""
-        if self.provider == LLMProvider.OPENAI:
-            return os.getenv("OPENAI_MODEL", "gpt-4-turbo-preview")
-        elif self.provider == LLMProvider.ANTHROPIC:
-            return os.getenv("ANTHROPIC_MODEL", "claude-3-sonnet-20240229")
-        elif self.provider == LLMProvider.OLLAMA:
-            return os.getenv("OLLAMA_MODEL", "llama3.1:8b")
-        elif self.provider == LLMProvider.LOCAL:
-            return os.getenv("LOCAL_MODEL", "llama3.1:8b")
-        else:
-            raise ValueError(f"Unsupported provider: {self.provider}")
+        env_var, default = self.DEFAULT_MODELS[self.provider]
+        return os.getenv(env_var, default)
     
     def _get_default_base_url(self) -> str:
         """Get default base URL for the provider."""
-        if self.provider == LLMProvider.OLLAMA:
-            return os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
-        elif self.provider == LLMProvider.LOCAL:
-            return os.getenv("LOCAL_BASE_URL", "http://localhost:8000")
-        else:
+        if self.provider not in self.DEFAULT_BASE_URLS:
             return ""
+        env_var, default = self.DEFAULT_BASE_URLS[self.provider]
+        return os.getenv(env_var, default)
     
     def _initialize_client(self):
         """Initialize the appropriate client based on provider."""
@@ -82,7 +236,7 @@ class LLMClient:
             if not api_key:
                 raise ValueError("OPENAI_API_KEY environment variable is required")
             
-            self.client = OpenAI(api_key=api_key)
+            self._client_key = (self.provider.value, api_key)
             
         elif self.provider == LLMProvider.ANTHROPIC:
             if not ANTHROPIC_AVAILABLE:
@@ -92,51 +246,264 @@ class LLMClient:
             if not api_key:
                 raise ValueError("ANTHROPIC_API_KEY environment variable is required")
             
-            self.client = Anthropic(api_key=api_key)
+            self._client_key = (self.provider.value, api_key)
         
         elif self.provider in [LLMProvider.OLLAMA, LLMProvider.LOCAL]:
             if not AIOHTTP_AVAILABLE:
                 raise ImportError("aiohttp library not installed. Run: pip install aiohttp")
             
             # For local models, we don't need to initialize a client here
-            # We'll use aiohttp directly in the API calls
-            self.client = None
+            # We'll use a pooled aiohttp session directly in the API calls
+            self._client_key = None
         
         else:
             raise ValueError(f"Unsupported provider: {self.provider}")
     
+    @property
+    def client(self) -> Any:
+        """The OpenAI/Anthropic SDK client, or None for local services."""
+        if self._client_key is None:
+            return None
+        return self._get_shared_client(self._client_key)
+    
+    def _get_shared_client(self, key: Tuple[str, str]):
+        """
+        Get the process-wide SDK client for a provider and API key on the running event loop.
+        
+        A connection pool cannot outlive its event loop, so a client created under another
+        loop (such as an earlier asyncio.run()) is replaced rather than reused.
+        """
+        loop = _running_loop()
+        entry = self._shared_clients.get(key)
+        
+        if entry is None or entry[0] is not loop:
+            api_key = key[1]
+            # One pooled HTTP client per SDK client keeps TLS connections alive between calls.
+            # SDK retries are off: generate_response retries through the rate limiter instead.
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=self.HTTP_MAX_KEEPALIVE_CONNECTIONS
+                ),
+                timeout=httpx.Timeout(self.HTTP_TIMEOUT, connect=self.HTTP_CONNECT_TIMEOUT),
+                http2=H2_AVAILABLE
+            )
+            
+            if self.provider == LLMProvider.OPENAI:
+                client = AsyncOpenAI(api_key=api_key, http_client=http_client, max_retries=0)
+            else:
+                client = AsyncAnthropic(api_key=api_key, http_client=http_client, max_retries=0)
+            
+            entry = (loop, client)
+            self._shared_clients[key] = entry
+        
+        return entry[1]
+    
+    def _get_http_session(self) -> "aiohttp.ClientSession":
+        """Get the pooled aiohttp session for local services, creating it on first use on each event loop."""
+        loop = _running_loop()
+        if self._http_session is None or self._http_session.closed or self._http_session_loop is not loop:
+            self._http_session_loop = loop
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.HTTP_MAX_CONNECTIONS,
+                    limit_per_host=self.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_timeout=self.HTTP_KEEPALIVE_TIMEOUT
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.HTTP_TIMEOUT, connect=self.HTTP_CONNECT_TIMEOUT)
+            )
+        return self._http_session
+    
+    async def prewarm(self):
+        """
+        Open a connection to the provider ahead of the first request.
+        
+        Issues a free model-list request so the TCP and TLS handshakes are done by the time
+        real requests are sent. Runs once per client; failures are ignored, since the first
+        real request will simply connect itself.
+        """
+        if self._prewarmed:
+            return
+        self._prewarmed = True
+        
+        try:
+            if self.provider in (LLMProvider.OPENAI, LLMProvider.ANTHROPIC):
+                await self.client.models.list()
+            else:
+                async with self._get_http_session().get(self.base_url) as response:
+                    await response.read()
+        except Exception as e:
+            self.logger.debug(f"LLM connection pre-warm failed: {e}")
+    
+    async def close(self):
+        """
+        Close this instance's HTTP session for local services.
+        
+        The instance may be shared by several holders through LLMClientFactory, so it stays
+        usable: the session is reopened on the next local request. The shared SDK clients stay
+        open for every instance using the same API key; close_shared_clients() closes them
+        at shutdown.
+        """
+        if self._http_session is not None:
+            # A session from an earlier event loop cannot be closed on this one
+            if self._http_session_loop is _running_loop():
+                await self._http_session.close()
+            self._http_session = None
+            self._http_session_loop = None
+    
+    @classmethod
+    async def close_shared_clients(cls):
+        """Close the shared SDK clients created on the running event loop, e.g. at shutdown."""
+        loop = _running_loop()
+        
+        for key, (client_loop, client) in list(cls._shared_clients.items()):
+            if client_loop is loop:
+                del cls._shared_clients[key]
+                await client.close()
+    
+    async def __aenter__(self) -> "LLMClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
     async def generate_response(
         self,
         prompt: str,
         system_message: Optional[str] = None,
         max_tokens: int = 4000,
         temperature: float = 0.3,
-        response_format: Optional[str] = None
+        response_format: Optional[str] = None,
+        shared_prefix: Optional[str] = None
     ) -> str:
-        """Generate response from LLM."""
+        """
+        Generate response from LLM.
+        
+        `shared_prefix` is content common to many requests (such as the document under
+        review). It is sent right after the system message and ahead of the prompt so OpenAI
+        and Anthropic prompt caching can reuse it across requests.
+        """
+        cache_key = None
+        if self.cache and self.cache.is_cacheable(temperature):
+            cache_key = LLMCache.make_key({
+                "provider": self.provider.value,
+                "model": self.model,
+                "system_message": system_message,
+                "prompt": prompt,
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+                "response_format": response_format,
+                "shared_prefix": shared_prefix
+            })
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                self.logger.debug("LLM cache hit")
+                return cached
+        
         try:
-            if self.provider == LLMProvider.OPENAI:
-                return await self._call_openai(
-                    prompt, system_message, max_tokens, temperature, response_format
-                )
-            elif self.provider == LLMProvider.ANTHROPIC:
-                return await self._call_anthropic(
-                    prompt, system_message, max_tokens, temperature
-                )
-            elif self.provider == LLMProvider.OLLAMA:
-                return await self._call_ollama(
-                    prompt, system_message, max_tokens, temperature
-                )
-            elif self.provider == LLMProvider.LOCAL:
-                return await self._call_local(
-                    prompt, system_message, max_tokens, temperature
-                )
-            else:
-                raise ValueError(f"Unsupported provider: {self.provider}")
+            for attempt in range(1, self.max_attempts + 1):
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire(
+                        RateLimiter.estimate_tokens((shared_prefix or "") + (system_message or "") + prompt, max_tokens)
+                    )
+                
+                try:
+                    # Cap concurrent requests to stay clear of provider rate limits
+                    async with self._get_semaphore():
+                        response = await self._dispatch(
+                            prompt, system_message, max_tokens, temperature, response_format, shared_prefix
+                        )
+                    break
+                except Exception as e:
+                    if attempt == self.max_attempts or not self._is_retryable(e):
+                        raise
+                    
+                    delay = self._retry_delay(e, attempt)
+                    self.logger.warning(
+                        f"LLM API call failed (attempt {attempt}/{self.max_attempts}), retrying in {delay:.1f}s: {e}"
+                    )
+                    await asyncio.sleep(delay)
                 
         except Exception as e:
             self.logger.error(f"LLM API call failed: {e}")
             raise RuntimeError(f"LLM generation failed: {e}")
+        
+        if cache_key and response:
+            await self.cache.set(cache_key, response)
+        
+        return response
+    
+    async def _dispatch(
+        self,
+        prompt: str,
+        system_message: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        response_format: Optional[str],
+        shared_prefix: Optional[str] = None
+    ) -> str:
+        """Route a single request to the provider-specific call."""
+        if self.provider == LLMProvider.OPENAI:
+            return await self._call_openai(
+                prompt, system_message, max_tokens, temperature, response_format, shared_prefix
+            )
+        elif self.provider == LLMProvider.ANTHROPIC:
+            return await self._call_anthropic(
+                prompt, system_message, max_tokens, temperature, shared_prefix
+            )
+        
+        # Local services have no prompt caching to benefit from
+        if shared_prefix:
+            prompt = f"{shared_prefix}\n\n{prompt}"
+        
+        if self.provider == LLMProvider.OLLAMA:
+            return await self._call_ollama(
+                prompt, system_message, max_tokens, temperature
+            )
+        elif self.provider == LLMProvider.LOCAL:
+            return await self._call_local(
+                prompt, system_message, max_tokens, temperature
+            )
+        else:
+            raise ValueError(f"Unsupported provider: {self.provider}")
+    
+    def _is_retryable(self, error: Exception) -> bool:
+        """Check whether an error is a rate-limit or temporary-unavailability response."""
+        # OpenAI/Anthropic SDK errors and LLMHTTPError all expose status_code
+        return getattr(error, "status_code", None) in self.RETRYABLE_STATUS_CODES
+    
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """
+        Get the seconds to wait before retrying a failed call.
+        
+        Honors the server's Retry-After header when it gives a number of seconds, otherwise
+        backs off exponentially with full jitter so concurrent callers do not retry in lockstep.
+        """
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else getattr(error, "retry_after", None)
+        
+        try:
+            return min(self.MAX_RETRY_DELAY, max(0.0, float(retry_after)))
+        except (TypeError, ValueError):
+            return random.uniform(0, min(self.MAX_RETRY_DELAY, self.BASE_RETRY_DELAY * 2 ** (attempt - 1)))
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """
+        Get the semaphore limiting concurrent LLM calls.
+        
+        Instances for the same provider endpoint and model with the same max_concurrency share
+        one semaphore, so several such clients together stay within that limit. A client given
+        a different limit gets its own semaphore, sized as requested.
+        """
+        key = (self.provider.value, self.base_url, self.model, self.max_concurrency)
+        loop = _running_loop()
+        entry = self._shared_semaphores.get(key)
+        
+        if entry is None or entry[0] is not loop:
+            entry = (loop, asyncio.Semaphore(self.max_concurrency))
+            self._shared_semaphores[key] = entry
+        
+        return entry[1]
     
     async def _call_openai(
         self,
@@ -144,14 +511,40 @@ class LLMClient:
         system_message: Optional[str],
         max_tokens: int,
         temperature: float,
-        response_format: Optional[str]
+        response_format: Optional[str],
+        shared_prefix: Optional[str] = None
     ) -> str:
         """Call OpenAI API."""
+        kwargs = self._build_openai_kwargs(
+            prompt, system_message, max_tokens, temperature, response_format, shared_prefix
+        )
+        
+        if response_format == "json" and self.stream_json:
+            return await self._stream_openai_json(kwargs)
+        
+        response = await self.client.chat.completions.create(**kwargs)
+        return response.choices[0].message.content
+    
+    def _build_openai_kwargs(
+        self,
+        prompt: str,
+        system_message: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        response_format: Optional[str],
+        shared_prefix: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the chat completion request body for OpenAI."""
         messages = []
         
+        # The system message always leads, so instructions precede untrusted document text
         if system_message:
             messages.append({"role": "system", "content": system_message})
         
+        # Shared content comes next: OpenAI caches prompts by their leading tokens
+        if shared_prefix:
+            messages.append({"role": "user", "content": shared_prefix})
+        
         messages.append({"role": "user", "content": prompt})
         
         kwargs = {
@@ -162,32 +555,187 @@ class LLMClient:
         }
         
         # Add response format if specified and supported
-        if response_format == "json" and "gpt-4" in self.model.lower():
+        if response_format == "json" and self._supports_json_mode:
             kwargs["response_format"] = {"type": "json_object"}
         
-        response = self.client.chat.completions.create(**kwargs)
-        return response.choices[0].message.content
+        # Routes requests with the same prefix to the same prompt cache
+        if shared_prefix:
+            kwargs["extra_body"] = {"prompt_cache_key": self._prefix_cache_key(shared_prefix)}
+        elif system_message and len(system_message) >= self.PROMPT_CACHE_MIN_CHARS:
+            kwargs["extra_body"] = {"prompt_cache_key": self._prefix_cache_key(system_message)}
+        
+        return kwargs
+    
+    @staticmethod
+    def _prefix_cache_key(shared_prefix: str) -> str:
+        """Stable identifier for a shared prompt prefix."""
+        return hashlib.sha256(shared_prefix.encode("utf-8")).hexdigest()[:32]
+    
+    async def _stream_openai_json(self, kwargs: Dict[str, Any]) -> str:
+        """Stream an OpenAI completion, returning as soon as the top-level JSON object is closed."""
+        parts = []
+        stream = await self.client.chat.completions.create(stream=True, **kwargs)
+        
+        try:
+            chunk_count = 0
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                
+                parts.append(delta)
+                chunk_count += 1
+                if chunk_count % self.STREAM_CHECK_INTERVAL == 0 and self._is_complete_json("".join(parts)):
+                    break
+        finally:
+            await stream.close()
+        
+        return "".join(parts)
+    
+    @staticmethod
+    def _is_complete_json(text: str) -> bool:
+        """Check whether text holds a complete JSON object."""
+        text = text.strip()
+        if not text.endswith("}"):
+            return False
+        
+        try:
+            if JITER_AVAILABLE:
+                from_json(text.encode('utf-8'))
+            else:
+                loads_json(text)
+            return True
+        except ValueError:
+            return False
+    
+    def build_batch_request(
+        self,
+        custom_id: str,
+        prompt: str,
+        system_message: Optional[str] = None,
+        max_tokens: int = 4000,
+        temperature: float = 0.3,
+        response_format: Optional[str] = None,
+        shared_prefix: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build one line of an OpenAI Batch API input file."""
+        body = self._build_openai_kwargs(
+            prompt, system_message, max_tokens, temperature, response_format, shared_prefix
+        )
+        # SDK-only extra_body fields belong directly in the request body
+        body.update(body.pop("extra_body", {}))
+        
+        return {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": BatchHandle.ENDPOINT,
+            "body": body
+        }
+    
+    async def submit_batch(self, requests: List[Dict[str, Any]]) -> "BatchHandle":
+        """
+        Submit requests to the OpenAI Batch API for asynchronous processing.
+        
+        Batches complete within 24 hours at a lower price than synchronous calls,
+        which suits offline review pipelines.
+        
+        Args:
+            requests: Requests built with build_batch_request(), each with a unique custom_id
+            
+        Returns:
+            BatchHandle: Handle to wait on for the batch results
+        """
+        if self.provider != LLMProvider.OPENAI:
+            raise ValueError(f"Batch processing is not supported for provider: {self.provider.value}")
+        if not requests:
+            raise ValueError("Cannot submit an empty batch")
+        
+        payload = b"\n".join(dumps_json(request) for request in requests)
+        input_file = await self.client.files.create(file=("batch_input.jsonl", payload), purpose="batch")
+        batch = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BatchHandle.ENDPOINT,
+            completion_window=BatchHandle.COMPLETION_WINDOW
+        )
+        
+        self.logger.info(f"Submitted batch {batch.id} with {len(requests)} requests")
+        return BatchHandle(self, batch.id)
+    
+    async def generate_batch(
+        self,
+        items: List[Dict[str, Any]],
+        use_batch_api: bool = False,
+        poll_interval: Optional[float] = None
+    ) -> List[Optional[str]]:
+        """
+        Generate responses for many requests.
+        
+        By default the requests run concurrently through generate_response, within the
+        client's concurrency and rate limits. With `use_batch_api` they are submitted as one
+        OpenAI batch instead, at lower cost but with results arriving within 24 hours.
+        
+        Args:
+            items: generate_response() keyword arguments for each request
+            use_batch_api: Submit through the OpenAI Batch API
+            poll_interval: Seconds between batch status checks
+            
+        Returns:
+            Response for each item, in order; None for requests that failed in a batch
+        """
+        if not use_batch_api:
+            return list(await asyncio.gather(*(self.generate_response(**item) for item in items)))
+        
+        handle = await self.submit_batch([
+            self.build_batch_request(custom_id=str(index), **item) for index, item in enumerate(items)
+        ])
+        responses = await handle.wait(poll_interval)
+        return [responses.get(str(index)) for index in range(len(items))]
     
     async def _call_anthropic(
         self,
         prompt: str,
         system_message: Optional[str],
         max_tokens: int,
-        temperature: float
+        temperature: float,
+        shared_prefix: Optional[str] = None
     ) -> str:
         """Call Anthropic API."""
-        system = system_message or "You are a helpful AI assistant."
-        
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=max_tokens,
-            temperature=temperature,
-            system=system,
-            messages=[{"role": "user", "content": prompt}]
+        response = await self.client.messages.create(
+            **self._build_anthropic_kwargs(prompt, system_message, max_tokens, temperature, shared_prefix)
         )
         
         return response.content[0].text
     
+    def _build_anthropic_kwargs(
+        self,
+        prompt: str,
+        system_message: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        shared_prefix: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the messages request body for Anthropic."""
+        system: Any = system_message or "You are a helpful AI assistant."
+        if len(system) >= self.PROMPT_CACHE_MIN_CHARS:
+            # Long instructions are cached separately so they are reused across documents
+            system = [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+        
+        content: Any = prompt
+        if shared_prefix:
+            # Mark the shared content as a cache breakpoint for prompt caching
+            content = [
+                {"type": "text", "text": shared_prefix, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": prompt}
+            ]
+        
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "system": system,
+            "messages": [{"role": "user", "content": content}]
+        }
+    
     async def _call_ollama(
         self,
         prompt: str,
@@ -196,16 +744,9 @@ class LLMClient:
         temperature: float
     ) -> str:
         """Call Ollama API."""
-        messages = []
-        
-        if system_message:
-            messages.append({"role": "system", "content": system_message})
-        
-        messages.append({"role": "user", "content": prompt})
-        
         payload = {
             "model": self.model,
-            "messages": messages,
+            "messages": self._build_local_messages(prompt, system_message),
             "options": {
                 "num_predict": max_tokens,
                 "temperature": temperature
@@ -213,22 +754,24 @@ class LLMClient:
             "stream": False
         }
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(
-                    f"{self.base_url}/api/chat",
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=300)  # 5 minute timeout
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise RuntimeError(f"Ollama API error {response.status}: {error_text}")
-                    
-                    result = await response.json()
-                    return result.get("message", {}).get("content", "")
-                    
-            except aiohttp.ClientError as e:
-                raise RuntimeError(f"Failed to connect to Ollama at {self.base_url}: {e}")
+        session = self._get_http_session()
+        try:
+            async with session.post(
+                f"{self.base_url}/api/chat",
+                data=dumps_json(payload),
+                headers=self.JSON_HEADERS
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise LLMHTTPError(
+                        f"Ollama API error {response.status}: {error_text}", response.status, response.headers.get("Retry-After")
+                    )
+                
+                result = await response.json()
+                return result.get("message", {}).get("content", "")
+                
+        except aiohttp.ClientError as e:
+            raise RuntimeError(f"Failed to connect to Ollama at {self.base_url}: {e}")
     
     async def _call_local(
         self,
@@ -238,79 +781,277 @@ class LLMClient:
         temperature: float
     ) -> str:
         """Call local LLM API (OpenAI-compatible)."""
+        payload = {
+            "model": self.model,
+            "messages": self._build_local_messages(prompt, system_message),
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": False
+        }
+        
+        session = self._get_http_session()
+        try:
+            async with session.post(
+                f"{self.base_url}/v1/chat/completions",
+                data=dumps_json(payload),
+                headers=self.JSON_HEADERS
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise LLMHTTPError(
+                        f"Local LLM API error {response.status}: {error_text}", response.status, response.headers.get("Retry-After")
+                    )
+                
+                result = await response.json()
+                return result.get("choices", [{}])[0].get("message", {}).get("content", "")
+                
+        except aiohttp.ClientError as e:
+            raise RuntimeError(f"Failed to connect to local LLM at {self.base_url}: {e}")
+    
+    @staticmethod
+    def _build_local_messages(prompt: str, system_message: Optional[str]) -> List[Dict[str, str]]:
+        """Build the chat messages sent to Ollama and OpenAI-compatible local services."""
         messages = []
         
         if system_message:
             messages.append({"role": "system", "content": system_message})
         
         messages.append({"role": "user", "content": prompt})
+        return messages
+    
+    async def stream_response(
+        self,
+        prompt: str,
+        system_message: Optional[str] = None,
+        max_tokens: int = 4000,
+        temperature: float = 0.3,
+        shared_prefix: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Generate a response from the LLM, yielding text as it is produced.
         
-        payload = {
-            "model": self.model,
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-            "stream": False
-        }
+        Streamed responses are neither cached nor retried, since part of the text may
+        already have been consumed when a call fails.
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(
-                    f"{self.base_url}/v1/chat/completions",
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=300)  # 5 minute timeout
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise RuntimeError(f"Local LLM API error {response.status}: {error_text}")
+        Usage:
+            async for text in llm_client.stream_response(prompt):
+                print(text, end="")
+        """
+        if self.rate_limiter:
+            await self.rate_limiter.acquire(
+                RateLimiter.estimate_tokens((shared_prefix or "") + (system_message or "") + prompt, max_tokens)
+            )
+        
+        async with self._get_semaphore():
+            if self.provider == LLMProvider.OPENAI:
+                kwargs = self._build_openai_kwargs(
+                    prompt, system_message, max_tokens, temperature, None, shared_prefix
+                )
+                stream = await self.client.chat.completions.create(stream=True, **kwargs)
+                try:
+                    async for chunk in stream:
+                        delta = chunk.choices[0].delta.content if chunk.choices else None
+                        if delta:
+                            yield delta
+                finally:
+                    await stream.close()
+                return
+            
+            if self.provider == LLMProvider.ANTHROPIC:
+                kwargs = self._build_anthropic_kwargs(prompt, system_message, max_tokens, temperature, shared_prefix)
+                async with self.client.messages.stream(**kwargs) as stream:
+                    async for text in stream.text_stream:
+                        yield text
+                return
+            
+            if shared_prefix:
+                prompt = f"{shared_prefix}\n\n{prompt}"
+            
+            async for text in self._stream_local(prompt, system_message, max_tokens, temperature):
+                yield text
+    
+    async def _stream_local(
+        self,
+        prompt: str,
+        system_message: Optional[str],
+        max_tokens: int,
+        temperature: float
+    ) -> AsyncIterator[str]:
+        """Stream a response from Ollama (JSON lines) or a local OpenAI-compatible service (server-sent events)."""
+        messages = self._build_local_messages(prompt, system_message)
+        if self.provider == LLMProvider.OLLAMA:
+            url = f"{self.base_url}/api/chat"
+            payload = {
+                "model": self.model,
+                "messages": messages,
+                "options": {"num_predict": max_tokens, "temperature": temperature},
+                "stream": True
+            }
+        else:
+            url = f"{self.base_url}/v1/chat/completions"
+            payload = {
+                "model": self.model,
+                "messages": messages,
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+                "stream": True
+            }
+        
+        session = self._get_http_session()
+        try:
+            async with session.post(url, data=dumps_json(payload), headers=self.JSON_HEADERS) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise LLMHTTPError(
+                        f"LLM API error {response.status}: {error_text}", response.status, response.headers.get("Retry-After")
+                    )
+                
+                async for line in response.content:
+                    line = line.strip()
+                    if self.provider == LLMProvider.OLLAMA:
+                        if not line:
+                            continue
+                        event = loads_json(line)
+                        text = event.get("message", {}).get("content", "")
+                    else:
+                        if not line.startswith(b"data:"):
+                            continue
+                        data = line[5:].strip()
+                        if data == b"[DONE]":
+                            break
+                        choices = loads_json(data).get("choices") or [{}]
+                        text = choices[0].get("delta", {}).get("content")
                     
-                    result = await response.json()
-                    return result.get("choices", [{}])[0].get("message", {}).get("content", "")
+                    if text:
+                        yield text
                     
-            except aiohttp.ClientError as e:
-                raise RuntimeError(f"Failed to connect to local LLM at {self.base_url}: {e}")
+        except aiohttp.ClientError as e:
+            raise RuntimeError(f"Failed to connect to LLM service at {self.base_url}: {e}")
     
     def parse_json_response(self, response: str) -> Dict[str, Any]:
         """Parse JSON response from LLM."""
         try:
-            # Remove markdown code blocks if present
-            clean_response = response.strip()
-            if clean_response.startswith("```json"):
-                clean_response = clean_response[7:]
-            if clean_response.endswith("```"):
-                clean_response = clean_response[:-3]
-            
-            clean_response = clean_response.strip()
-            return json.loads(clean_response)
+            # Remove markdown code blocks if present; JSON parsers skip surrounding whitespace
+            match = JSON_FENCE_PATTERN.match(response)
+            clean_response = match.group(1) if match else response
+            if JITER_AVAILABLE:
+                # Key caching pays off on the recurring score/reasoning/strengths keys
+                return from_json(clean_response.encode('utf-8'), cache_mode="keys")
+            return loads_json(clean_response)
             
-        except json.JSONDecodeError as e:
+        except ValueError as e:  # json, orjson and jiter decode errors are all ValueErrors
             self.logger.error(f"Failed to parse JSON response: {response}")
             raise ValueError(f"LLM returned invalid JSON format: {e}")
     
-    def get_provider_info(self) -> Dict[str, str]:
-        """Get information about the current provider and model."""
-        info = {
-            "provider": self.provider.value,
-            "model": self.model,
-            "available": True
-        }
+    def get_provider_info(self) -> Dict[str, Any]:
+        """Get information about the current provider and model, with response cache statistics."""
+        info = dict(self._provider_info)
         
-        if self.provider in [LLMProvider.OLLAMA, LLMProvider.LOCAL]:
-            info["base_url"] = self.base_url
+        if self.cache:
+            info["cache_hits"] = self.cache.hits
+            info["cache_misses"] = self.cache.misses
             
         return info
 
 
+class BatchHandle:
+    """Handle to a submitted OpenAI batch."""
+    __slots__ = ("llm_client", "batch_id")
+    
+    ENDPOINT = "/v1/chat/completions"
+    COMPLETION_WINDOW = "24h"
+    DEFAULT_POLL_INTERVAL = 30.0
+    FAILED_STATUSES = ("failed", "expired", "cancelled")
+    
+    def __init__(self, llm_client: LLMClient, batch_id: str):
+        self.llm_client = llm_client
+        self.batch_id = batch_id
+    
+    async def wait(self, poll_interval: Optional[float] = None) -> Dict[str, str]:
+        """
+        Wait for the batch to finish and download its results.
+        
+        Args:
+            poll_interval: Seconds between status checks
+            
+        Returns:
+            Dict mapping each successful request's custom_id to the response text.
+            Requests that failed individually are left out.
+        """
+        poll_interval = poll_interval or self.DEFAULT_POLL_INTERVAL
+        client = self.llm_client.client
+        
+        while True:
+            batch = await client.batches.retrieve(self.batch_id)
+            if batch.status == "completed":
+                break
+            if batch.status in self.FAILED_STATUSES:
+                raise RuntimeError(f"Batch {self.batch_id} ended with status: {batch.status}")
+            await asyncio.sleep(poll_interval)
+        
+        if not batch.output_file_id:
+            return {}
+        
+        output = await client.files.content(batch.output_file_id)
+        return self._parse_output(output.text)
+    
+    def _parse_output(self, text: str) -> Dict[str, str]:
+        """Extract response texts from a batch output file."""
+        results = {}
+        
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            
+            record = loads_json(line)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                self.llm_client.logger.warning(
+                    f"Batch request {record.get('custom_id')} failed: {record.get('error') or response.get('status_code')}"
+                )
+                continue
+            
+            results[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        
+        return results
+
+
 class LLMClientFactory:
     """Factory for creating LLM clients."""
     
-    @staticmethod
-    def create_client(provider: Optional[str] = None, model: Optional[str] = None, base_url: Optional[str] = None) -> LLMClient:
-        """Create LLM client based on environment or parameters."""
+    # Local services found reachable are remembered across CLI runs for SERVICE_CHECK_TTL seconds
+    # (override with LLM_SERVICE_CHECK_TTL, 0 disables), so repeated setup checks skip the probe
+    SERVICE_CHECK_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "launch-doc-reviewer", "services.json")
+    SERVICE_CHECK_TTL = 3600.0
+    
+    # Clients handed out by create_client, keyed by (provider, model, base_url, max_concurrency,
+    # running event loop or None)
+    _clients: Dict[Tuple[Any, ...], LLMClient] = {}
+    
+    @classmethod
+    def create_client(
+        cls,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_concurrency: Optional[int] = None
+    ) -> LLMClient:
+        """
+        Create LLM client based on environment or parameters.
+        
+        Clients are reused for the same parameters and event loop, so callers creating one per
+        request share its cache, rate limiter and connections. Closing a client leaves it
+        usable, so one holder closing it does not break the others.
+        """
         if provider is None:
             provider = os.getenv("LLM_PROVIDER", "openai")
         
-        return LLMClient(provider=provider, model=model, base_url=base_url)
+        key = (provider.lower(), model, base_url, max_concurrency, _running_loop())
+        client = cls._clients.get(key)
+        if client is None:
+            client = LLMClient(provider=provider, model=model, base_url=base_url, max_concurrency=max_concurrency)
+            cls._clients[key] = client
+        return client
     
     @staticmethod
     def get_available_providers() -> List[str]:
@@ -329,32 +1070,77 @@ class LLMClientFactory:
         
         return providers
     
-    @staticmethod
-    def check_local_service_availability(base_url: str, timeout: float = 5.0) -> bool:
-        """Check if a local LLM service is available."""
-        import asyncio
-        
-        async def check_service():
-            try:
-                async with aiohttp.ClientSession() as session:
-                    # Try Ollama endpoint first
-                    try:
-                        async with session.get(
-                            f"{base_url}/api/tags",
-                            timeout=aiohttp.ClientTimeout(total=timeout)
-                        ) as response:
-                            return response.status == 200
-                    except:
-                        # Try OpenAI-compatible endpoint
-                        async with session.get(
-                            f"{base_url}/v1/models",
-                            timeout=aiohttp.ClientTimeout(total=timeout)
-                        ) as response:
-                            return response.status == 200
-            except:
-                return False
+    @classmethod
+    def check_local_service_availability(cls, base_url: str, timeout: float = 5.0) -> bool:
+        """Check if a local LLM service is available, reusing a recent successful check."""
+        return cls.check_local_services([base_url], timeout)[base_url]
+    
+    @classmethod
+    def check_local_services(cls, base_urls: List[str], timeout: float = 5.0) -> Dict[str, bool]:
+        """
+        Check several local LLM services at once, reusing recent successful checks.
+        
+        Services not checked recently are probed concurrently over a single HTTP session.
+        
+        Args:
+            base_urls: Base URLs of the services
+            timeout: Seconds to wait for each probe request
         
+        Returns:
+            Whether each service is available, keyed by base URL
+        """
+        ttl = float(os.getenv("LLM_SERVICE_CHECK_TTL", cls.SERVICE_CHECK_TTL))
+        checked = cls._load_service_checks() if ttl > 0 else {}
+        now = time.time()
+        results = {url: now - checked.get(url, 0.0) < ttl for url in base_urls}
+        to_probe = [url for url, available in results.items() if not available]
+        if not to_probe or not AIOHTTP_AVAILABLE:
+            return results
+        
+        async def check_service(session, base_url):
+            # Try Ollama endpoint first, then the OpenAI-compatible one
+            for path in ("/api/tags", "/v1/models"):
+                try:
+                    async with session.get(f"{base_url}{path}") as response:
+                        if response.status == 200:
+                            return True
+                except Exception:
+                    continue
+            return False
+        
+        async def check_services():
+            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+                return await asyncio.gather(*(check_service(session, url) for url in to_probe))
+        
+        try:
+            probed = asyncio.run(check_services())
+        except Exception:
+            return results
+        
+        # Only reachable services are remembered; a failed check is retried on every run
+        results.update(zip(to_probe, probed))
+        reachable = [url for url, available in zip(to_probe, probed) if available]
+        if reachable and ttl > 0:
+            checked.update((url, now) for url in reachable)
+            cls._save_service_checks(checked)
+        return results
+    
+    @classmethod
+    def _load_service_checks(cls) -> Dict[str, float]:
+        """Load the times local services were last found reachable, keyed by base URL."""
+        try:
+            with open(cls.SERVICE_CHECK_CACHE_PATH, "r", encoding="utf-8") as f:
+                checked = json.load(f)
+            return checked if isinstance(checked, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    @classmethod
+    def _save_service_checks(cls, checked: Dict[str, float]):
+        """Persist service check times; failing to write only means probing again next run."""
         try:
-            return asyncio.run(check_service())
-        except:
-            return False
\ No newline at end of file
+            os.makedirs(os.path.dirname(cls.SERVICE_CHECK_CACHE_PATH), exist_ok=True)
+            with open(cls.SERVICE_CHECK_CACHE_PATH, "w", encoding="utf-8") as f:
+                json.dump(checked, f)
+        except OSError as e:
+            logging.getLogger(__name__).debug(f"Could not save service checks: {e}")
\ No newline at end of file
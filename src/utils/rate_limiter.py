@@ -0,0 +1,95 @@
+"""
+Token-bucket rate limiting for LLM API calls.
+Throttles both requests-per-minute and tokens-per-minute to stay under provider limits.
+"""
+
+import os
+import time
+import asyncio
+from typing import Optional
+
+
+class TokenBucket:
+    """Asynchronous token bucket that refills continuously at a fixed rate."""
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Initialize the token bucket.
+        
+        Args:
+            capacity: Maximum number of tokens the bucket can hold
+            refill_rate: Tokens added per second
+        """
+        if capacity <= 0 or refill_rate <= 0:
+            raise ValueError("Token bucket capacity and refill rate must be positive")
+        
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        # Created lazily so it binds to the running event loop, and again for each new loop
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _refill(self):
+        """Add tokens accrued since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.refill_rate)
+        self._last_refill = now
+    
+    async def acquire(self, amount: float = 1.0):
+        """Wait until `amount` tokens are available, then consume them."""
+        # Oversized requests would otherwise wait forever
+        amount = min(amount, self.capacity)
+        
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        
+        async with self._lock:
+            self._refill()
+            while self._tokens < amount:
+                await asyncio.sleep((amount - self._tokens) / self.refill_rate)
+                self._refill()
+            self._tokens -= amount
+
+
+class RateLimiter:
+    """Combined requests-per-minute and tokens-per-minute limiter."""
+    
+    def __init__(self, requests_per_minute: Optional[int] = None, tokens_per_minute: Optional[int] = None):
+        self.rpm_bucket = TokenBucket(requests_per_minute, requests_per_minute / 60) if requests_per_minute else None
+        self.tpm_bucket = TokenBucket(tokens_per_minute, tokens_per_minute / 60) if tokens_per_minute else None
+    
+    @classmethod
+    def from_env(cls, provider: Optional[str] = None) -> Optional["RateLimiter"]:
+        """
+        Create a rate limiter from environment limits, or None if none are set.
+        
+        Provider-specific limits such as OPENAI_RPM_LIMIT / OPENAI_TPM_LIMIT take precedence
+        over LLM_RPM_LIMIT / LLM_TPM_LIMIT, since each provider account has its own quota.
+        """
+        prefix = provider.upper() if provider else "LLM"
+        rpm = os.getenv(f"{prefix}_RPM_LIMIT") or os.getenv("LLM_RPM_LIMIT")
+        tpm = os.getenv(f"{prefix}_TPM_LIMIT") or os.getenv("LLM_TPM_LIMIT")
+        
+        if not rpm and not tpm:
+            return None
+        
+        return cls(
+            requests_per_minute=int(rpm) if rpm else None,
+            tokens_per_minute=int(tpm) if tpm else None
+        )
+    
+    @staticmethod
+    def estimate_tokens(prompt: str, max_tokens: int) -> int:
+        """Roughly estimate the tokens a request will consume (~4 characters per token)."""
+        return len(prompt) // 4 + max_tokens
+    
+    async def acquire(self, estimated_tokens: int):
+        """Wait until both the request and token budgets allow another call."""
+        if self.rpm_bucket:
+            await self.rpm_bucket.acquire(1)
+        if self.tpm_bucket:
+            await self.tpm_bucket.acquire(estimated_tokens)
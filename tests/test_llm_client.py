@@ -0,0 +1,89 @@
+"""
+Tests for LLM clients shared through LLMClientFactory.
+The OpenAI SDK and httpx are replaced by stand-ins, so no network access is needed.
+"""
+
+import os
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from src.utils import llm_client
+from src.utils.llm_client import LLMClient, LLMClientFactory
+
+
+class FakeAsyncOpenAI:
+    """Minimal AsyncOpenAI returning a fixed completion."""
+    
+    def __init__(self, **kwargs):
+        self.closed = False
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+    
+    async def _create(self, **kwargs):
+        if self.closed:
+            raise RuntimeError("client is closed")
+        message = SimpleNamespace(content="hello back")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+    
+    async def close(self):
+        self.closed = True
+
+
+class SharedClientTests(unittest.TestCase):
+    
+    def setUp(self):
+        fake_httpx = SimpleNamespace(
+            AsyncClient=lambda **kwargs: None,
+            Limits=lambda **kwargs: None,
+            Timeout=lambda *args, **kwargs: None
+        )
+        patches = [
+            mock.patch.dict(os.environ, {"OPENAI_API_KEY": "test-key", "LLM_CACHE": "off"}),
+            mock.patch.object(llm_client, "OPENAI_AVAILABLE", True),
+            mock.patch.object(llm_client, "AsyncOpenAI", FakeAsyncOpenAI, create=True),
+            mock.patch.object(llm_client, "httpx", fake_httpx, create=True),
+            mock.patch.dict(LLMClient._shared_clients, clear=True),
+            mock.patch.dict(LLMClient._shared_semaphores, clear=True),
+            mock.patch.dict(LLMClientFactory._clients, clear=True)
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+    
+    def test_closing_one_holder_keeps_the_shared_client_usable(self):
+        async def run():
+            first = LLMClientFactory.create_client("openai")
+            second = LLMClientFactory.create_client("openai")
+            self.assertIs(first, second)
+            
+            await first.close()
+            return await second.generate_response("hello")
+        
+        self.assertEqual(asyncio.run(run()), "hello back")
+    
+    def test_close_shared_clients_closes_sdk_clients_of_the_running_loop(self):
+        async def run():
+            client = LLMClientFactory.create_client("openai")
+            await client.generate_response("hello")
+            sdk_client = client.client
+            await LLMClient.close_shared_clients()
+            return sdk_client
+        
+        self.assertTrue(asyncio.run(run()).closed)
+        self.assertEqual(LLMClient._shared_clients, {})
+    
+    def test_explicit_max_concurrency_gets_its_own_semaphore(self):
+        async def run():
+            default = LLMClientFactory.create_client("openai", max_concurrency=8)
+            limited = LLMClientFactory.create_client("openai", max_concurrency=2)
+            return default._get_semaphore(), limited._get_semaphore(), default._get_semaphore()
+        
+        default_semaphore, limited_semaphore, default_again = asyncio.run(run())
+        self.assertIs(default_semaphore, default_again)
+        self.assertIsNot(default_semaphore, limited_semaphore)
+        self.assertEqual(limited_semaphore._value, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()